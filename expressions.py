@@ -29,24 +29,31 @@ __copyright__ = '(C) 2021 by Leandro Franca'
 from qgis.core import *
 from qgis.gui import *
 from qgis.utils import qgsfunction
-from lftools.geocapt.cartography import (map_sistem,
+from lftools.geocapt.cartography import (inomArray,
                                          MeridianConvergence,
                                          SRC_Projeto,
                                          ScaleFactor,
                                          geom2PointList,
-                                         reprojectPoints,
-                                         areaGauss,
+                                         ParametrosElipsoide,
+                                         TransformadorQgs,
+                                         TransformadorProj,
                                          inom2mi as INOM2MI)
 from lftools.geocapt.topogeo import (dd2dms as DD2DMS,
                                      dms2dd as DMS2DD,
                                      azimute, str2HTML,
+                                     Modelo,
                                      geod2geoc,
-                                     geoc2enu)
+                                     geoc2enuArray)
 from numpy import array, pi, sqrt, median
 import numpy as np
-from pyproj.crs import CRS
+from functools import lru_cache
 import unicodedata
+import threading
 import re
+
+# Conversões escalares memorizadas: as expressões são avaliadas feição a feição
+DD2DMS = lru_cache(maxsize=65536)(DD2DMS)
+DMS2DD = lru_cache(maxsize=65536)(DMS2DD)
 # https://qgis.org/pyqgis/3.2/core/Expression/QgsExpression.html
 
 LOC = QgsApplication.locale()[:2]
@@ -60,6 +67,65 @@ def tr(*string):
     else:
         return string[0]
 
+# Estatísticas por (id da camada, campo), descartadas quando a camada é editada
+# As expressões são avaliadas em threads de renderização e rótulos: acesso protegido pela trava
+CacheFieldstat = {}
+CamadasMonitoradas = set()
+TravaFieldstat = threading.RLock()
+
+def LimparCacheFieldstat(layer_id):
+    with TravaFieldstat:
+        for chave in [chave for chave in CacheFieldstat if chave[0] == layer_id]:
+            del CacheFieldstat[chave]
+
+def MonitorarCamada(layer):
+    layer_id = layer.id()
+    with TravaFieldstat:
+        if layer_id in CamadasMonitoradas:
+            return
+        CamadasMonitoradas.add(layer_id)
+    limpar = lambda *args: LimparCacheFieldstat(layer_id)
+    def limparCampo(fid, idx, valor):
+        # Edição de um valor: descartar apenas a estatística do campo alterado
+        campos = layer.fields()
+        if 0 <= idx < campos.count():
+            with TravaFieldstat:
+                CacheFieldstat.pop((layer_id, campos[idx].name()), None)
+        else:
+            LimparCacheFieldstat(layer_id)
+    layer.dataChanged.connect(limpar)
+    layer.attributeValueChanged.connect(limparCampo)
+    layer.featureAdded.connect(limpar)
+    layer.featureDeleted.connect(limpar)
+    layer.willBeDeleted.connect(limpar)
+    def esquecer():
+        with TravaFieldstat:
+            CamadasMonitoradas.discard(layer_id)
+    layer.willBeDeleted.connect(esquecer)
+
+def EstatisticasCampo(layer, field_name):
+    chave = (layer.id(), field_name)
+    with TravaFieldstat:
+        if chave not in CacheFieldstat:
+            MonitorarCamada(layer)
+            request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes([field_name], layer.fields())
+            valores = np.array([float(att) for att in (feat[field_name] for feat in layer.getFeatures(request)) if att], dtype=float)
+            if valores.size:
+                CacheFieldstat[chave] = {'sum': float(valores.sum()),
+                                         'min': float(valores.min()),
+                                         'max': float(valores.max()),
+                                         'mean': float(valores.mean()),
+                                         'std': float(valores.std()),
+                                         'median': float(median(valores))}
+            else:
+                # Sem valores: min e max retornam None
+                CacheFieldstat[chave] = {'sum': 0.0,
+                                         'mean': float('nan'),
+                                         'std': float('nan'),
+                                         'median': float('nan')}
+        return CacheFieldstat[chave]
+
+
 @qgsfunction(args='auto', group='LF Tools')
 def fieldstat(layer_name, field_name, type, feature, parent):
     ''' Returns the Aggregate function of a layer's field.
@@ -72,31 +138,12 @@ def fieldstat(layer_name, field_name, type, feature, parent):
           <li>fieldstat('layer_name', 'field_name', 'std') ->Standard Deviation of the values</li>
           <li>fieldstat('layer_name', 'field_name', 'median') ->Median of the values</li>
         </ul>'''
-    lista = []
-
     if len(QgsProject.instance().mapLayersByName(layer_name)) == 1:
         layer = QgsProject.instance().mapLayersByName(layer_name)[0]
     else:
         layer = QgsProject.instance().mapLayer(layer_name)
 
-    for feat in layer.getFeatures():
-        att = feat[field_name]
-        if att:
-            lista += [float(att)]
-    if type == 'sum':
-        return  float((array(lista)).sum())
-    elif type == 'min':
-        return  float((array(lista)).min())
-    elif type == 'max':
-        return  float((array(lista)).max())
-    elif type == 'mean':
-        return  float((array(lista)).mean())
-    elif type == 'std':
-        return  float((array(lista)).std())
-    elif type == 'median':
-        return  float(median(array(lista)))
-    else:
-        return None
+    return EstatisticasCampo(layer, field_name).get(type)
 
 
 @qgsfunction(args='auto', group='LF Tools')
@@ -110,7 +157,7 @@ def coord2inom(lon, lat, ScaleD, feature, parent):
     </ul>
     """
     lon, lat = lon+1e-10, lat+1e-10
-    return map_sistem(lon, lat, ScaleD)
+    return str(inomArray(lon, lat, ScaleD))
 
 
 @qgsfunction(args='auto', group='LF Tools')
@@ -263,10 +310,37 @@ def removespetialchar (palavra, feature, parent):
     return re.sub('[^a-zA-Z0-9 \\\]', '', palavraSemAcento)
 
 
+# SRC geodésico e elipsoide do plano topocêntrico, a partir do SRC da camada
+# (ParametrosElipsoide e TransformadorProj já são memorizados por SRC)
+def ContextoLTP(crs):
+    crsGeo = QgsCoordinateReferenceSystem(crs.geographicCrsAuthId())
+    a, b, f, e2 = ParametrosElipsoide(crsGeo)
+    return TransformadorProj(crs, crsGeo), a, f
+
+
+def AneisXYZ(geom):
+    # Vértices (x, y, z) de todos os anéis de todas as partes, sem o vértice de fechamento
+    # Retorna os arrays x, y, z e a lista de (parte, quantidade de vértices) de cada anel
+    g = geom.constGet()
+    partes = [g.geometryN(k) for k in range(g.numGeometries())] if geom.isMultipart() else [g]
+    X, Y, Z, aneis = [], [], [], []
+    for parte, pol in enumerate(partes):
+        for anel in [pol.exteriorRing()] + [pol.interiorRing(k) for k in range(pol.numInteriorRings())]:
+            if not isinstance(anel, QgsLineString):
+                anel = anel.curveToLine()
+            n = anel.numPoints() - 1
+            X += [np.array(anel.xVector())[:n]]
+            Y += [np.array(anel.yVector())[:n]]
+            Z += [np.array(anel.zVector())[:n] if anel.is3D() else np.zeros(n)]
+            aneis += [(parte, n)]
+    return np.concatenate(X), np.concatenate(Y), np.concatenate(Z), aneis
+
+
 @qgsfunction(args='auto', group='LF Tools')
 def areaLTP (layer_name, feature, parent):
     """
     Calculates the area on the Local Tangent Plane (LTP), also known as Local Geodetic Coordinate System, which is a spatial reference system based on the tangent plane on the feature centroid defined by the local vertical direction.
+    All parts and rings (holes) of the geometry are considered.
     <p>Note: PolygonZ or MultiPoligonZ is required.</p>
     <h2>Examplo:</h2>
     <ul>
@@ -278,58 +352,41 @@ def areaLTP (layer_name, feature, parent):
     else:
         layer = QgsProject.instance().mapLayer(layer_name)
 
-    crsUTM = layer.crs()
-    crsGeo = QgsCoordinateReferenceSystem(crsUTM.geographicCrsAuthId())
-
-    coordinateTransformer = QgsCoordinateTransform()
-    coordinateTransformer.setDestinationCrs(crsGeo)
-    coordinateTransformer.setSourceCrs(crsUTM)
-
-    geom = feature.geometry()
-    geomGeo = reprojectPoints(geom, coordinateTransformer)
-    if geom.isMultipart():
-        coords = geom2PointList(geom)[0][0]
-        coordsGeo = geomGeo.asMultiPolygon()[0][0]
-    else:
-        coords = geom2PointList(geom)[0]
-        coordsGeo = geomGeo.asPolygon()[0]
-
-    centroide = geomGeo.centroid().asPoint()
-
     try:
-        alt = []
-        for pnt in coords[:-1]:
-            alt += [pnt.z()]
-
-        h0 = np.array(alt).mean()
-        lon0 = centroide.x()
-        lat0 = centroide.y()
-
-        EPSG = int(crsGeo.authid().split(':')[-1]) # pegando o EPGS do SRC do QGIS
-        proj_crs = CRS.from_epsg(EPSG) # transformando para SRC do pyproj
-        a=proj_crs.ellipsoid.semi_major_metre
-        f_inv = proj_crs.ellipsoid.inverse_flattening
-        f=1/f_inv
+        transformador, a, f = ContextoLTP(layer.crs())
+        geom = feature.geometry()
+        x, y, h, aneis = AneisXYZ(geom)
+        lon, lat = transformador.transform(x, y)
+
         # CENTRO DE ROTAÇÃO
+        centroide = geom.centroid().asPoint()
+        lon0, lat0 = transformador.transform(centroide.x(), centroide.y())
+        h0 = h.mean()
         Xo, Yo, Zo = geod2geoc(lon0, lat0, h0, a, f)
 
         # CONVERSÃO DAS COORDENADAS
-        coordsSGL = []
-        for k, coord in enumerate(coordsGeo):
-            lon = coord.x()
-            lat = coord.y()
-            h = coords[k].z()
-            X, Y, Z = geod2geoc(lon, lat, h, a, f)
-            E, N, U = geoc2enu(X, Y, Z, lon0, lat0, Xo, Yo, Zo)
-            coordsSGL += [QgsPointXY(E, N)]
-
-        areaSGL = abs(areaGauss(coordsSGL))
-        return areaSGL
+        X, Y, Z = geod2geoc(np.asarray(lon), np.asarray(lat), h, a, f)
+        E, N, U = geoc2enuArray(X, Y, Z, lon0, lat0, Xo, Yo, Zo)
+
+        # Área de cada anel (Gauss): anéis internos são subtraídos do anel externo da mesma parte
+        areaSGL = 0
+        inicio = 0
+        parte_ant = None
+        for parte, n in aneis:
+            e, nn = E[inicio:inicio+n], N[inicio:inicio+n]
+            area = abs((e*np.roll(nn, -1) - np.roll(e, -1)*nn).sum())/2
+            areaSGL += -area if parte == parte_ant else area
+            parte_ant = parte
+            inicio += n
+        return float(areaSGL)
 
     except:
         return 0
 
 
+# Chaves das linhas das tabelas de vértices e lados
+ChavesLinha = ('Vn', 'En', 'Nn', 'hn', 'lonn', 'latn', 'Ln', 'Az_n', 'Dn')
+
 @qgsfunction(args='auto', group='LF Tools')
 def deedtable(layer_name, ini, fim, titulo, fontsize, feature, parent):
     """
@@ -399,9 +456,7 @@ def deedtable(layer_name, ini, fim, titulo, fontsize, feature, parent):
     pnts_GEO = {}
     # Transformacao de Coordenadas Geograficas para Projetadas no sistema UTM
     crsDest = QgsCoordinateReferenceSystem(SRC_Projeto('EPSG'))
-    coordinateTransformer = QgsCoordinateTransform()
-    coordinateTransformer.setDestinationCrs(crsDest)
-    coordinateTransformer.setSourceCrs(SRC)
+    coordinateTransformer = TransformadorQgs(SRC, crsDest)
     for feat in layer.getFeatures():
         pnt = feat.geometry().asPoint()
         coord = geom2PointList(feat.geometry())
@@ -419,11 +474,11 @@ def deedtable(layer_name, ini, fim, titulo, fontsize, feature, parent):
         Az_Geo_lista += [(180/pi)*azimute(pntA, pntB)[0]+ConvMerediana]
         Dist += [sqrt((pntA.x() - pntB.x())**2 + (pntA.y() - pntB.y())**2)]
 
-    LINHAS = ''
     if fim == -1 or fim > tam:
         fim = tam
+    modelo_linha = Modelo(linha, ChavesLinha)
+    LINHAS = []
     for k in range(ini-1,fim):
-        linha0 = linha
         itens = {'Vn': pnts_UTM[k+1][2],
                     'En':tr(format_num.format(pnts_UTM[k+1][0].x()), format_num.format(pnts_UTM[k+1][0].x()).replace(',', 'X').replace('.', ',').replace('X', '.')),
                     'Nn':tr(format_num.format(pnts_UTM[k+1][0].y()), format_num.format(pnts_UTM[k+1][0].y()).replace(',', 'X').replace('.', ',').replace('X', '.')),
@@ -434,10 +489,11 @@ def deedtable(layer_name, ini, fim, titulo, fontsize, feature, parent):
                     'Az_n':tr(DD2DMS(Az_lista[k],1), DD2DMS(Az_lista[k],1).replace('.', ',')),
                     'Dn':tr(format_num.format(Dist[k]), format_num.format(Dist[k]).replace(',', 'X').replace('.', ',').replace('X', '.'))
                     }
-        for item in itens:
-            linha0 = linha0.replace(item, itens[item])
-        LINHAS += linha0
-    resultado = texto.replace('[CABECALHO]', cabec).replace('[LINHAS]', LINHAS).replace('[TITULO]', str2HTML(titulo.upper())).replace('[FONTSIZE]', str(fontsize))
+        LINHAS += [itens]
+    cabec = Modelo(cabec).preencher({'[TITULO]': str2HTML(titulo.upper())})
+    resultado = Modelo(texto).preencher({'[CABECALHO]': cabec,
+                                         '[LINHAS]': modelo_linha.preencherLinhas(LINHAS),
+                                         '[FONTSIZE]': str(fontsize)})
     return resultado
 
 
@@ -519,9 +575,9 @@ def deedtable2(prefixo, titulo, decimal, fontsize, feature, parent):
         </html>
         '''
 
-        LINHAS = ''
+        modelo_linha = Modelo(linha, ChavesLinha)
+        LINHAS = []
         for k in range(tam):
-            linha0 = linha
             itens = {'Vn': pnts_UTM[k+1][2],
                         'En': tr(format_num.format(pnts_UTM[k+1][0].x()), format_num.format(pnts_UTM[k+1][0].x()).replace(',', 'X').replace('.', ',').replace('X', '.')),
                         'Nn': tr(format_num.format(pnts_UTM[k+1][0].y()), format_num.format(pnts_UTM[k+1][0].y()).replace(',', 'X').replace('.', ',').replace('X', '.')),
@@ -529,10 +585,10 @@ def deedtable2(prefixo, titulo, decimal, fontsize, feature, parent):
                         'Az_n': tr(DD2DMS(Az_lista[k],1), DD2DMS(Az_lista[k],1).replace('.', ',')),
                         'Dn': tr(format_num.format(Dist[k]), format_num.format(Dist[k]).replace(',', 'X').replace('.', ',').replace('X', '.'))
                         }
-            for item in itens:
-                linha0 = linha0.replace(item, itens[item])
-            LINHAS += linha0
-        resultado = texto.replace('[LINHAS]', LINHAS).replace('[TITULO]', str2HTML(titulo.upper())).replace('[FONTSIZE]', str(fontsize))
+            LINHAS += [itens]
+        resultado = Modelo(texto).preencher({'[LINHAS]': modelo_linha.preencherLinhas(LINHAS),
+                                             '[TITULO]': str2HTML(titulo.upper()),
+                                             '[FONTSIZE]': str(fontsize)})
 
         return resultado
     else:
@@ -566,9 +622,7 @@ def deedtable3(prefixo, titulo, decimal, fontsize, layer_name, tipo, azimuteDist
 
     format_num = '{:,.Xf}'.replace('X', str(decimal))
 
-    coordinateTransformer = QgsCoordinateTransform()
-    coordinateTransformer.setDestinationCrs(crsGeo)
-    coordinateTransformer.setSourceCrs(crsUTM)
+    coordinateTransformer = TransformadorQgs(crsUTM, crsGeo)
 
     geom = feature.geometry()
 
@@ -779,9 +833,9 @@ def deedtable3(prefixo, titulo, decimal, fontsize, layer_name, tipo, azimuteDist
               <td>h</td>
             </tr>'''
 
-        LINHAS = ''
+        modelo_linha = Modelo(linha, ChavesLinha)
+        LINHAS = []
         for k in range(tam):
-            linha0 = linha
             itens = {'Vn': pnts_UTM[k+1][2],
                         'En': tr(format_num.format(pnts_UTM[k+1][0].x()), format_num.format(pnts_UTM[k+1][0].x()).replace(',', 'X').replace('.', ',').replace('X', '.')),
                         'Nn': tr(format_num.format(pnts_UTM[k+1][0].y()), format_num.format(pnts_UTM[k+1][0].y()).replace(',', 'X').replace('.', ',').replace('X', '.')),
@@ -792,10 +846,11 @@ def deedtable3(prefixo, titulo, decimal, fontsize, layer_name, tipo, azimuteDist
                         'Az_n': tr(DD2DMS(Az_lista[k],1), DD2DMS(Az_lista[k],1).replace('.', ',')),
                         'Dn': tr(format_num.format(Dist[k]), format_num.format(Dist[k]).replace(',', 'X').replace('.', ',').replace('X', '.'))
                         }
-            for item in itens:
-                linha0 = linha0.replace(item, itens[item])
-            LINHAS += linha0
-        resultado = texto.replace('[CABECALHO]', cabec).replace('[LINHAS]', LINHAS).replace('[TITULO]', str2HTML(titulo.upper())).replace('[FONTSIZE]', str(fontsize))
+            LINHAS += [itens]
+        cabec = Modelo(cabec).preencher({'[TITULO]': str2HTML(titulo.upper())})
+        resultado = Modelo(texto).preencher({'[CABECALHO]': cabec,
+                                             '[LINHAS]': modelo_linha.preencherLinhas(LINHAS),
+                                             '[FONTSIZE]': str(fontsize)})
 
         return resultado
 
@@ -20,6 +20,7 @@ from lftools.geocapt.topogeo import str2HTML
 from lftools.geocapt.imgs import Imgs
 from qgis.core import *
 from qgis.gui import *
+from qgis.PyQt.QtGui import QTransform
 import numpy as np
 from numpy.linalg import norm, det, inv, solve
 
@@ -59,8 +60,22 @@ def ValidacaoVetores(vetores, metodo):
             raise QgsProcessingException(tr('The vector lines must be created with exactly two points!', 'As linhas de vetores devem ter exatamente 2 vértices!'))
     return sinal
 
+# Aplicação de uma matriz homogênea 3x3 a arrays de coordenadas
+def TransfMatriz(M, X, Y):
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    Xt = M[0,0]*X + M[0,1]*Y + M[0,2]
+    Yt = M[1,0]*X + M[1,1]*Y + M[1,2]
+    return (Xt, Yt)
+
 # Transformação de Coordenadas de Geometrias a partir de uma função de transformação
+# ou de uma matriz homogênea 3x3 (aplicada a todos os vértices de uma vez, preservando Z)
 def transformGeom2D(geom, CoordTransf):
+    if isinstance(CoordTransf, np.ndarray):
+        M = CoordTransf
+        newGeom = QgsGeometry(geom)
+        newGeom.transform(QTransform(M[0,0], M[1,0], M[0,1], M[1,1], M[0,2], M[1,2]))
+        return newGeom
     if geom.type() == 0: #Point
         if geom.isMultipart():
             pnts = geom.asMultiPoint()
@@ -72,6 +87,7 @@ def transformGeom2D(geom, CoordTransf):
             return newGeom
         else:
             pnt = geom.asPoint()
+            x, y = CoordTransf(pnt)
             newPnt = QgsPointXY(x,y)
             newGeom = QgsGeometry.fromPointXY(newPnt)
             return newGeom
@@ -190,6 +206,7 @@ def Ajust2D(vetores, metodo):
     if metodo == 0:
         a = X[0,0]
         b = X[1,0]
+        MT = np.array([[1, 0, a], [0, 1, b], [0, 0, 1]]) # Matriz homogênea
         def CoordTransf(pnt, a = a, b = b): # Translacao
             X, Y = pnt.x(), pnt.y()
             Xt = X + a
@@ -200,12 +217,15 @@ def Ajust2D(vetores, metodo):
             Xit = X - a
             Yit = Y - b
             return (Xit, Yit)
+        MT_inv = np.array([[1, 0, -a], [0, 1, -b], [0, 0, 1]])
 
     elif metodo == 1:
         a = X[0,0]
         b = X[1,0]
         c = X[2,0]
         d = X[3,0]
+        MT = np.array([[a, -b, c], [b, a, d], [0, 0, 1]]) # Matriz homogênea
+        MT_inv = inv(MT)
         def CoordTransf(pnt, a = a, b = b, c = c, d = d): # Transformação Conforme - Helmert 2D
             '''
             Xt = X*a - Y*b + c
@@ -217,13 +237,10 @@ def Ajust2D(vetores, metodo):
             Xt = X*a - Y*b + c
             Yt = X*b + Y*a + d
             return (Xt, Yt)
-        def CoordInvTransf(pnt, a = a, b = b, c = c, d = d): # Transformação de Helmert 2D (Inversa)
+        def CoordInvTransf(pnt, M = MT_inv): # Transformação de Helmert 2D (Inversa)
             X, Y = pnt.x(), pnt.y()
-            A = np.matrix([[a,-b],[b,a]])
-            B = np.matrix([[X-c],[Y-d]])
-            sol = solve(A,B)
-            Xit = sol[0,0]
-            Yit = sol[1,0]
+            Xit = M[0,0]*X + M[0,1]*Y + M[0,2]
+            Yit = M[1,0]*X + M[1,1]*Y + M[1,2]
             return (Xit, Yit)
 
     elif metodo == 2:
@@ -233,18 +250,17 @@ def Ajust2D(vetores, metodo):
         d = X[3,0]
         e = X[4,0]
         f = X[5,0]
+        MT = np.array([[a, b, c], [d, e, f], [0, 0, 1]]) # Matriz homogênea
+        MT_inv = inv(MT)
         def CoordTransf(pnt, a = a, b = b, c = c, d = d, e = e, f = f): # Transformação Afim
             X, Y = pnt.x(), pnt.y()
             Xt = X*a + Y*b + c
             Yt = X*d + Y*e + f
             return (Xt, Yt)
-        def CoordInvTransf(pnt, a = a, b = b, c = c, d = d, e = e, f = f): # Transformação Afim (Inversa)
+        def CoordInvTransf(pnt, M = MT_inv): # Transformação Afim (Inversa)
             X, Y = pnt.x(), pnt.y()
-            A = np.matrix([[a,b],[d,e]])
-            B = np.matrix([[X-c],[Y-f]])
-            sol = solve(A,B)
-            Xit = sol[0,0]
-            Yit = sol[1,0]
+            Xit = M[0,0]*X + M[0,1]*Y + M[0,2]
+            Yit = M[1,0]*X + M[1,1]*Y + M[1,2]
             return (Xit, Yit)
 
     # Cálculo do Resíduos
@@ -475,7 +491,7 @@ align="center"><b><span style="">''' + tr('Transformation Parameters:',str2HTML(
 
     texto = texto.replace('[TABLE]', tabela)
 
-    return COORD, PREC, CoordTransf, texto, CoordInvTransf
+    return COORD, PREC, CoordTransf, texto, CoordInvTransf, MT, MT_inv
 
 
 
@@ -68,6 +68,81 @@ def Interpolar(X, Y, BAND, origem, resol_X, resol_Y, metodo, nulo):
             return nulo
 
 
+# Pesos da interpolação cúbica (nós em -1, 0, 1, 2)
+def PesosCubicos(t):
+    return (-t*(t-1)*(t-2)/6.,
+            (t+1)*(t-1)*(t-2)/2.,
+            -(t+1)*t*(t-2)/2.,
+            (t+1)*t*(t-1)/6.)
+
+
+# Função de Interpolação vetorizada
+def InterpolarArray(X, Y, BAND, origem, resol_X, resol_Y, metodo, nulo):
+    '''
+    Versão vetorizada de Interpolar para arrays de coordenadas X e Y.
+    BAND pode ser 2D (linhas, colunas) ou 3D (bandas, linhas, colunas).
+    Retorna um array float com a forma (bandas,) + X.shape (ou X.shape, se BAND for 2D).
+    '''
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    banda_unica = BAND.ndim == 2
+    BAND = BAND[np.newaxis] if banda_unica else BAND
+    n_bands, rows, cols = BAND.shape
+    I = (origem[1] - Y)/resol_Y - 0.5
+    J = (X - origem[0])/resol_X - 0.5
+    saida = np.full((n_bands,) + X.shape, nulo, dtype=float)
+
+    if metodo == 'nearest':
+        I = np.round(I)
+        J = np.round(J)
+        dentro = (I >= 0) & (I < rows) & (J >= 0) & (J < cols)
+        I = I[dentro].astype(int)
+        J = J[dentro].astype(int)
+        saida[:, dentro] = BAND[:, I, J]
+
+    elif metodo == 'bilinear':
+        I0 = np.floor(I)
+        J0 = np.floor(J)
+        di = I - I0
+        dj = J - J0
+        I1 = np.ceil(I)
+        J1 = np.ceil(J)
+        dentro = (I0 >= 0) & (I1 < rows) & (J0 >= 0) & (J1 < cols)
+        I0, I1 = I0[dentro].astype(int), I1[dentro].astype(int)
+        J0, J1 = J0[dentro].astype(int), J1[dentro].astype(int)
+        di, dj = di[dentro], dj[dentro]
+        Z00 = BAND[:, I0, J0].astype(float)
+        Z10 = BAND[:, I1, J0].astype(float)
+        Z01 = BAND[:, I0, J1].astype(float)
+        Z11 = BAND[:, I1, J1].astype(float)
+        Z = (1-di)*(1-dj)*Z00 + (1-dj)*di*Z10 + (1-di)*dj*Z01 + di*dj*Z11
+        nulos = (Z00 == nulo) | (Z10 == nulo) | (Z01 == nulo) | (Z11 == nulo)
+        Z[nulos] = nulo
+        saida[:, dentro] = Z
+
+    elif metodo == 'bicubic':
+        I0 = np.floor(I)
+        J0 = np.floor(J)
+        di = I - I0
+        dj = J - J0
+        dentro = (I0 >= 1) & (I0 + 2 < rows) & (J0 >= 1) & (J0 + 2 < cols)
+        I0 = I0[dentro].astype(int)
+        J0 = J0[dentro].astype(int)
+        Wi = PesosCubicos(di[dentro])
+        Wj = PesosCubicos(dj[dentro])
+        Z = np.zeros((n_bands, I0.size), dtype=float)
+        nulos = np.zeros((n_bands, I0.size), dtype=bool)
+        for r in range(4):
+            for c in range(4):
+                valor = BAND[:, I0 + r - 1, J0 + c - 1]
+                nulos |= valor == nulo
+                Z += Wi[r]*Wj[c]*valor
+        Z[nulos] = nulo
+        saida[:, dentro] = Z
+
+    return saida[0] if banda_unica else saida
+
+
 def rgb2hsv(rgb):
     rgb = rgb.astype('float')/255. # dividir pelo máximo - mínimo
     maxv = np.amax(rgb, axis=2)
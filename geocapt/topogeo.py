@@ -14,8 +14,14 @@ __author__ = 'Leandro França'
 __date__ = '2021-03-01'
 __copyright__ = '(C) 2021, Leandro França'
 
-from numpy import radians, arctan, pi, sin, cos, matrix, sqrt, degrees, array, diag, ones, zeros, floor
+from numpy import radians, arctan, arctan2, pi, sin, cos, sqrt, degrees, array, diag, ones, zeros, floor
 from numpy.linalg import norm, pinv, inv
+import numpy as np
+import re
+import os
+import pathlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import quote
 
 def azimute(A,B):
     # Cálculo dos Azimutes entre dois pontos (Vetor AB origem A extremidade B)
@@ -86,35 +92,170 @@ def dd2dms(dd, n_digits):
         return "0°00'" + ('{:0' + str(3+n_digits) + '.' + str(n_digits) + 'f}').format(0)
 
 
+
+# Versão vetorizada de dd2dms (valores nulos ou NaN resultam em None)
+def dd2dmsArray(dd, n_digits):
+    dd = np.asarray(dd, dtype=float)
+    nulos = np.isnan(dd)
+    valor = np.abs(np.where(nulos, 0, dd))
+    graus = np.floor(valor)
+    resto = np.round(valor - graus, 10)
+    minutos = np.floor(60*resto)
+    resto = np.round(resto*60 - minutos, 10)
+    segundos = resto*60
+    virada = np.round(segundos, n_digits) == 60
+    minutos = np.where(virada, minutos + 1, minutos)
+    segundos = np.where(virada, 0, segundos)
+    virada = minutos == 60
+    graus = np.where(virada, graus + 1, graus)
+    minutos = np.where(virada, 0, minutos)
+    texto = np.char.add(np.where(dd < 0, '-', ''), graus.astype(int).astype(str))
+    texto = np.char.add(texto, np.char.mod("°%02d'", minutos.astype(int)))
+    if n_digits < 1:
+        texto = np.char.add(texto, np.char.mod('%02d"', segundos.astype(int)))
+    else:
+        texto = np.char.add(texto, np.char.mod('%0' + str(3+n_digits) + '.' + str(n_digits) + 'f"', segundos))
+    zero = "0°00'" + ('{:0' + str(3+n_digits) + '.' + str(n_digits) + 'f}').format(0)
+    texto = np.where(dd == 0, zero, texto).astype(object)
+    texto[nulos] = None
+    return texto
+
+# Graus, minutos e segundos separados por um símbolo qualquer (ex.: -10°30'00.0" ou -10d30m00.0s)
+NumeroDMS = r'(\d+(?:\.\d*)?|\.\d+)'
+RegexDMS = re.compile(r'^(-?)' + NumeroDMS + r'[^\d.\-]' + NumeroDMS + r'[^\d.\-]' + NumeroDMS + r'[^\d.\-]?$')
+
 def dms2dd(txt):
     txt = txt.replace(' ','').replace('\t','').replace(',','.')
-    newtxt =''
-    for letter in txt:
-        if not letter.isnumeric() and letter != '.' and letter != '-':
-            newtxt += '|'
-        else:
-            newtxt += letter
-    lista = newtxt[:-1].split('|')
-    if len(lista) != 3: # GMS
+    lista = RegexDMS.match(txt)
+    if lista is None: # GMS
         return None
     else:
-        if '-' in lista[0]:
-            return -1*(abs(float(lista[0])) + float(lista[1])/60 + float(lista[2])/3600)
-        else:
-            return float(lista[0]) + float(lista[1])/60 + float(lista[2])/3600
+        sinal, graus, minutos, segundos = lista.groups()
+        dd = float(graus) + float(minutos)/60 + float(segundos)/3600
+        return -dd if sinal else dd
 
 
+# Versão vetorizada de dms2dd (textos inválidos resultam em NaN)
+def dms2ddArray(txts):
+    valores = np.full((len(txts), 4), np.nan)
+    for k, txt in enumerate(txts):
+        lista = RegexDMS.match(txt.replace(' ','').replace('\t','').replace(',','.')) if isinstance(txt, str) else None
+        if lista is not None:
+            sinal, graus, minutos, segundos = lista.groups()
+            valores[k] = (-1. if sinal else 1.), float(graus), float(minutos), float(segundos)
+    return valores[:,0]*(valores[:,1] + valores[:,2]/60 + valores[:,3]/3600)
+
+
+TabelaHTML = str.maketrans({'Á': '&Aacute;',	'á': '&aacute;',	'Â': '&Acirc;',	'â': '&acirc;',	'À': '&Agrave;',	'à': '&agrave;',	'Å': '&Aring;',	'å': '&aring;',	'Ã': '&Atilde;',	'ã': '&atilde;',	'Ä': '&Auml;',	'ä': '&auml;', 'ú': '&uacute;', 'Ú': '&Uacute;', 'Æ': '&AElig;',	'æ': '&aelig;',	'É': '&Eacute;',	'é': '&eacute;',	'Ê': '&Ecirc;',	'ê': '&ecirc;',	'È': '&Egrave;',	'è': '&egrave;',	'Ë': '&Euml;',	'ë': '&Euml;',	'Ð': '&ETH;',	'ð': '&eth;',	'Í': '&Iacute;',	'í': '&iacute;',	'Î': '&Icirc;',	'î': '&icirc;',	'Ì': '&Igrave;',	'ì': '&igrave;',	'Ï': '&Iuml;',	'ï': '&iuml;',	'Ó': '&Oacute;',	'ó': '&oacute;',	'Ô': '&Ocirc;',	'ô': '&ocirc;',	'Ò': '&Ograve;', 'Õ': '&Otilde;', 'õ': '&otilde;',	'ò': '&ograve;',	'Ø': '&Oslash;',	'ø': '&oslash;',	'Ù': '&Ugrave;',	'ù': '&ugrave;',	'Ü': '&Uuml;',	'ü': '&uuml;',	'Ç': '&Ccedil;',	'ç': '&ccedil;',	'Ñ': '&Ntilde;',	'ñ': '&ntilde;',	'Ý': '&Yacute;',	'ý': '&yacute;',	'"': '&quot;', '”': '&quot;',	'<': '&lt;',	'>': '&gt;',	'®': '&reg;',	'©': '&copy;',	'\'': '&apos;', 'ª': '&ordf;', 'º': '&ordm', '°':'&deg;'})
+
 def str2HTML(texto):
     if texto:
-        dicHTML = {'Á': '&Aacute;',	'á': '&aacute;',	'Â': '&Acirc;',	'â': '&acirc;',	'À': '&Agrave;',	'à': '&agrave;',	'Å': '&Aring;',	'å': '&aring;',	'Ã': '&Atilde;',	'ã': '&atilde;',	'Ä': '&Auml;',	'ä': '&auml;', 'ú': '&uacute;', 'Ú': '&Uacute;', 'Æ': '&AElig;',	'æ': '&aelig;',	'É': '&Eacute;',	'é': '&eacute;',	'Ê': '&Ecirc;',	'ê': '&ecirc;',	'È': '&Egrave;',	'è': '&egrave;',	'Ë': '&Euml;',	'ë': '&Euml;',	'Ð': '&ETH;',	'ð': '&eth;',	'Í': '&Iacute;',	'í': '&iacute;',	'Î': '&Icirc;',	'î': '&icirc;',	'Ì': '&Igrave;',	'ì': '&igrave;',	'Ï': '&Iuml;',	'ï': '&iuml;',	'Ó': '&Oacute;',	'ó': '&oacute;',	'Ô': '&Ocirc;',	'ô': '&ocirc;',	'Ò': '&Ograve;', 'Õ': '&Otilde;', 'õ': '&otilde;',	'ò': '&ograve;',	'Ø': '&Oslash;',	'ø': '&oslash;',	'Ù': '&Ugrave;',	'ù': '&ugrave;',	'Ü': '&Uuml;',	'ü': '&uuml;',	'Ç': '&Ccedil;',	'ç': '&ccedil;',	'Ñ': '&Ntilde;',	'ñ': '&ntilde;',	'Ý': '&Yacute;',	'ý': '&yacute;',	'"': '&quot;', '”': '&quot;',	'<': '&lt;',	'>': '&gt;',	'®': '&reg;',	'©': '&copy;',	'\'': '&apos;', 'ª': '&ordf;', 'º': '&ordm', '°':'&deg;'}
-        for item in dicHTML:
-            if item in texto:
-                texto = texto.replace(item, dicHTML[item])
-        return texto
+        return texto.translate(TabelaHTML)
     else:
         return ''
 
 
+class Modelo:
+    # Modelo de texto compilado uma única vez em segmentos fixos e chaves.
+    # Chaves padrão: textos entre colchetes, ex.: [Vn], [P-01]
+    PadraoChave = re.compile(r'(\[[^\[\]\s]+\])')
+
+    def __init__(self, texto, chaves=None):
+        if chaves:
+            padrao = re.compile('(' + '|'.join(re.escape(chave) for chave in sorted(chaves, key=len, reverse=True)) + ')')
+        else:
+            padrao = self.PadraoChave
+        self.segmentos = padrao.split(texto)
+        self.posicoes = [(k, self.segmentos[k]) for k in range(1, len(self.segmentos), 2)]
+
+    def preencher(self, itens):
+        partes = self.segmentos[:]
+        for k, chave in self.posicoes:
+            if chave in itens:
+                partes[k] = itens[chave]
+        return ''.join(partes)
+
+    def preencherLinhas(self, lista_itens):
+        return ''.join([self.preencher(itens) for itens in lista_itens])
+
+
+def agruparPorChave(feicoes, campo):
+    # Agrupa as feições pelo valor do campo chave em uma única leitura
+    grupos = {}
+    for feat in feicoes:
+        grupos.setdefault(feat[campo], []).append(feat)
+    return grupos
+
+
+def nomesArquivosHTML(pasta, prefixo, chaves):
+    # Um arquivo por chave, numerando as chaves repetidas ou que resultam no mesmo nome
+    usados = set()
+    arquivos = []
+    for chave in chaves:
+        nome = prefixo + (re.sub(r'[^\w\-]+', '_', str(chave)).strip('_') or '_')
+        candidato, cont = nome, 1
+        while candidato.lower() in usados:
+            cont += 1
+            candidato = '{}_{}'.format(nome, cont)
+        usados.add(candidato.lower())
+        arquivos += [os.path.join(pasta, candidato + '.html')]
+    return arquivos
+
+
+def executarEmLote(funcao, itens, feedback=None, max_workers=None):
+    # Executa a função para cada item em um conjunto de threads
+    # Retorna os resultados e os erros na ordem dos itens
+    resultados = [None]*len(itens)
+    erros = [None]*len(itens)
+    if not itens:
+        return resultados, erros
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, os.cpu_count() or 1)) as pool:
+        futuros = {pool.submit(funcao, item): k for k, item in enumerate(itens)}
+        for n, futuro in enumerate(as_completed(futuros)):
+            k = futuros[futuro]
+            try:
+                resultados[k] = futuro.result()
+            except Exception as erro:
+                erros[k] = erro
+            if feedback is not None:
+                feedback.setProgress(int(100*(n+1)/len(itens)))
+                if feedback.isCanceled():
+                    for fut in futuros:
+                        fut.cancel()
+                    break
+    return resultados, erros
+
+
+def linkHTML(arquivo, destino):
+    # Link para o arquivo relativo à pasta da página de destino
+    try:
+        relativo = os.path.relpath(os.path.abspath(arquivo), os.path.dirname(os.path.abspath(destino)))
+    except ValueError: # unidades diferentes no Windows
+        return pathlib.Path(os.path.abspath(arquivo)).as_uri()
+    return quote(relativo.replace(os.sep, '/'))
+
+
+def indiceHTML(titulo, arquivos, destino):
+    # Página com os links para os relatórios gerados em lote, a ser salva em destino
+    modelo = Modelo('''<!DOCTYPE html PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN">
+<html>
+<head>
+  <meta content="text/html; charset=ISO-8859-1" http-equiv="content-type">
+  <title>[TITULO]</title>
+</head>
+<body style="font-family: Arial;">
+<h2>[TITULO]</h2>
+<ol>
+[LINHAS]</ol>
+</body>
+</html>
+''')
+    linha = Modelo('''<li><a href="[ARQ]">[NOME]</a></li>
+''')
+    LINHAS = linha.preencherLinhas([{'[ARQ]': linkHTML(arq, destino), '[NOME]': str2HTML(str(nome))} for nome, arq in arquivos])
+    return modelo.preencher({'[TITULO]': titulo, '[LINHAS]': LINHAS})
+
+
 def String2NumberList (txt):
     txt = txt.replace(' ', '').replace('\t','').replace('\n','')
     Splited = txt.split(',')
@@ -162,7 +303,7 @@ def geoc2geod(X, Y, Z, a, f):
     tg_u = (a/b)*Z/sqrt(X**2 + Y**2)
     sen_u = tg_u/sqrt(1+tg_u**2)
     cos_u = 1/sqrt(1+tg_u**2)
-    lon =arctan(Y/X)
+    lon = arctan2(Y, X)
     lat = arctan( (Z+ e2_2 * b * sen_u**3) / (sqrt(X**2 + Y**2) - e2 * a * cos_u**3))
     N = a/sqrt(1-(e2*sin(lat)**2))
     h = sqrt(X**2 + Y**2)/cos(lat) - N
@@ -170,12 +311,35 @@ def geoc2geod(X, Y, Z, a, f):
     lat = lat/pi*180
     return (lon, lat, h)
 
-# Conversão de Coordenadas Geocêntrica para Topocêntricas
-def geoc2enu(X, Y, Z, lon0, lat0, Xo, Yo, Zo):
+# Conversão de coordenadas geocêntricas para geodésicas (arrays)
+# Parte da solução de Bowring e refina a latitude até a convergência
+def geoc2geodArray(X, Y, Z, a, f, tol=1e-12, max_iter=10):
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    Z = np.asarray(Z, dtype=float)
+    b = a*(1-f)
+    e2 = f*(2-f) # primeira excentricidade
+    e2_2 = e2/(1-e2) # segunda excentricidade
+    p = np.hypot(X, Y)
+    u = np.arctan2(a*Z, b*p)
+    lat = np.arctan2(Z + e2_2*b*np.sin(u)**3, p - e2*a*np.cos(u)**3)
+    for k in range(max_iter):
+        N = a/np.sqrt(1 - e2*np.sin(lat)**2)
+        h = p*np.cos(lat) + Z*np.sin(lat) - a*a/N
+        lat_ant = lat
+        lat = np.arctan2(Z, p*(1 - e2*N/(N + h)))
+        if np.all(np.abs(lat - lat_ant) < tol):
+            break
+    N = a/np.sqrt(1 - e2*np.sin(lat)**2)
+    h = p*np.cos(lat) + Z*np.sin(lat) - a*a/N
+    lon = np.arctan2(Y, X)
+    return (np.degrees(lon), np.degrees(lat), h)
+
+# Matriz de rotação do sistema geocêntrico para o topocêntrico (ENU)
+def MatrizENU(lon0, lat0):
     lon = radians(lon0)
     lat = radians(lat0)
-
-    M = matrix(
+    return np.array(
     [
     [  -sin(lon),                     cos(lon),                 0 ],
     [  -sin(lat)*cos(lon),   -sin(lat)*sin(lon),          cos(lat)],
@@ -183,34 +347,32 @@ def geoc2enu(X, Y, Z, lon0, lat0, Xo, Yo, Zo):
     ]
     )
 
-    T = matrix(
-    [[X - Xo], [Y-Yo], [Z-Zo]]
-    )
+# Falso E e N do sistema topocêntrico
+FalsoENU = np.array([15e4, 25e4, 0])
 
-    Fo = matrix([[15e4],[25e4],[0]]) # False E and N
+# Conversão de Coordenadas Geocêntrica para Topocêntricas (arrays)
+# A rotação é calculada uma única vez para a origem
+def geoc2enuArray(X, Y, Z, lon0, lat0, Xo, Yo, Zo):
+    M = MatrizENU(lon0, lat0)
+    T = np.stack([np.asarray(X, dtype=float) - Xo, np.asarray(Y, dtype=float) - Yo, np.asarray(Z, dtype=float) - Zo])
+    R = np.tensordot(M, T, axes=1) + FalsoENU.reshape((3,) + (1,)*(T.ndim - 1))
+    return (R[0], R[1], R[2])
 
-    R = M*T + Fo
-    return (R[0,0], R[1,0], R[2,0])
+# Conversão de Coordenadas Topocêntricas para Geocêntrica (arrays)
+def enu2geocArray(E, N, U, lon0, lat0, Xo, Yo, Zo):
+    M = MatrizENU(lon0, lat0).T
+    T = np.stack([np.asarray(E, dtype=float), np.asarray(N, dtype=float), np.asarray(U, dtype=float)])
+    T = T - FalsoENU.reshape((3,) + (1,)*(T.ndim - 1))
+    R = np.tensordot(M, T, axes=1) + np.array([Xo, Yo, Zo]).reshape((3,) + (1,)*(T.ndim - 1))
+    return (R[0], R[1], R[2])
+
+# Conversão de Coordenadas Geocêntrica para Topocêntricas
+def geoc2enu(X, Y, Z, lon0, lat0, Xo, Yo, Zo):
+    E, N, U = geoc2enuArray(X, Y, Z, lon0, lat0, Xo, Yo, Zo)
+    return (E[()], N[()], U[()])
 
 
 # Conversão de Coordenadas Topocêntricas para Geocêntrica
 def enu2geoc(E, N, U, lon0, lat0, Xo, Yo, Zo):
-    lon = radians(lon0)
-    lat = radians(lat0)
-
-    Fo = matrix([[15e4],[25e4],[0]]) # False E and N
-
-    M = matrix(
-    [
-    [  -sin(lon),     -sin(lat)*cos(lon),          cos(lat)*cos(lon)],
-    [  cos(lon),      -sin(lat)*sin(lon),          cos(lat)*sin(lon)],
-    [   0        ,              cos(lat),                       sin(lat)     ]
-    ]
-    )
-
-    T = matrix(
-    [[E], [N], [U]]
-    )
-
-    R = M*(T-Fo) + [[Xo], [Yo], [Zo]]
-    return (R[0,0], R[1,0], R[2,0])
+    X, Y, Z = enu2geocArray(E, N, U, lon0, lat0, Xo, Yo, Zo)
+    return (X[()], Y[()], Z[()])
@@ -30,72 +30,389 @@ __copyright__ = '(C) 2021 by Leandro Franca'
 
 __revision__ = '$Format:%H$'
 import os
-from qgis.core import QgsProcessingProvider
+from importlib import import_module
+from qgis.core import (QgsProcessingProvider,
+                       QgsProcessingAlgorithm,
+                       QgsProcessingOutputVectorLayer,
+                       QgsProcessingException,
+                       QgsApplication)
+from qgis.PyQt.QtCore import QCoreApplication
 from qgis.PyQt.QtGui import QIcon
 
-from lftools.processing_provider.Cart_inom2utm import Inom2utmGrid
-from lftools.processing_provider.Cart_coord2utm import Coord2UTMGrid
-from lftools.processing_provider.Cart_extent2utm import Extent2UTMGrid
-from lftools.processing_provider.Survey_closedPolygonal import ClosedPolygonal
-from lftools.processing_provider.Survey_Estimate3dCoord import Estimate3dCoord
-from lftools.processing_provider.Survey_coordTransf2D import CoordTransf2D
-from lftools.processing_provider.Survey_LocalTangentPlane import LocalTangentPlane
-from lftools.processing_provider.Survey_traverseAdjustment import TraverseAdjustment
-from lftools.processing_provider.Survey_azimuthDistance import AzimuthDistance
-from lftools.processing_provider.Stat_confidenceEllipse import ConfidenceEllipse
-from lftools.processing_provider.Stat_randomDist import RandomDist
-from lftools.processing_provider.Easy_coord2layer import CoordinatesToLayer
-from lftools.processing_provider.Easy_measures_layers import MeasureLayers
-from lftools.processing_provider.Rast_Bands2RGB import Bands2RGB
-from lftools.processing_provider.Rast_compressJPEG import CompressJPEG
-from lftools.processing_provider.Rast_createHolesInRaster import CreateHolesInRaster
-from lftools.processing_provider.Rast_defineNullCell import DefineNullCell
-from lftools.processing_provider.Rast_extractRasterBand import ExtractRasterBand
-from lftools.processing_provider.Rast_fillRasterwithPatches import FillRasterwithPatches
-from lftools.processing_provider.Rast_inventoryRaster import InventoryRaster
-from lftools.processing_provider.Rast_loadRasterByLocation import LoadRasterByLocation
-from lftools.processing_provider.Rast_mosaicRaster import MosaicRaster
-from lftools.processing_provider.Drone_removeAlphaBand import RemoveAlphaBand
-from lftools.processing_provider.Rast_rescaleTo8bits import RescaleTo8bits
-from lftools.processing_provider.Rast_supervisedClassification import SupervisedClassification
-from lftools.processing_provider.Drone_saveAsJPEG import SaveAsJPEG
-from lftools.processing_provider.Rast_binaryThresholding import BinaryThresholding
-from lftools.processing_provider.Reamb_ImportPhotos import ImportPhotos
-from lftools.processing_provider.Vect_DirectionalMerge import DirectionalMerge
-from lftools.processing_provider.Vect_ExtendLines import ExtendLines
-from lftools.processing_provider.Vect_PolygonAngles import CalculatePolygonAngles
-from lftools.processing_provider.Vect_reverseVertexOrder import ReverseVertexOrder
-from lftools.processing_provider.Vect_sequencePoints import SequencePoints
-from lftools.processing_provider.Doc_AreaPerimeter import AreaPerimterReport
-from lftools.processing_provider.Doc_DescriptiveMemorial import DescriptiveMemorial
-from lftools.processing_provider.Doc_MarkInformation import SurveyMarkDoc
-from lftools.processing_provider.Doc_DescriptiveTable import DescriptiveTable
-from lftools.processing_provider.Post_Restore import Restore
-from lftools.processing_provider.Post_Backup import Backup
-from lftools.processing_provider.Post_CloneDB import CloneDB
-from lftools.processing_provider.Post_DeleteDB import DeleteDB
-from lftools.processing_provider.Post_RenameDB import RenameDB
-from lftools.processing_provider.Post_ImportRaster import ImportRaster
-from lftools.processing_provider.Post_ChangeEnconding import ChangeEnconding
-from lftools.processing_provider.Drone_overviewsJPEG import OverviewsJPEG
-from lftools.processing_provider.Drone_GeorrefAdjust import GeorrefAdjust
-from lftools.processing_provider.Rast_getPointValue import GetPointValue
-from lftools.processing_provider.Drone_photosByBlocks import PhotosByBlocks
-from lftools.processing_provider.Drone_copySelectedPhotos import CopySelectedPhotos
-from lftools.processing_provider.Drone_copySelectedPhotos import CopySelectedPhotos
-from lftools.processing_provider.Drone_joinFolders import JoinFolders
-from lftools.processing_provider.Drone_createGCPfile import CreateGCPfile
-from lftools.processing_provider.Drone_verticalAdjustment import VerticalAdjustment
-from lftools.processing_provider.Relief_DEMfilter import DEMfilter
-from lftools.processing_provider.Relief_SpotElevation import SpotElevation
-from lftools.processing_provider.Vect_PolygonOrientation import PolygonOrientation
-from lftools.processing_provider.Easy_getAttributeByLocation import GetAttributeByLocation
-from lftools.processing_provider.Rast_bandArithmetic import BandArithmetic
-from lftools.processing_provider.Gnss_NMEA2layer import NMEA2layer
-from lftools.processing_provider.Reamb_ResizePhotos import ResizePhotos
-from lftools.processing_provider.Rast_rgb2hsv import RGB2HSV
-from lftools.processing_provider.Cad_GeoNumbering import GeoNumbering
-from lftools.processing_provider.Cad_FrontLotLine import FrontLotLine
+# Registro dos algoritmos: os módulos de processing_provider só são
+# importados quando o algoritmo é executado ou a sua ajuda é exibida.
+# (módulo, classe, nome, (nome exibido), (grupo), id do grupo, ícone, tags)
+ALGORITMOS = (
+    ('Cart_inom2utm', 'Inom2utmGrid', 'inom2utmgrid',
+     ('Name to UTM grid', 'Nome para moldura UTM'),
+     ('Cartography', 'Cartografia'), 'cartography', 'cart_frame.png',
+     'name,frame,utm,grid,system,map,inom,mi,sistemático,índice,nomenclatura,grade,mapeamento,moldura'),
+    ('Cart_coord2utm', 'Coord2UTMGrid', 'coord2utmgrid',
+     ('Coordinates to UTM grid', 'Coordenadas para moldura UTM'),
+     ('Cartography', 'Cartografia'), 'cartography', 'cart_frame.png',
+     'name,coordinates,frame,utm,grid,system,map,inom,mi,sistemático,índice,nomenclatura,grade,mapeamento,moldura'),
+    ('Cart_extent2utm', 'Extent2UTMGrid', 'extent2utmgrid',
+     ('Extent to UTM grids', 'Extensão para molduras UTM'),
+     ('Cartography', 'Cartografia'), 'cartography', 'cart_frames.png',
+     'name,extent,extension,frame,utm,grid,system,map,inom,mi,sistemático,índice,nomenclatura,grade,mapeamento,moldura'),
+    ('Cart_convergenceScaleFactor', 'ConvergenceScaleFactor', 'convergencescalefactor',
+     ('Meridian convergence and scale factor', 'Convergência meridiana e fator de escala'),
+     ('Cartography', 'Cartografia'), 'cartography', 'cart_frame.png',
+     'meridian,convergence,scale,factor,kappa,utm,zone,central,convergência,meridiana,fator,escala,fuso,meridiano central,hemisfério'),
+    ('Cart_featuresINOM', 'FeaturesINOM', 'featuresinom',
+     ('Chart index of features', 'Índice de cartas das feições'),
+     ('Cartography', 'Cartografia'), 'cartography', 'cart_frame.png',
+     'inom,mi,chart,index,nomenclature,map,sheet,grid,utm,carta,índice,nomenclatura,mapa,folha,articulação'),
+    ('Survey_closedPolygonal', 'ClosedPolygonal', 'planimetry',
+     ('Closed polygonal', 'Poligonal fechada'),
+     ('Survey', 'Agrimensura'), 'survey', 'total_station.png',
+     'survey,agrimensura,closed,traverse,polygonal,adjustment,total,station,angle,least square'),
+    ('Survey_Estimate3dCoord', 'Estimate3dCoord', 'estimate3dcoord',
+     ('Estimate 3D coordinates', 'Estimar coordenadas 3D'),
+     ('Survey', 'Agrimensura'), 'survey', 'total_station.png',
+     'survey,agrimensura,3D,coordinate,azimuth,zenith,angle,least square,minimum distantce,adjustment,slant'),
+    ('Survey_coordTransf2D', 'CoordTransf2D', 'coordtransf2D',
+     ('Coordinate transformation 2D', 'Transformação de coordenadas 2D'),
+     ('Survey', 'Agrimensura'), 'survey', 'total_station.png',
+     'survey,agrimensura,helmert,2D,georreferencing,tranformation,conformal,register,adjustment,least squares,spatial'),
+    ('Survey_LocalTangentPlane', 'LocalTangentPlane', 'localtangentplane',
+     ('Local Geodetic System transform', 'Transformação para SGL'),
+     ('Survey', 'Agrimensura'), 'survey', 'total_station.png',
+     'survey,agrimensura,LGS,SGL,tangent,transform,geocentric,topocentric,ECEF,geodetic,geodesic,brazil'),
+    ('Survey_traverseAdjustment', 'TraverseAdjustment', 'traverseadjustment',
+     ('Traverse adjustment', 'Poligonal enquadrada'),
+     ('Survey', 'Agrimensura'), 'survey', 'total_station.png',
+     'survey,agrimensura,polygonal,adjustment,total,station,angle,least square'),
+    ('Survey_azimuthDistance', 'AzimuthDistance', 'azimuthdistance',
+     ('Azimuth and distance', 'Azimute e distância'),
+     ('Survey', 'Agrimensura'), 'survey', 'total_station.png',
+     'survey,agrimensura,azimuth,distance,traverse,analytical,total,station,angle'),
+    ('Stat_confidenceEllipse', 'ConfidenceEllipse', 'confidenceellipse',
+     ('Confidence ellipses', 'Elipses de confiança'),
+     ('Spatial Statistics', 'Estatística Espacial'), 'spatialstatistics', 'statistics.png',
+     'ellipse,elipse,confidence,deviational,standard,tendency,dispertion,directional,trend,confidence,covariance,mvc'),
+    ('Stat_randomDist', 'RandomDist', 'randomdist',
+     ('Gaussian random points', 'Pontos aleatórios gaussiano'),
+     ('Spatial Statistics', 'Estatística Espacial'), 'spatialstatistics', 'statistics.png',
+     'random,gauss,confidence,deviational,standard,tendency,dispertion,directional,trend,confidence,covariance,mvc'),
+    ('Easy_coord2layer', 'CoordinatesToLayer', 'coord2layer',
+     ('Table to point layer', 'Planilha para camada de pontos'),
+     ('Easy', 'Mão na Roda'), 'easy', 'easy.png',
+     'easy,coordinate,table,layer,spreadsheet,excel,calc,csv,import,points'),
+    ('Easy_measures_layers', 'MeasureLayers', 'measure_layers',
+     ('Measure layers', 'Medir camadas'),
+     ('Easy', 'Mão na Roda'), 'easy', 'easy.png',
+     'measure,layer,area,perimeter,length,multiple,feet,meters,km,square'),
+    ('Rast_Bands2RGB', 'Bands2RGB', 'bands2rgb',
+     ('RGB composite', 'Composição RGB'),
+     ('Raster',), 'raster', 'raster.png',
+     'raster,rgb,composite,composition,bands,color'),
+    ('Rast_compressJPEG', 'CompressJPEG', 'compressjpeg',
+     ('JPEG compression', 'Compressão JPEG'),
+     ('Raster',), 'raster', 'raster.png',
+     'jpeg,jpg,compressão,compression,compress,photo,comprimir,compact'),
+    ('Rast_createHolesInRaster', 'CreateHolesInRaster', 'createholesinraster',
+     ('Create holes in raster', 'Esburacar raster'),
+     ('Raster',), 'raster', 'raster.png',
+     'hole,raster,cloud,remove,drone,patch'),
+    ('Rast_defineNullCell', 'DefineNullCell', 'definenullcell',
+     ('Define null cells', 'Definir pixel nulo'),
+     ('Raster',), 'raster', 'raster.png',
+     'null,none,empty,cell,pixel,raster'),
+    ('Rast_extractRasterBand', 'ExtractRasterBand', 'extractrasterband',
+     ('Extract raster band', 'Extrair banda de raster'),
+     ('Raster',), 'raster', 'raster.png',
+     'bands,raster,extract,color,spectral,frequency,RGB,composite,channel'),
+    ('Rast_fillRasterwithPatches', 'FillRasterwithPatches', 'fillrasterwithpatches',
+     ('Fill with patches', 'Remendar vazios de raster'),
+     ('Raster',), 'raster', 'raster.png',
+     'fill,hole,raster,cloud,remove,drone,patch'),
+    ('Rast_inventoryRaster', 'InventoryRaster', 'inventoryraster',
+     ('Raster data inventory', 'Inventário de dados raster'),
+     ('Raster',), 'raster', 'raster.png',
+     'list,raster,load,detect,organize,inventory,bounding'),
+    ('Rast_loadRasterByLocation', 'LoadRasterByLocation', 'loadrasterbylocation',
+     ('Load raster by location', 'Carregar raster pela localização'),
+     ('Raster',), 'raster', 'raster.png',
+     'load,detect,organize,location,bounding'),
+    ('Rast_mosaicRaster', 'MosaicRaster', 'mosaicraster',
+     ('Mosaic raster', 'Mosaicar raster'),
+     ('Raster',), 'raster', 'raster.png',
+     'mosaic,merge,raster,combine,mosaik,mosaico,mesclar'),
+    ('Drone_removeAlphaBand', 'RemoveAlphaBand', 'removealphaband',
+     ('Remove alpha band', 'Remover banda alfa'),
+     ('Drones',), 'drones', 'drone.png',
+     'alpha,band,remove,reduce,bands,compact,compress'),
+    ('Rast_rescaleTo8bits', 'RescaleTo8bits', 'rescaleto8bits',
+     ('Rescale to 8 bit', 'Reescalonar para 8 bits'),
+     ('Raster',), 'raster', 'raster.png',
+     '8bits,8 bits,rescale,radiometric,reduce,reduction,bits,linear,stretch'),
+    ('Rast_supervisedClassification', 'SupervisedClassification', 'supervisedclassification',
+     ('Supervised classification', 'Classificação supervisionada'),
+     ('Raster',), 'raster', 'raster.png',
+     'classification,supervised,ellipse,rectangle,mahalanobis,sphefere,covariance,statistics'),
+    ('Drone_saveAsJPEG', 'SaveAsJPEG', 'saveasjpeg',
+     ('Save as JPEG', 'Salvar como JPEG'),
+     ('Drones',), 'drones', 'drone.png',
+     'RGB,bands,jpeg,jpg,compact,compress,jpw,world'),
+    ('Rast_binaryThresholding', 'BinaryThresholding', 'binarythresholding',
+     ('Binary Thresholding', 'Limiarização Binária'),
+     ('Raster',), 'raster', 'raster.png',
+     'thresholding,binary,supervised,variance,mean,average,histogram,standard,statistics'),
+    ('Reamb_ImportPhotos', 'ImportPhotos', 'importphotos',
+     ('Photos with geotag', 'Fotos com geotag'),
+     ('Reambulation', 'Reambulação'), 'reambulation', 'reamb_camera.png',
+     'import,photo,reambulation,geotag,geophoto,reambulação,fotografia,photography'),
+    ('Vect_DirectionalMerge', 'DirectionalMerge', 'directionalmerge',
+     ('Merge lines in direction', 'Mesclar linhas na direção'),
+     ('Vector', 'Vetor'), 'vector', 'vetor.png',
+     'merge,dissolve,directional,touches,lines,connect,drainage,network'),
+    ('Vect_ExtendLines', 'ExtendLines', 'extendlines',
+     ('Extend lines', 'Estender linhas'),
+     ('Vector', 'Vetor'), 'vector', 'vetor.png',
+     'extend,cross,increase,segment,line,vector'),
+    ('Vect_PolygonAngles', 'CalculatePolygonAngles', 'calculatepolygonangles',
+     ('Calculate polygon angles', 'Calcular ângulos de polígono'),
+     ('Vector', 'Vetor'), 'vector', 'vetor.png',
+     'angle,angulo,medida,abertura,outer,inner,polygon,measure,topography,azimuth'),
+    ('Vect_reverseVertexOrder', 'ReverseVertexOrder', 'reversevertexorder',
+     ('Reverse vertex order', 'Inverter ordem dos vértices'),
+     ('Vector', 'Vetor'), 'vector', 'vetor.png',
+     'sequence,reverse,vertex,point,organize,topography'),
+    ('Vect_sequencePoints', 'SequencePoints', 'sequencepoints',
+     ('Sequence points', 'Sequenciar pontos'),
+     ('Vector', 'Vetor'), 'vector', 'vetor.png',
+     'sequence,reverse,vertex,point,organize,topography'),
+    ('Doc_AreaPerimeter', 'AreaPerimterReport', 'areaperimeter',
+     ('Area and perimeter report', 'Planilha de área e perímetro'),
+     ('Documents', 'Documentos'), 'documents', 'document.png',
+     'area,perimeter,descriptive,memorial,property,topography,survey,real,estate,georreferencing,plan,cadastral,cadastre,documnt'),
+    ('Doc_DescriptiveMemorial', 'DescriptiveMemorial', 'descriptivememorial',
+     ('Deed description', 'Memorial descritivo'),
+     ('Documents', 'Documentos'), 'documents', 'document.png',
+     'area,perimeter,deed,description,descriptive,memorial,property,topography,survey,real,estate,georreferencing,plan,cadastral,cadastre,documnt'),
+    ('Doc_MarkInformation', 'SurveyMarkDoc', 'surveymarkdoc',
+     ('Geodetic mark report', 'Monografia de marco geodésico'),
+     ('Documents', 'Documentos'), 'documents', 'document.png',
+     'monograph,mark,report,geodetic,descriptive,memorial,property,topography,survey,real,estate,georreferencing,plan,cadastral,cadastre,documnt'),
+    ('Doc_DescriptiveTable', 'DescriptiveTable', 'descriptivetable',
+     ('Synthetic deed description', 'Memorial sintético'),
+     ('Documents', 'Documentos'), 'documents', 'document.png',
+     'monograph,table,deed,description,geodetic,descriptive,syntetic,memorial,property,topography,survey,real,estate,georreferencing,plan,cadastral,cadastre,documnt'),
+    ('Post_Restore', 'Restore', 'restore',
+     ('Restore database', 'Restaurar BD'),
+     ('PostGIS',), 'postgis', 'postgis.png',
+     'postgis,postgresql,database,BD,DB,restore,backup,manager,export'),
+    ('Post_Backup', 'Backup', 'backup',
+     ('Backup database', 'Backup de BD'),
+     ('PostGIS',), 'postgis', 'postgis.png',
+     'postgis,postgresql,database,BD,DB,restore,backup,manager,export'),
+    ('Post_CloneDB', 'CloneDB', 'clonedb',
+     ('Clone database', 'Clonar BD'),
+     ('PostGIS',), 'postgis', 'postgis.png',
+     'postgis,postgresql,database,BD,DB,clone,backup,manager,copy,version,control'),
+    ('Post_DeleteDB', 'DeleteDB', 'deletedb',
+     ('Delete database', 'Deletar BD'),
+     ('PostGIS',), 'postgis', 'postgis.png',
+     'postgis,postgresql,database,BD,DB,delete,drop,manager,clean'),
+    ('Post_RenameDB', 'RenameDB', 'renamedb',
+     ('Rename database', 'Renomear BD'),
+     ('PostGIS',), 'postgis', 'postgis.png',
+     'postgis,postgresql,database,BD,DB,rename,change,manager,name,version,upadate'),
+    ('Post_ImportRaster', 'ImportRaster', 'importraster',
+     ('Import raster', 'Importar raster'),
+     ('PostGIS',), 'postgis', 'postgis.png',
+     'postgis,postgresql,database,BD,DB,import,raster,overview,tiling'),
+    ('Post_ChangeEnconding', 'ChangeEnconding', 'changeencoding',
+     ('Change SQL encoding', 'Trocar codificação de SQL'),
+     ('PostGIS',), 'postgis', 'postgis.png',
+     'postgis,postgresql,database,BD,DB,restore,backup,manager,import,encoding,sql,change'),
+    ('Drone_overviewsJPEG', 'OverviewsJPEG', 'overviewsjpeg',
+     ('Overviews with JPEG compression', 'Pirâmides com Compressão JPEG'),
+     ('Drones',), 'drones', 'drone.png',
+     'jpeg,jpg,compressão,compression,compress,photo,comprimir,compact'),
+    ('Drone_GeorrefAdjust', 'GeorrefAdjust', 'georrefadjust',
+     ('Georeferencing Adjustment', 'Ajuste do Georreferenciamento'),
+     ('Drones',), 'drones', 'drone.png',
+     'drone,mosaic,adjustment,raster,combine,mosaik,mosaico,georreferencing,georreferenciamento,ajuste,registry,registro,GCP,planimetrico,ground control points,pontos de controle'),
+    ('Rast_getPointValue', 'GetPointValue', 'getpointvalue',
+     ('Estimate point value from Raster', 'Estimar valor de ponto a partir de Raster'),
+     ('Raster',), 'raster', 'raster.png',
+     'sampling,sample,amostra,pegar,get,interpolate,interpolar,bilinear,cell'),
+    ('Drone_photosByBlocks', 'PhotosByBlocks', 'photosbyblocks',
+     ('Photos by blocks', 'Fotos por blocos'),
+     ('Drones',), 'drones', 'drone.png',
+     'drones,fotografia,photography,blocks,separate,separar,organize,organizar'),
+    ('Drone_copySelectedPhotos', 'CopySelectedPhotos', 'copyselectedphotos',
+     ('Copy selected files', 'Copiar arquivos selecionados'),
+     ('Drones',), 'drones', 'drone.png',
+     'drones,fotografia,photography,blocks,copy,copiar,separate,separar,organize,organizar,filtrar,filter'),
+    ('Drone_joinFolders', 'JoinFolders', 'joinfolders',
+     ('Join folders', 'Juntar pastas'),
+     ('Drones',), 'drones', 'drone.png',
+     'drones,fotografia,photography,blocks,join,juntar,organize,organizar'),
+    ('Drone_createGCPfile', 'CreateGCPfile', 'creategcpfile',
+     ('Generate GCP file from layer', 'Gerar arquivo de GCP a partir de camada'),
+     ('Drones',), 'drones', 'drone.png',
+     'drones,fotografia,photography,gcp,copy,points,control,ground,quality,homologous,controle,terreno'),
+    ('Drone_verticalAdjustment', 'VerticalAdjustment', 'verticaladjustment',
+     ('Vertical adjustment', 'Ajuste Vertical'),
+     ('Drones',), 'drones', 'drone.png',
+     'drone,model,modelo,mosaic,adjustment,raster,vertical,dem,dsm,mdt,georreferenciamento,ajuste,mds,dtm,GCP,ground control points,pontos de controle,elevation,terrain,surface'),
+    ('Relief_DEMfilter', 'DEMfilter', 'demfilter',
+     ('DEM filter', 'Filtro de MDE'),
+     ('Relief', 'Relevo'), 'relief', 'contours.png',
+     'dem,dsm,dtm,filtro,filtrar,smooth,suavizar,passa-baixa,mean,média,convolution,convolução,kernel,median,mde,mdt,mds,terreno,relevo,contour,curva de nível,isoline,isolinha,elevation,height,elevação'),
+    ('Relief_SpotElevation', 'SpotElevation', 'spotelevation',
+     ('Generate Spot Elevations', 'Gerar Pontos Cotados'),
+     ('Relief', 'Relevo'), 'relief', 'contours.png',
+     'dem,dsm,dtm,mde,mdt,mds,terreno,relevo,contours,curvas,nível,isoline,isolinha,ponto,cotado,spot,elevation,height'),
+    ('Vect_PolygonOrientation', 'PolygonOrientation', 'polygonorientation',
+     ('Orient polygons', 'Orientar polígonos'),
+     ('Vector', 'Vetor'), 'vector', 'vetor.png',
+     'cadastre,clockwise,counterclockwise,oriented,orientation,northmost'),
+    ('Easy_getAttributeByLocation', 'GetAttributeByLocation', 'getattributebylocation',
+     ('Get attribute by location', 'Pegar atributo pela localização'),
+     ('Easy', 'Mão na Roda'), 'easy', 'easy.png',
+     'easy,topologia,centroide,quadra,lote,parcel,setor,cadastro,cadastre,parcela,polígono'),
+    ('Rast_bandArithmetic', 'BandArithmetic', 'bandarithmetic',
+     ('Band Arithmetic', 'Aritmética de bandas'),
+     ('Raster',), 'raster', 'raster.png',
+     'raster,rgb,bands,color,algebra,arithmetic,aritmética,ndvi,gli,ndwi,index,índice'),
+    ('Gnss_NMEA2layer', 'NMEA2layer', 'nmea2layer',
+     ('NMEA to layer', 'NMEA para camada'),
+     ('GNSS', 'GNSS'), 'gnss', 'satellite.png',
+     'gps,navigation,satellites,surveying,glonass,beidou,compass,galileu,track,kinematic,rtk,ntrip,static'),
+    ('Reamb_ResizePhotos', 'ResizePhotos', 'resizephotos',
+     ('Resize photos', 'Redimensionar fotos'),
+     ('Reambulation', 'Reambulação'), 'reambulation', 'reamb_camera.png',
+     'resized,photo,reambulation,redimensionar,geophoto,reambulação,fotografia,photography,diminuir,reduzir,compactar,foto'),
+    ('Rast_rgb2hsv', 'RGB2HSV', 'rgb2hsv',
+     ('RGB to HSV', 'RGB para HSV'),
+     ('Raster',), 'raster', 'raster.png',
+     'bands,raster,RGB,color,HSV,composite,hue,saturation,value,intensity,matiz,saturação,intensidade,valor'),
+    ('Cad_GeoNumbering', 'GeoNumbering', 'geonumbering',
+     ('Geographic Numbering', 'Numerar geograficamente'),
+     ('Cadastre', 'Cadastro'), 'cadastro', 'cadastre.png',
+     'cadastro,geographic,sequence,north,south,east,west,number,code,codificar,organize,system'),
+    ('Cad_FrontLotLine', 'FrontLotLine', 'frontlotline',
+     ('Front Lot Lines', 'Linhas de Testada'),
+     ('Cadastre', 'Cadastro'), 'cadastro', 'cadastre.png',
+     'cadastro,sequence,number,code,codificar,organize,system,lot,line,front,cadastre,street,borderer,testada,linha'),
+)
+
+
+class LazyAlgorithm(QgsProcessingAlgorithm):
+    """
+    Lightweight algorithm registered in the toolbox using only the metadata
+    of ALGORITMOS. The real algorithm is imported on createInstance().
+    """
+
+    LOC = QgsApplication.locale()[:2]
+
+    def __init__(self, modulo, classe, nome, nome_exibido, grupo, grupo_id, icone, tags):
+        super().__init__()
+        self._modulo = modulo
+        self._classe = classe
+        self._nome = nome
+        self._nome_exibido = nome_exibido
+        self._grupo = grupo
+        self._grupo_id = grupo_id
+        self._icone = icone
+        self._tags = tags
+        self._algoritmo = None
+        self._definicoes = False
+
+    def translate(self, string):
+        return QCoreApplication.translate('Processing', string)
+
+    def tr(self, *string):
+        # Traduzir para o portugês: arg[0] - english (translate), arg[1] - português
+        if self.LOC == 'pt':
+            if len(string) == 2:
+                return string[1]
+            else:
+                return self.translate(string[0])
+        else:
+            return self.translate(string[0])
+
+    def algorithmClass(self):
+        modulo = import_module('lftools.processing_provider.' + self._modulo)
+        return getattr(modulo, self._classe)
+
+    def algorithm(self):
+        # Instância real, usada para a ajuda e as definições de parâmetros e saídas
+        if self._algoritmo is None:
+            self._algoritmo = self.algorithmClass()()
+            self._algoritmo.initAlgorithm()
+        return self._algoritmo
+
+    def carregarDefinicoes(self):
+        # Na primeira consulta, copiar os parâmetros e as saídas da classe real
+        if self._definicoes:
+            return
+        self._definicoes = True
+        real = self.algorithm()
+        for param in real.parameterDefinitions():
+            self.addParameter(param.clone(), False)
+        for saida in real.outputDefinitions():
+            if isinstance(saida, QgsProcessingOutputVectorLayer):
+                self.addOutput(QgsProcessingOutputVectorLayer(saida.name(), saida.description(), saida.dataType()))
+            else:
+                self.addOutput(type(saida)(saida.name(), saida.description()))
+
+    def parameterDefinitions(self):
+        self.carregarDefinicoes()
+        return super().parameterDefinitions()
+
+    def parameterDefinition(self, nome):
+        self.carregarDefinicoes()
+        return super().parameterDefinition(nome)
+
+    def destinationParameterDefinitions(self):
+        self.carregarDefinicoes()
+        return super().destinationParameterDefinitions()
+
+    def outputDefinitions(self):
+        self.carregarDefinicoes()
+        return super().outputDefinitions()
+
+    def outputDefinition(self, nome):
+        self.carregarDefinicoes()
+        return super().outputDefinition(nome)
+
+    def createInstance(self):
+        return self.algorithmClass()()
+
+    def name(self):
+        return self._nome
+
+    def displayName(self):
+        return self.tr(*self._nome_exibido)
+
+    def group(self):
+        return self.tr(*self._grupo)
+
+    def groupId(self):
+        return self._grupo_id
+
+    def tags(self):
+        return self.tr(self._tags).split(',')
+
+    def icon(self):
+        return QIcon(os.path.join(os.path.dirname(__file__), 'images', self._icone))
+
+    def shortHelpString(self):
+        return self.algorithm().shortHelpString()
+
+    def initAlgorithm(self, config=None):
+        # Definições carregadas sob demanda (carregarDefinicoes), para não importar o módulo na inicialização
+        pass
+
+    def processAlgorithm(self, parameters, context, feedback):
+        # O Processing executa sempre a instância real criada por create(), que também
+        # faz o prepareAlgorithm e o postProcessAlgorithm
+        raise QgsProcessingException(self.tr('Run this algorithm through an instance created by create().', 'Execute este algoritmo por meio de uma instância criada por create().'))
 
 
 class LFToolsProvider(QgsProcessingProvider):
@@ -114,69 +431,8 @@ class LFToolsProvider(QgsProcessingProvider):
         pass
 
     def loadAlgorithms(self):
-
-        self.addAlgorithm(Inom2utmGrid())
-        self.addAlgorithm(Coord2UTMGrid())
-        self.addAlgorithm(Extent2UTMGrid())
-        self.addAlgorithm(ClosedPolygonal())
-        self.addAlgorithm(Estimate3dCoord())
-        self.addAlgorithm(CoordTransf2D())
-        self.addAlgorithm(LocalTangentPlane())
-        self.addAlgorithm(TraverseAdjustment())
-        self.addAlgorithm(ConfidenceEllipse())
-        self.addAlgorithm(RandomDist())
-        self.addAlgorithm(CoordinatesToLayer())
-        self.addAlgorithm(MeasureLayers())
-        self.addAlgorithm(Bands2RGB())
-        self.addAlgorithm(CompressJPEG())
-        self.addAlgorithm(CreateHolesInRaster())
-        self.addAlgorithm(DefineNullCell())
-        self.addAlgorithm(ExtractRasterBand())
-        self.addAlgorithm(FillRasterwithPatches())
-        self.addAlgorithm(InventoryRaster())
-        self.addAlgorithm(LoadRasterByLocation())
-        self.addAlgorithm(MosaicRaster())
-        self.addAlgorithm(RemoveAlphaBand())
-        self.addAlgorithm(RescaleTo8bits())
-        self.addAlgorithm(SupervisedClassification())
-        self.addAlgorithm(ImportPhotos())
-        self.addAlgorithm(DirectionalMerge())
-        self.addAlgorithm(ExtendLines())
-        self.addAlgorithm(CalculatePolygonAngles())
-        self.addAlgorithm(ReverseVertexOrder())
-        self.addAlgorithm(SequencePoints())
-        self.addAlgorithm(AreaPerimterReport())
-        self.addAlgorithm(DescriptiveMemorial())
-        self.addAlgorithm(SurveyMarkDoc())
-        self.addAlgorithm(DescriptiveTable())
-        self.addAlgorithm(AzimuthDistance())
-        self.addAlgorithm(Restore())
-        self.addAlgorithm(Backup())
-        self.addAlgorithm(CloneDB())
-        self.addAlgorithm(DeleteDB())
-        self.addAlgorithm(RenameDB())
-        self.addAlgorithm(ImportRaster())
-        self.addAlgorithm(ChangeEnconding())
-        self.addAlgorithm(SaveAsJPEG())
-        self.addAlgorithm(BinaryThresholding())
-        self.addAlgorithm(OverviewsJPEG())
-        self.addAlgorithm(GeorrefAdjust())
-        self.addAlgorithm(GetPointValue())
-        self.addAlgorithm(PhotosByBlocks())
-        self.addAlgorithm(CopySelectedPhotos())
-        self.addAlgorithm(JoinFolders())
-        self.addAlgorithm(CreateGCPfile())
-        self.addAlgorithm(VerticalAdjustment())
-        self.addAlgorithm(DEMfilter())
-        self.addAlgorithm(SpotElevation())
-        self.addAlgorithm(PolygonOrientation())
-        self.addAlgorithm(GetAttributeByLocation())
-        self.addAlgorithm(BandArithmetic())
-        self.addAlgorithm(NMEA2layer())
-        self.addAlgorithm(ResizePhotos())
-        self.addAlgorithm(RGB2HSV())
-        self.addAlgorithm(GeoNumbering())
-        self.addAlgorithm(FrontLotLine())
+        for registro in ALGORITMOS:
+            self.addAlgorithm(LazyAlgorithm(*registro))
 
     def id(self):
         return 'lftools'
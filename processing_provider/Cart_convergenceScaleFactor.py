@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cart_convergenceScaleFactor.py
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-19'
+__copyright__ = '(C) 2026, Leandro França'
+
+from PyQt5.QtCore import QCoreApplication, QVariant
+from qgis.core import (QgsProcessing,
+                       QgsField,
+                       QgsProcessingException,
+                       QgsProcessingAlgorithm,
+                       QgsProcessingParameterFeatureSource,
+                       QgsProcessingParameterFeatureSink,
+                       QgsApplication,
+                       QgsCoordinateReferenceSystem)
+from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.cartography import (FusoHemisfArray,
+                                         CentralMeridianArray,
+                                         MeridianConvergenceArray,
+                                         ScaleFactorArray,
+                                         PontosArray,
+                                         GravarEmLotes,
+                                         TransformadorProj)
+import numpy as np
+import os
+from qgis.PyQt.QtGui import QIcon
+
+class ConvergenceScaleFactor(QgsProcessingAlgorithm):
+
+    LOC = QgsApplication.locale()[:2]
+
+    def translate(self, string):
+        return QCoreApplication.translate('Processing', string)
+
+    def tr(self, *string):
+        # Traduzir para o portugês: arg[0] - english (translate), arg[1] - português
+        if self.LOC == 'pt':
+            if len(string) == 2:
+                return string[1]
+            else:
+                return self.translate(string[0])
+        else:
+            return self.translate(string[0])
+
+    def createInstance(self):
+        return ConvergenceScaleFactor()
+
+    def name(self):
+        return 'convergencescalefactor'
+
+    def displayName(self):
+        return self.tr('Meridian convergence and scale factor', 'Convergência meridiana e fator de escala')
+
+    def group(self):
+        return self.tr('Cartography', 'Cartografia')
+
+    def groupId(self):
+        return 'cartography'
+
+    def tags(self):
+        return self.tr('meridian,convergence,scale,factor,kappa,utm,zone,central,convergência,meridiana,fator,escala,fuso,meridiano central,hemisfério').split(',')
+
+    def icon(self):
+        return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/cart_frame.png'))
+
+    txt_en = 'This algorithm adds the <b>UTM zone</b>, <b>hemisphere</b>, <b>central meridian</b>, <b>meridian convergence</b> and <b>scale factor</b> of every feature of a point layer, computing all features at once.'
+    txt_pt = 'Este algoritmo adiciona o <b>fuso UTM</b>, <b>hemisfério</b>, <b>meridiano central</b>, <b>convergência meridiana</b> e <b>fator de escala</b> de todas as feições de uma camada de pontos, calculando todas as feições de uma só vez.'
+
+    def shortHelpString(self):
+        social_BW = Imgs().social_BW
+        footer = '''<div align="right">
+                      <p align="right">
+                      <b>'''+self.tr('Author: Leandro Franca', 'Autor: Leandro França')+'''</b>
+                      </p>'''+ social_BW + '''</div>
+                    </div>'''
+        return self.tr(self.txt_en, self.txt_pt) + footer
+
+    INPUT = 'INPUT'
+    OUTPUT = 'OUTPUT'
+
+    def initAlgorithm(self, config=None):
+        # INPUT
+        self.addParameter(
+            QgsProcessingParameterFeatureSource(
+                self.INPUT,
+                self.tr('Point layer', 'Camada de pontos'),
+                [QgsProcessing.TypeVectorPoint]
+            )
+        )
+
+        # OUTPUT
+        self.addParameter(
+            QgsProcessingParameterFeatureSink(
+                self.OUTPUT,
+                self.tr('Points with convergence and scale factor', 'Pontos com convergência e fator de escala')
+            )
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        # INPUT
+        source = self.parameterAsSource(
+            parameters,
+            self.INPUT,
+            context
+        )
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.INPUT))
+
+        # OUTPUT
+        Fields = source.fields()
+        itens  = {
+                     self.tr('zone', 'fuso') : QVariant.Int,
+                     self.tr('hemisphere', 'hemisferio') : QVariant.String,
+                     self.tr('central_meridian', 'meridiano_central') : QVariant.Int,
+                     self.tr('meridian_conv', 'conv_meridiana') : QVariant.Double,
+                     self.tr('scale_factor', 'fator_escala') : QVariant.Double,
+                     }
+        for item in itens:
+            Fields.append(QgsField(item, itens[item]))
+
+        (sink, dest_id) = self.parameterAsSink(
+            parameters,
+            self.OUTPUT,
+            context,
+            Fields,
+            source.wkbType(),
+            source.sourceCrs()
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+
+        # Leitura das feições e coordenadas
+        feedback.pushInfo(self.tr('Reading coordinates...', 'Lendo coordenadas...'))
+        feicoes, X, Y = PontosArray(source.getFeatures(), feedback)
+        if feedback.isCanceled():
+            return {}
+
+        # Coordenadas geodésicas
+        crs = source.sourceCrs()
+        crsGeo = QgsCoordinateReferenceSystem(crs.geographicCrsAuthId())
+        if crs.isGeographic():
+            lon, lat = X, Y
+        else:
+            lon, lat = TransformadorProj(crs, crsGeo).transform(X, Y)
+            lon, lat = np.asarray(lon), np.asarray(lat)
+
+        # Cálculo vetorizado
+        feedback.pushInfo(self.tr('Calculating...', 'Calculando...'))
+        validos = np.isfinite(lon) & np.isfinite(lat)
+        # coordenadas inválidas substituídas por zero (linhas gravadas como nulas)
+        lon = np.where(validos, lon, 0)
+        lat = np.where(validos, lat, 0)
+        fuso, hemisf = FusoHemisfArray(lon, lat)
+        MC = CentralMeridianArray(lon)
+        conv = MeridianConvergenceArray(lon, lat, crsGeo)
+        kappa = ScaleFactorArray(lon, lat)
+
+        # Gravação em lotes
+        def novos_atributos(k):
+            if validos[k]:
+                return [int(fuso[k]), str(hemisf[k]), int(MC[k]), float(conv[k]), float(kappa[k])]
+            return [None]*5
+        GravarEmLotes(sink, Fields, feicoes, novos_atributos, feedback)
+
+        feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
+        feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
+        return {self.OUTPUT: dest_id}
@@ -217,7 +217,7 @@ class Coord2UTMGrid(QgsProcessingAlgorithm):
         geom = QgsGeometry.fromPolygonXY(coord)
         # Coordinate Transformations (if needed)
         geom = geom if crs.isGeographic() else reprojectPoints(geom, coordinateTransformer)
-        inom = map_sistem(lon, lat, escala)
+        inom = str(inomArray(lon, lat, escala))
         feedback.pushInfo(self.tr('Nomenclature Index', 'Índice de Nomenclatura') + ': {}'.format(inom))
 
         # INOM para MI
@@ -19,6 +19,7 @@ from PyQt5.QtCore import QCoreApplication, QVariant
 from qgis.core import *
 from lftools.geocapt.imgs import Imgs
 from lftools.geocapt.cartography import *
+import numpy as np
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -280,10 +281,13 @@ class Extent2UTMGrid(QgsProcessingAlgorithm):
         LON = arange(lon_min + 1e-10 - d_lon, lon_max + 1e-10 + d_lon, d_lon)
         LAT = arange(lat_min + 1e-10 - d_lat, lat_max+ 1e-10 + d_lat, d_lat)
 
+        # Índices de nomenclatura de todas as folhas de uma só vez
+        INOM = inomArray(LON[:, np.newaxis], LAT[np.newaxis, :], escala)
+
         Percent = 100.0/(len(LON)*len(LAT))
         current = 0
-        for lon in LON:
-            for lat in LAT:
+        for i, lon in enumerate(LON):
+            for j, lat in enumerate(LAT):
                 if lon>=0:
                     lon0 = modf(lon/d_lon)[1]*d_lon
                 else:
@@ -302,7 +306,7 @@ class Extent2UTMGrid(QgsProcessingAlgorithm):
                 feat = QgsFeature(Fields)
                 geom = QgsGeometry.fromPolygonXY(coord)
                 centroide = geom.centroid().asPoint()
-                inom = map_sistem(lon, lat, escala)
+                inom = str(INOM[i, j])
                 # INOM para MI
                 dicionario = inom2mi
                 # Indice de Nomenclatura
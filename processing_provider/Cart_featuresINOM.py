@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cart_featuresINOM.py
+***************************************************************************
+*                                                                         *
+*   This program is free software; you can redistribute it and/or modify  *
+*   it under the terms of the GNU General Public License as published by  *
+*   the Free Software Foundation; either version 2 of the License, or     *
+*   (at your option) any later version.                                   *
+*                                                                         *
+***************************************************************************
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-19'
+__copyright__ = '(C) 2026, Leandro França'
+
+from PyQt5.QtCore import QCoreApplication, QVariant
+from qgis.core import (QgsProcessing,
+                       QgsField,
+                       QgsProcessingException,
+                       QgsProcessingAlgorithm,
+                       QgsProcessingParameterFeatureSource,
+                       QgsProcessingParameterFeatureSink,
+                       QgsProcessingParameterEnum,
+                       QgsApplication,
+                       QgsCoordinateReferenceSystem)
+from lftools.geocapt.imgs import Imgs
+from lftools.geocapt.cartography import (inomArray,
+                                         inom2miArray,
+                                         PontosArray,
+                                         GravarEmLotes,
+                                         TransformadorProj)
+import numpy as np
+import os
+from qgis.PyQt.QtGui import QIcon
+
+class FeaturesINOM(QgsProcessingAlgorithm):
+
+    LOC = QgsApplication.locale()[:2]
+
+    def translate(self, string):
+        return QCoreApplication.translate('Processing', string)
+
+    def tr(self, *string):
+        # Traduzir para o portugês: arg[0] - english (translate), arg[1] - português
+        if self.LOC == 'pt':
+            if len(string) == 2:
+                return string[1]
+            else:
+                return self.translate(string[0])
+        else:
+            return self.translate(string[0])
+
+    def createInstance(self):
+        return FeaturesINOM()
+
+    def name(self):
+        return 'featuresinom'
+
+    def displayName(self):
+        return self.tr('Chart index of features', 'Índice de cartas das feições')
+
+    def group(self):
+        return self.tr('Cartography', 'Cartografia')
+
+    def groupId(self):
+        return 'cartography'
+
+    def tags(self):
+        return self.tr('inom,mi,chart,index,nomenclature,map,sheet,grid,utm,carta,índice,nomenclatura,mapa,folha,articulação').split(',')
+
+    def icon(self):
+        return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/cart_frame.png'))
+
+    txt_en = 'This algorithm adds the <b>Nomenclature Index</b> (INOM) and the <b>Map Index</b> (MI) of the chart of the Brazilian Mapping System, at the chosen scale, that contains each feature of a layer. Points use their own position and other geometries use their centroid. All features are calculated at once.'
+    txt_pt = 'Este algoritmo adiciona o <b>Índice de Nomenclatura</b> (INOM) e o <b>Mapa Índice</b> (MI) da carta do Sistema Cartográfico Nacional, na escala escolhida, que contém cada feição de uma camada. Pontos utilizam a sua própria posição e as demais geometrias utilizam o seu centroide. Todas as feições são calculadas de uma só vez.'
+
+    def shortHelpString(self):
+        social_BW = Imgs().social_BW
+        footer = '''<div align="right">
+                      <p align="right">
+                      <b>'''+self.tr('Author: Leandro Franca', 'Autor: Leandro França')+'''</b>
+                      </p>'''+ social_BW + '''</div>
+                    </div>'''
+        return self.tr(self.txt_en, self.txt_pt) + footer
+
+    INPUT = 'INPUT'
+    SCALE = 'SCALE'
+    OUTPUT = 'OUTPUT'
+
+    def initAlgorithm(self, config=None):
+        # INPUT
+        self.addParameter(
+            QgsProcessingParameterFeatureSource(
+                self.INPUT,
+                self.tr('Input layer', 'Camada de entrada'),
+                [QgsProcessing.TypeVectorAnyGeometry]
+            )
+        )
+
+        scales = [self.tr('1:1,000,000','1:1.000.000'),
+                  self.tr('1:500,000','1:500.000'),
+                  self.tr('1:250,000','1:250.000'),
+                  self.tr('1:100,000','1:100.000'),
+                  self.tr('1:50,000','1:50.000'),
+                  self.tr('1:25,000','1:25.000'),
+                  self.tr('1:10,000','1:10.000'),
+                  self.tr('1:5,000','1:5.000'),
+                  self.tr('1:2,000','1:2.000'),
+                  self.tr('1:1,000','1:1.000')
+               ]
+
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.SCALE,
+                self.tr('Scale', 'Escala'),
+                options = scales,
+                defaultValue= 3
+            )
+        )
+
+        # OUTPUT
+        self.addParameter(
+            QgsProcessingParameterFeatureSink(
+                self.OUTPUT,
+                self.tr('Features with chart index', 'Feições com índice de cartas')
+            )
+        )
+
+    def processAlgorithm(self, parameters, context, feedback):
+        # INPUT
+        source = self.parameterAsSource(
+            parameters,
+            self.INPUT,
+            context
+        )
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.INPUT))
+
+        escala = self.parameterAsEnum(
+            parameters,
+            self.SCALE,
+            context
+        )
+        # Escala
+        escalas = [1e6, 500e3, 250e3, 100e3, 50e3, 25e3, 10e3, 5e3, 2e3, 1e3]
+        escala = escalas[escala]
+
+        # OUTPUT
+        Fields = source.fields()
+        Fields.append(QgsField('inom', QVariant.String))
+        Fields.append(QgsField('mi', QVariant.String))
+
+        (sink, dest_id) = self.parameterAsSink(
+            parameters,
+            self.OUTPUT,
+            context,
+            Fields,
+            source.wkbType(),
+            source.sourceCrs()
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+
+        # Leitura das feições e coordenadas
+        feedback.pushInfo(self.tr('Reading coordinates...', 'Lendo coordenadas...'))
+        feicoes, X, Y = PontosArray(source.getFeatures(), feedback)
+        if feedback.isCanceled():
+            return {}
+        n = len(feicoes)
+
+        # Coordenadas geodésicas
+        crs = source.sourceCrs()
+        if crs.isGeographic():
+            lon, lat = X, Y
+        else:
+            crsGeo = QgsCoordinateReferenceSystem(crs.geographicCrsAuthId())
+            lon, lat = TransformadorProj(crs, crsGeo).transform(X, Y)
+            lon, lat = np.asarray(lon), np.asarray(lat)
+
+        # Cálculo vetorizado
+        feedback.pushInfo(self.tr('Calculating...', 'Calculando...'))
+        validos = np.isfinite(lon) & np.isfinite(lat)
+        validos &= (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+        inom = np.full(n, None, dtype=object)
+        mi = np.full(n, None, dtype=object)
+        if validos.any():
+            inom[validos] = inomArray(lon[validos] + 1e-10, lat[validos] + 1e-10, escala).astype(object) # evitar as interseções da grade
+            if escala <= 100e3:
+                mi[validos] = inom2miArray(inom[validos].astype(str))
+
+        # Gravação em lotes
+        GravarEmLotes(sink, Fields, feicoes, lambda k: [inom[k], mi[k]], feedback)
+
+        feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
+        feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
+        return {self.OUTPUT: dest_id}
@@ -25,8 +25,10 @@ from PyQt5.QtCore import QCoreApplication
 from qgis.core import (QgsProcessing,
                        QgsFeatureSink,
                        QgsProcessingException,
+                       QgsFeatureRequest,
                        QgsProcessingAlgorithm,
                        QgsProcessingParameterFeatureSource,
+                       QgsProcessingParameterField,
                        QgsProcessingParameterFile,
                        QgsProcessingParameterString,
                        QgsProcessingParameterNumber,
@@ -35,13 +37,14 @@ from qgis.core import (QgsProcessing,
                        QgsProcessingParameterFileDestination,
                        QgsApplication,
                        QgsProject,
-                       QgsCoordinateTransform,
                        QgsCoordinateReferenceSystem)
-from math import atan, pi, sqrt, floor
+from math import atan, floor
 import math
 from lftools.geocapt.imgs import *
-from lftools.geocapt.cartography import FusoHemisf
-from lftools.geocapt.topogeo import str2HTML, dd2dms, azimute
+from lftools.geocapt.cartography import FusoHemisf, TabelaVertices, azimutesDistancias
+from lftools.geocapt.topogeo import (str2HTML, dd2dmsArray, Modelo,
+                                     agruparPorChave, nomesArquivosHTML,
+                                     executarEmLote, indiceHTML)
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -54,6 +57,8 @@ class AreaPerimterReport(QgsProcessingAlgorithm):
     SLOGAN = 'SLOGAN'
     DECIMAL = 'DECIMAL'
     PROJECTION = 'PROJECTION'
+    KEY = 'KEY'
+    FOLDER = 'FOLDER'
 
     LOC = QgsApplication.locale()[:2]
 
@@ -92,8 +97,8 @@ class AreaPerimterReport(QgsProcessingAlgorithm):
         return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/document.png'))
 
     figure = 'images/tutorial/doc_analytical_results.jpg'
-    txt_en = 'This tool generates a Report for the Analytical Calculation of Area, Azimuths, Polygon Sides, UTM Projection and Geodetic Coordinates of a Property.'
-    txt_pt = 'Esta gera o Relatório de Cálculo Analítico de Área, Azimutes, Lados, Coordenadas Planas e Geodésicas de um Imóvel.'
+    txt_en = 'This tool generates a Report for the Analytical Calculation of Area, Azimuths, Polygon Sides, UTM Projection and Geodetic Coordinates of a Property. When a <b>property key field</b> is chosen, one report is generated for each property of the polygon layer in the chosen folder, with the points that have the same key, and the output HTML lists the generated files.'
+    txt_pt = 'Esta gera o Relatório de Cálculo Analítico de Área, Azimutes, Lados, Coordenadas Planas e Geodésicas de um Imóvel. Quando um <b>campo chave do imóvel</b> é escolhido, é gerado um relatório para cada imóvel da camada de polígonos na pasta escolhida, com os pontos que possuem a mesma chave, e o HTML de saída lista os arquivos gerados.'
 
     def shortHelpString(self):
         social_BW = Imgs().social_BW
@@ -169,6 +174,25 @@ class AreaPerimterReport(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterField(
+                self.KEY,
+                self.tr('Property key field (one report per property)', 'Campo chave do imóvel (um relatório por imóvel)'),
+                parentLayerParameterName=self.AREAIMOVEL,
+                optional = True
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterFile(
+                self.FOLDER,
+                self.tr('Folder for the reports of each property', 'Pasta para os relatórios de cada imóvel'),
+                behavior=QgsProcessingParameterFile.Folder,
+                defaultValue=None,
+                optional = True
+            )
+        )
+
         # 'OUTPUTS'
         self.addParameter(
             QgsProcessingParameterFileDestination(
@@ -201,7 +225,7 @@ class AreaPerimterReport(QgsProcessingAlgorithm):
         if logo:
             LOGO = 'jpg;base64,'+img2html_resized(logo, lado=380)
         else:
-            LOGO = 'png;base64,'+lftools_logo
+            LOGO = 'png;base64,'+Imgs().lftools_logo
 
         SLOGAN = self.parameterAsString(
             parameters,
@@ -230,22 +254,92 @@ class AreaPerimterReport(QgsProcessingAlgorithm):
         format_num = '{:,.Xf}'.replace('X', str(decimal))
 
         # Pegando o SRC do Projeto
-        SRC = QgsProject.instance().crs().description()
+        crs_projeto = QgsProject.instance().crs()
+        SRC = crs_projeto.description()
 
         # Verificando o SRC do Projeto
-        if QgsProject.instance().crs().isGeographic():
+        if crs_projeto.isGeographic():
             raise QgsProcessingException(self.tr('The Project CRS must be projected!', 'O SRC do Projeto deve ser Projetado!'))
         feedback.pushInfo(self.tr('Project CRS is {}.', 'SRC do Projeto é {}.').format(SRC))
 
-        # Transformar Coordenadas de Geográficas para o sistema UTM
-        coordinateTransformer = QgsCoordinateTransform()
-        coordinateTransformer.setDestinationCrs(QgsProject.instance().crs())
-        coordinateTransformer.setSourceCrs(area.sourceCrs())
+        chave = self.parameterAsFields(
+            parameters,
+            self.KEY,
+            context
+        )
+
+        pasta = self.parameterAsFile(
+            parameters,
+            self.FOLDER,
+            context
+        )
+
+        opcoes = (area.sourceCrs(), area.fields(), LOGO, SLOGAN, format_num, projecao, SRC, crs_projeto)
+
+        output = self.parameterAsFileOutput(parameters, self.HTML, context)
+
+        if not chave:
+            # Dados do levantamento
+            feat1 = next(area.getFeatures(QgsFeatureRequest().setLimit(1)))
+            LINHAS = self.relatorio(feat1, list(vertices.getFeatures()), *opcoes)
 
+            # Check for cancelation
+            if feedback.isCanceled():
+                return {}
+
+            arq = open(output, 'w')
+            arq.write(LINHAS)
+            arq.close()
+
+        else:
+            # Um relatório por imóvel, agrupando os vértices pelo campo chave
+            chave = chave[0]
+            if not pasta:
+                raise QgsProcessingException(self.invalidSourceError(parameters, self.FOLDER))
+            if vertices.fields().indexFromName(chave) < 0:
+                raise QgsProcessingException(self.tr('The key field "{}" must exist in all input layers!', 'O campo chave "{}" deve existir em todas as camadas de entrada!').format(chave))
+            feedback.pushInfo(self.tr('Grouping features by key...', 'Agrupando feições pela chave...'))
+            pontos_imovel = agruparPorChave(vertices.getFeatures(), chave)
+            imoveis = list(area.getFeatures())
+
+            nomes = nomesArquivosHTML(pasta, self.tr('area_perimeter_', 'area_perimetro_'), [feat1[chave] for feat1 in imoveis])
+
+            def gerar(item):
+                feat1, arquivo = item
+                valor = feat1[chave]
+                LINHAS = self.relatorio(feat1, pontos_imovel.get(valor, []), *opcoes)
+                arq = open(arquivo, 'w')
+                arq.write(LINHAS)
+                arq.close()
+                return arquivo
+
+            feedback.pushInfo(self.tr('Generating {} reports...', 'Gerando {} relatórios...').format(len(imoveis)))
+            arquivos, erros = executarEmLote(gerar, list(zip(imoveis, nomes)), feedback)
+
+            # Check for cancelation
+            if feedback.isCanceled():
+                return {}
+
+            gerados = []
+            for feat1, arquivo, erro in zip(imoveis, arquivos, erros):
+                if erro is not None:
+                    feedback.reportError(self.tr('Property {}: {}', 'Imóvel {}: {}').format(feat1[chave], erro))
+                elif arquivo:
+                    gerados += [(feat1[chave], arquivo)]
+            feedback.pushInfo(self.tr('{} of {} reports saved in {}', '{} de {} relatórios salvos em {}').format(len(gerados), len(imoveis), pasta))
+            arq = open(output, 'w')
+            arq.write(indiceHTML(self.tr('Area and Perimeter Calculation', str2HTML('Cálculo de Área e Perímetro')), gerados, output))
+            arq.close()
+
+        feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
+        feedback.pushInfo(self.tr('Leandro França - Cartographic Engineer', 'Leandro França - Eng Cart'))
+
+        return {self.HTML: output}
+
+
+    def relatorio(self, feat1, lista_vertices, crs_area, campos_area, LOGO, SLOGAN, format_num, projecao, SRC, crs_projeto):
+        # Cálculo analítico de área e perímetro de um imóvel a partir dos seus vértices
         # Dados do levantamento
-        for feat in area.getFeatures():
-                feat1 = feat
-                break
         geom = feat1.geometry()
         centroideG = geom.centroid().asPoint()
 
@@ -257,18 +351,13 @@ class AreaPerimterReport(QgsProcessingAlgorithm):
 
         # Validando dados de entrada
         # ponto_limite
-        ordem_list = list(range(1,vertices.featureCount()+1))
-        ordem_comp = []
-        for feat in vertices.getFeatures():
-            ordem_comp += [feat['sequence']]
-            codigo_item = feat['code']
-            if not codigo_item or codigo_item in ['', ' ']:
-                raise QgsProcessingException(self.tr('The code attribute must be filled in for all features!', 'O atributo código deve ser preenchido para todas as feições!'))
-        ordem_comp.sort()
-        if ordem_list != ordem_comp:
+        tabela = TabelaVertices(lista_vertices, campos=('code',))
+        if not tabela.preenchido('code'):
+            raise QgsProcessingException(self.tr('The code attribute must be filled in for all features!', 'O atributo código deve ser preenchido para todas as feições!'))
+        if not tabela.sequenciaValida:
             raise QgsProcessingException(self.tr('The point sequence field must be filled in correctly!', 'O campo de sequência dos pontos deve preenchido corretamente!'))
         # area_imovel
-        Fields = area.fields()
+        Fields = campos_area
         fieldnames = [field.name() for field in Fields]
         for fieldname in fieldnames:
             att = feat1[fieldname]
@@ -349,62 +438,39 @@ SIRGAS2000<br>
                     '[UTM]': (SRC.split('/')[-1]).replace('zone', 'fuso'),
                     '[MUNICIPIO]': str2HTML(feat1['county']),
                     }
-        for item in itens:
-                INICIO = INICIO.replace(item, itens[item])
+        INICIO = Modelo(INICIO).preencher(itens)
 
         # Inserindo dados finais do levantamento
         itens = {   '[AREA]': self.tr(format_num.format(feat1['area']), format_num.format(feat1['area']).replace(',', 'X').replace('.', ',').replace('X', '.')),
                     '[AREA_HA]': self.tr(format_num.format(feat1['area']/1e4), format_num.format(feat1['area']/1e4).replace(',', 'X').replace('.', ',').replace('X', '.')),
                     '[PERIMETRO]': self.tr(format_num.format(feat1['perimeter']), format_num.format(feat1['perimeter']).replace(',', 'X').replace('.', ',').replace('X', '.'))
                     }
-        for item in itens:
-                FIM = FIM.replace(item, itens[item])
-
-        LINHAS = INICIO
+        FIM = Modelo(FIM).preencher(itens)
 
-        pnts_UTM = {}
-        for feat in vertices.getFeatures():
-            pnt = feat.geometry().asPoint()
-            pnts_UTM[feat['sequence']] = [coordinateTransformer.transform(pnt), feat['code'], pnt]
+        # Transformar Coordenadas de Geográficas para o sistema UTM
+        E, N = tabela.projetar(crs_area, crs_projeto)
+        codigos = tabela['code']
 
         # Cálculo dos Azimutes e Distâncias
-        tam = len(pnts_UTM)
-        Az_lista, Dist = [], []
+        tam = tabela.n
+        Az_lista, Dist = azimutesDistancias(E, N)
+        Az_txt = dd2dmsArray(Az_lista, 1)
+        Lon_txt = dd2dmsArray(tabela.x, 4)
+        Lat_txt = dd2dmsArray(tabela.y, 4)
+
+        modelo_linha = Modelo(linha)
+        LINHAS = []
         for k in range(tam):
-            pntA = pnts_UTM[k+1][0]
-            pntB = pnts_UTM[1 if k+2 > tam else k+2][0]
-            Az_lista += [(180/pi)*azimute(pntA, pntB)[0]]
-            Dist += [sqrt((pntA.x() - pntB.x())**2 + (pntA.y() - pntB.y())**2)]
-
-        for k in range(tam):
-            linha0 = linha
             itens = {
-                  '[EST1]': pnts_UTM[k+1][1],
-                  '[EST2]': pnts_UTM[1 if k+2 > tam else k+2][1],
-                  '[E]': self.tr(format_num.format(pnts_UTM[k+1][0].x()), format_num.format(pnts_UTM[k+1][0].x()).replace(',', 'X').replace('.', ',').replace('X', '.')),
-                  '[N]': self.tr(format_num.format(pnts_UTM[k+1][0].y()), format_num.format(pnts_UTM[k+1][0].y()).replace(',', 'X').replace('.', ',').replace('X', '.')),
-                  '[AZ]': str2HTML(self.tr(dd2dms(Az_lista[k],1), dd2dms(Az_lista[k],1).replace('.', ','))),
+                  '[EST1]': codigos[k],
+                  '[EST2]': codigos[(k+1)%tam],
+                  '[E]': self.tr(format_num.format(E[k]), format_num.format(E[k]).replace(',', 'X').replace('.', ',').replace('X', '.')),
+                  '[N]': self.tr(format_num.format(N[k]), format_num.format(N[k]).replace(',', 'X').replace('.', ',').replace('X', '.')),
+                  '[AZ]': str2HTML(self.tr(Az_txt[k], Az_txt[k].replace('.', ','))),
                   '[D]': format_num.format(Dist[k]).replace(',', 'X').replace('.', ',').replace('X', '.'),
-                  '[LON]': str2HTML(self.tr(dd2dms(pnts_UTM[k+1][2].x(),4), dd2dms(pnts_UTM[k+1][2].x(),4).replace('.', ','))),
-                  '[LAT]': str2HTML(self.tr(dd2dms(pnts_UTM[k+1][2].y(),4), dd2dms(pnts_UTM[k+1][2].y(),4).replace('.', ','))),
+                  '[LON]': str2HTML(self.tr(Lon_txt[k], Lon_txt[k].replace('.', ','))),
+                  '[LAT]': str2HTML(self.tr(Lat_txt[k], Lat_txt[k].replace('.', ','))),
                         }
-            for item in itens:
-                linha0 = linha0.replace(item, itens[item])
-
-            LINHAS += linha0
+            LINHAS += [itens]
 
-        LINHAS += FIM
-
-        # Check for cancelation
-        if feedback.isCanceled():
-            return {}
-
-        output = self.parameterAsFileOutput(parameters, self.HTML, context)
-        arq = open(output, 'w')
-        arq.write(LINHAS)
-        arq.close()
-
-        feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
-        feedback.pushInfo(self.tr('Leandro França - Cartographic Engineer', 'Leandro França - Eng Cart'))
-
-        return {self.HTML: output}
+        return INICIO + modelo_linha.preencherLinhas(LINHAS) + FIM
@@ -25,22 +25,26 @@ from PyQt5.QtCore import QCoreApplication
 from qgis.core import (QgsProcessing,
                        QgsProject,
                        QgsCoordinateReferenceSystem,
-                       QgsCoordinateTransform,
                        QgsProcessingParameterFeatureSource,
+                       QgsProcessingParameterField,
                        QgsProcessingParameterEnum,
                        QgsProcessingParameterFile,
                        QgsProcessingParameterString,
                        QgsProcessingParameterNumber,
                        QgsProcessingParameterBoolean,
                        QgsProcessingException,
+                       QgsFeatureRequest,
                        QgsProcessingParameterFileDestination,
                        QgsApplication)
 from processing.algs.qgis.QgisAlgorithm import QgisAlgorithm
-from math import atan, pi, sqrt, floor
+from math import atan, floor
 import math
+import numpy as np
 from lftools.geocapt.imgs import *
-from lftools.geocapt.cartography import FusoHemisf, geom2PointList
-from lftools.geocapt.topogeo import str2HTML, dd2dms, azimute
+from lftools.geocapt.cartography import FusoHemisf, TabelaVertices, azimutesDistancias
+from lftools.geocapt.topogeo import (str2HTML, dd2dms, dd2dmsArray, Modelo,
+                                     agruparPorChave, nomesArquivosHTML,
+                                     executarEmLote, indiceHTML)
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -59,6 +63,8 @@ class DescriptiveMemorial(QgisAlgorithm):
     SLOGAN = 'SLOGAN'
     DECIMAL = 'DECIMAL'
     PROJECTION = 'PROJECTION'
+    KEY = 'KEY'
+    FOLDER = 'FOLDER'
     LOC = QgsApplication.locale()[:2]
 
 
@@ -97,8 +103,8 @@ class DescriptiveMemorial(QgisAlgorithm):
         return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/document.png'))
 
     figure = 'images/tutorial/doc_descriptive_memorial.jpg'
-    txt_en = 'Elaboration of Deed Description based on vector layers that define a property.'
-    txt_pt = 'Elaboração de Memorial Descritivo a partir de camadas vetorias que definem uma propriedade.'
+    txt_en = 'Elaboration of Deed Description based on vector layers that define a property. When a <b>property key field</b> is chosen, one deed description is generated for each property of the polygon layer in the chosen folder, with the points and lines that have the same key, and the output HTML lists the generated files.'
+    txt_pt = 'Elaboração de Memorial Descritivo a partir de camadas vetorias que definem uma propriedade. Quando um <b>campo chave do imóvel</b> é escolhido, é gerado um memorial descritivo para cada imóvel da camada de polígonos na pasta escolhida, com os pontos e linhas que possuem a mesma chave, e o HTML de saída lista os arquivos gerados.'
 
     def shortHelpString(self):
         social_BW = Imgs().social_BW
@@ -198,6 +204,25 @@ class DescriptiveMemorial(QgisAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterField(
+                self.KEY,
+                self.tr('Property key field (one report per property)', 'Campo chave do imóvel (um memorial por imóvel)'),
+                parentLayerParameterName='INPUT3',
+                optional = True
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterFile(
+                self.FOLDER,
+                self.tr('Folder for the reports of each property', 'Pasta para os memoriais de cada imóvel'),
+                behavior=QgsProcessingParameterFile.Folder,
+                defaultValue=None,
+                optional = True
+            )
+        )
+
         # 'OUTPUTS'
         self.addParameter(
             QgsProcessingParameterFileDestination(
@@ -233,7 +258,7 @@ class DescriptiveMemorial(QgisAlgorithm):
         if logo:
             LOGO = 'jpg;base64,'+img2html_resized(logo, lado=380)
         else:
-            LOGO = 'png;base64,'+lftools_logo
+            LOGO = 'png;base64,'+Imgs().lftools_logo
 
         SLOGAN = self.parameterAsString(
             parameters,
@@ -261,6 +286,92 @@ class DescriptiveMemorial(QgisAlgorithm):
             context
         )
 
+        # Pegando o SRC do Projeto
+        crs_projeto = QgsProject.instance().crs()
+        SRC = crs_projeto.description()
+        # Verificando o SRC
+        if crs_projeto.isGeographic():
+            raise QgsProcessingException(self.tr('The Project CRS must be projected!', 'O SRC do Projeto deve ser Projetado!'))
+        feedback.pushInfo(self.tr('Project CRS is {}.', 'SRC do Projeto é {}.').format(SRC))
+
+        chave = self.parameterAsFields(
+            parameters,
+            self.KEY,
+            context
+        )
+
+        pasta = self.parameterAsFile(
+            parameters,
+            self.FOLDER,
+            context
+        )
+
+        opcoes = (vertices.sourceCrs(), area.fields(), coord, LOGO, SLOGAN, format_num, projecao, SRC, crs_projeto)
+
+        output = self.parameterAsFileOutput(parameters, self.HTML, context)
+
+        if not chave:
+            # Dados do levantamento
+            feat1 = next(area.getFeatures(QgsFeatureRequest().setLimit(1)))
+            LINHAS = self.memorial(feat1, list(vertices.getFeatures()), list(limites.getFeatures()), *opcoes)
+            arq = open(output, 'w')
+            arq.write(LINHAS)
+            arq.close()
+
+        else:
+            # Um memorial por imóvel, agrupando vértices e limites pelo campo chave
+            chave = chave[0]
+            if not pasta:
+                raise QgsProcessingException(self.invalidSourceError(parameters, self.FOLDER))
+            for camada in (vertices, limites):
+                if camada.fields().indexFromName(chave) < 0:
+                    raise QgsProcessingException(self.tr('The key field "{}" must exist in all input layers!', 'O campo chave "{}" deve existir em todas as camadas de entrada!').format(chave))
+            feedback.pushInfo(self.tr('Grouping features by key...', 'Agrupando feições pela chave...'))
+            pontos_imovel = agruparPorChave(vertices.getFeatures(), chave)
+            linhas_imovel = agruparPorChave(limites.getFeatures(), chave)
+            imoveis = list(area.getFeatures())
+
+            nomes = nomesArquivosHTML(pasta, self.tr('deed_description_', 'memorial_descritivo_'), [feat1[chave] for feat1 in imoveis])
+
+            def gerar(item):
+                feat1, arquivo = item
+                valor = feat1[chave]
+                LINHAS = self.memorial(feat1, pontos_imovel.get(valor, []), linhas_imovel.get(valor, []), *opcoes)
+                arq = open(arquivo, 'w')
+                arq.write(LINHAS)
+                arq.close()
+                return arquivo
+
+            feedback.pushInfo(self.tr('Generating {} reports...', 'Gerando {} memoriais...').format(len(imoveis)))
+            arquivos, erros = executarEmLote(gerar, list(zip(imoveis, nomes)), feedback)
+
+            # Check for cancelation
+            if feedback.isCanceled():
+                return {}
+
+            gerados = []
+            for feat1, arquivo, erro in zip(imoveis, arquivos, erros):
+                if erro is not None:
+                    feedback.reportError(self.tr('Property {}: {}', 'Imóvel {}: {}').format(feat1[chave], erro))
+                elif arquivo:
+                    gerados += [(feat1[chave], arquivo)]
+            feedback.pushInfo(self.tr('{} of {} reports saved in {}', '{} de {} memoriais salvos em {}').format(len(gerados), len(imoveis), pasta))
+            arq = open(output, 'w')
+            arq.write(indiceHTML(self.tr('Deed descriptions', 'Memoriais descritivos'), gerados, output))
+            arq.close()
+
+        # Check for cancelation
+        if feedback.isCanceled():
+            return {}
+
+        feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
+        feedback.pushInfo(self.tr('Leandro França - Cartographic Engineer', 'Leandro França - Eng Cart'))
+
+        return {self.HTML: output}
+
+
+    def memorial(self, feat1, lista_vertices, lista_limites, crs_vertices, campos_area, coord, LOGO, SLOGAN, format_num, projecao, SRC, crs_projeto):
+        # Memorial descritivo de um imóvel a partir dos seus vértices e limites
         meses = {1: 'janeiro', 2:'fevereiro', 3: 'março', 4:'abril', 5:'maio', 6:'junho', 7:'julho', 8:'agosto', 9:'setembro', 10:'outubro', 11:'novembro', 12:'dezembro'}
 
         # VALIDAÇÃO DOS DADOS DE ENTRADA!
@@ -269,7 +380,7 @@ class DescriptiveMemorial(QgisAlgorithm):
         ListaDescr = []
         ListaCont = []
         soma = 0
-        for linha in limites.getFeatures():
+        for linha in lista_limites:
             geom = linha.geometry()
             if geom.isMultipart():
                 Lin_coord = geom.asMultiPolyline()[0]
@@ -280,30 +391,18 @@ class DescriptiveMemorial(QgisAlgorithm):
             ListaCont += [(soma, cont-1)]
             soma += cont-1
 
-        # Pegando o SRC do Projeto
-        SRC = QgsProject.instance().crs().description()
-        # Verificando o SRC
-        if QgsProject.instance().crs().isGeographic():
-            raise QgsProcessingException(self.tr('The Project CRS must be projected!', 'O SRC do Projeto deve ser Projetado!'))
-        feedback.pushInfo(self.tr('Project CRS is {}.', 'SRC do Projeto é {}.').format(SRC))
+        # Tabela dos vértices (leitura única)
+        tabela = TabelaVertices(lista_vertices)
 
         # Número de Pontos
-        if vertices.featureCount() < 3:
+        if tabela.n < 3:
             raise QgsProcessingException(self.tr('The number of points must be greater than 2!', 'O número de pontos deve ser maior que 2!'))
 
         # Verificar se possui coordenada Z
-        for feat in vertices.getFeatures():
-                geom = feat.geometry()
-                break
-
-        if str(geom2PointList(geom).z()) == 'nan': #PointZ
+        if np.isnan(tabela.z).any(): #PointZ
             raise QgsProcessingException(self.tr('Limit Point layer must be "PointZ" type!', 'Camada pontos limites deve ser do tipo "PointZ"!'))
 
         # Dados do levantamento
-        for feat in area.getFeatures():
-                feat1 = feat
-                break
-
         geom = feat1.geometry()
         centroideG = geom.centroid().asPoint()
 
@@ -315,18 +414,12 @@ class DescriptiveMemorial(QgisAlgorithm):
 
         # Validando dados de entrada
         # ponto_limite
-        ordem_list = list(range(1,vertices.featureCount()+1))
-        ordem_comp = []
-        for feat in vertices.getFeatures():
-            ordem_comp += [feat['sequence']]
-            codigo_item = feat['code']
-            if not codigo_item or codigo_item in ['', ' ']:
-                raise QgsProcessingException(self.tr('The code attribute must be filled in for all features!', 'O atributo código deve ser preenchido para todas as feições!'))
-        ordem_comp.sort()
-        if ordem_list != ordem_comp:
+        if not tabela.preenchido('code'):
+            raise QgsProcessingException(self.tr('The code attribute must be filled in for all features!', 'O atributo código deve ser preenchido para todas as feições!'))
+        if not tabela.sequenciaValida:
             raise QgsProcessingException(self.tr('The point sequence field must be filled in correctly!', 'O campo de sequência dos pontos deve preenchido corretamente!'))
         # elemento_confrontante
-        for feat in limites.getFeatures():
+        for feat in lista_limites:
             att1 = feat['start_pnt_descr']
             if not att1 or att1 in ['', ' ']:
                 raise QgsProcessingException(self.tr('The attribute of the starting point description must be filled in for all features!', 'O atributo de descrição do ponto inicial deve ser preenchido para todas as feições!'))
@@ -334,7 +427,7 @@ class DescriptiveMemorial(QgisAlgorithm):
             if not att2 or att2 in ['', ' ']:
                 raise QgsProcessingException(self.tr("The confrontant's name must be filled in for all features!", 'O nome do confrontante deve ser preenchido para todas as feições!'))
         # area_imovel
-        Fields = area.fields()
+        Fields = campos_area
         fieldnames = [field.name() for field in Fields]
         for fieldname in fieldnames:
             att = feat1[fieldname]
@@ -342,28 +435,31 @@ class DescriptiveMemorial(QgisAlgorithm):
                 raise QgsProcessingException(self.tr('All attributes of the class "area_imovel" must be filled!', 'Todos os atributos da classe "area_imovel" devem ser preenchido!'))
 
         # Transformar Coordenadas de Geográficas para o sistema UTM
-        coordinateTransformer = QgsCoordinateTransform()
-        coordinateTransformer.setDestinationCrs(QgsProject.instance().crs())
-        coordinateTransformer.setSourceCrs(vertices.sourceCrs())
-
-        pnts = {}
-
-        for feat in vertices.getFeatures():
-            geom = feat.geometry()
-            if geom.isMultipart():
-                pnts[feat['sequence']] = [coordinateTransformer.transform(geom.asMultiPoint()[0]), feat['type'], feat['code'], (geom.constGet()[0].x(), geom.constGet()[0].y(), geom.constGet()[0].z())]
-            else:
-                pnts[feat['sequence']] = [coordinateTransformer.transform(geom.asPoint()), feat['type'], feat['code'], (geom.constGet().x(), geom.constGet().y(), geom.constGet().z())]
+        E, N = tabela.projetar(crs_vertices, crs_projeto)
+        codigos = tabela['code']
 
         # Cálculo dos Azimutes e Distâncias
-        tam = len(pnts)
-        Az_lista, Dist = [], []
-        for k in range(tam):
-            pntA = pnts[k+1][0]
-            pntB = pnts[max((k+2)%(tam+1),1)][0]
-            Az_lista += [(180/pi)*azimute(pntA, pntB)[0]]
-            Dist += [sqrt((pntA.x() - pntB.x())**2 + (pntA.y() - pntB.y())**2)]
-
+        Az_lista, Dist = azimutesDistancias(E, N)
+        Az_txt = dd2dmsArray(Az_lista, 1)
+
+
+        if coord == 0:
+            txt = '''<b>N [Yn]m </b>''' + self.tr('and','e') +''' <b>E [Xn]m</b>'''
+        elif coord == 1:
+            txt = '''<b>E [Xn]m </b>''' + self.tr('and','e') +''' <b>N [Yn]m</b>'''
+        elif coord == 2:
+            txt = '''<b>N [Yn]m</b>, <b>E [Xn]m</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
+        elif coord == 3:
+            txt = '''<b>E [Xn]m</b>, <b>N [Yn]m</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
+        elif coord == 4:
+            txt = '''<b> [Yn] </b>''' + self.tr('and','e') +''' <b> [Xn]</b>'''
+        elif coord == 5:
+            txt = '''<b> [Xn] </b>''' + self.tr('and','e') +''' <b> [Yn]</b>'''
+        elif coord == 6:
+            txt = '''<b> [Yn]</b>, <b> [Xn]</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
+        elif coord == 7:
+            txt = '''<b> [Xn]</b>, <b> [Yn]</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
+        modelo_coord = Modelo(txt)
 
         def CoordN (x, y, z):
             if coord in (0,1,2,3):
@@ -373,31 +469,14 @@ class DescriptiveMemorial(QgisAlgorithm):
                 Xn = str2HTML(self.tr(dd2dms(x,4), dd2dms(x,4).replace('.', ','))).replace('-','') + 'W' if x < 0 else 'E'
                 Yn = str2HTML(self.tr(dd2dms(y,4), dd2dms(y,4).replace('.', ','))).replace('-','') + 'S' if y < 0 else 'N'
             Zn = self.tr(format_num.format(z), format_num.format(z).replace(',', 'X').replace('.', ',').replace('X', '.'))
+            return modelo_coord.preencher({'[Xn]': Xn, '[Yn]': Yn, '[Zn]': Zn})
 
-            if coord == 0:
-                txt = '''<b>N [Yn]m </b>''' + self.tr('and','e') +''' <b>E [Xn]m</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn)
-            elif coord == 1:
-                txt = '''<b>E [Xn]m </b>''' + self.tr('and','e') +''' <b>N [Yn]m</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn)
-            elif coord == 2:
-                txt = '''<b>N [Yn]m</b>, <b>E [Xn]m</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn).replace('[Zn]', Zn)
-            elif coord == 3:
-                txt = '''<b>E [Xn]m</b>, <b>N [Yn]m</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn).replace('[Zn]', Zn)
-            elif coord == 4:
-                txt = '''<b> [Yn] </b>''' + self.tr('and','e') +''' <b> [Xn]</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn)
-            elif coord == 5:
-                txt = '''<b> [Xn] </b>''' + self.tr('and','e') +''' <b> [Yn]</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn)
-            elif coord == 6:
-                txt = '''<b> [Yn]</b>, <b> [Xn]</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn).replace('[Zn]', Zn)
-            elif coord == 7:
-                txt = '''<b> [Xn]</b>, <b> [Yn]</b> ''' + self.tr('and','e') +''' <b>h [Zn]m</b>'''
-                return txt.replace('[Yn]', Yn).replace('[Xn]', Xn).replace('[Zn]', Zn)
+        def CoordK (k):
+            # Coordenadas do vértice k: planas (E, N) ou geodésicas
+            if coord in (0,1,2,3):
+                return CoordN(E[k], N[k], tabela.z[k])
+            else:
+                return CoordN(tabela.x[k], tabela.y[k], tabela.z[k])
 
 
         texto_inicial = '''
@@ -528,38 +607,29 @@ class DescriptiveMemorial(QgisAlgorithm):
                 '[PERIMETRO]': self.tr(format_num.format(feat1['perimeter']), format_num.format(feat1['perimeter']).replace(',', 'X').replace('.', ',').replace('X', '.')),
                     }
 
-        for item in itens:
-                texto_inicial = texto_inicial.replace(item, itens[item])
-
-        LINHAS = texto_inicial
+        LINHAS = [Modelo(texto_inicial).preencher(itens)]
+        modelo_var1 = Modelo(texto_var1)
+        modelo_var2 = Modelo(texto_var2)
         for w,t in enumerate(ListaCont):
-            linha0 = texto_var1
-            itens =    {'[Vn]': pnts[t[0]+1][2],
-                        '[Coordn]': CoordN(pnts[t[0]+1][0].x(), pnts[t[0]+1][0].y(), pnts[t[0]+1][3][2]) if coord in (0,1,2,3) else CoordN(pnts[t[0]+1][3][0], pnts[t[0]+1][3][1], pnts[t[0]+1][3][2]),
-                        '[Az_n]': str2HTML(self.tr(dd2dms(Az_lista[t[0]],1), dd2dms(Az_lista[t[0]],1).replace('.', ','))),
+            itens =    {'[Vn]': codigos[t[0]],
+                        '[Coordn]': CoordK(t[0]),
+                        '[Az_n]': str2HTML(self.tr(Az_txt[t[0]], Az_txt[t[0]].replace('.', ','))),
                         '[Dist_n]': self.tr(format_num.format(Dist[t[0]]), format_num.format(Dist[t[0]]).replace(',', 'X').replace('.', ',').replace('X', '.')),
                         '[Descr_k]': ListaDescr[w][0],
                         '[Confront_k]': ListaDescr[w][1]
                         }
-            for item in itens:
-                linha0 = linha0.replace(item, itens[item])
-            LINHAS += linha0
-            LIN0 = ''
+            LINHAS += [modelo_var1.preencher(itens)]
             for k in range(t[0]+1, t[0]+t[1]):
-                linha1 = texto_var2
-                itens = {'[Vn]': pnts[k+1][2],
-                        '[Coordn]': CoordN(pnts[k+1][0].x(), pnts[k+1][0].y(), pnts[k+1][3][2]) if coord in (0,1,2,3) else CoordN(pnts[k+1][3][0], pnts[k+1][3][1], pnts[k+1][3][2]),
-                        '[Az_n]': str2HTML(self.tr(dd2dms(Az_lista[k],1), dd2dms(Az_lista[k],1).replace('.', ','))),
+                itens = {'[Vn]': codigos[k],
+                        '[Coordn]': CoordK(k),
+                        '[Az_n]': str2HTML(self.tr(Az_txt[k], Az_txt[k].replace('.', ','))),
                         '[Dist_n]': self.tr(format_num.format(Dist[k]), format_num.format(Dist[k]).replace(',', 'X').replace('.', ',').replace('X', '.'))
                         }
-                for item in itens:
-                    linha1 = linha1.replace(item, itens[item])
-                LIN0 += linha1
-            LINHAS += LIN0
+                LINHAS += [modelo_var2.preencher(itens)]
 
         # Inserindo dados finais
-        itens = {   '[P-01]': pnts[1][2],
-                    '[Coord1]': CoordN(pnts[1][0].x(), pnts[1][0].y(), pnts[1][3][2])  if coord in (0,1,2,3) else CoordN(pnts[1][3][0], pnts[1][3][1], pnts[1][3][2]),
+        itens = {   '[P-01]': codigos[0],
+                    '[Coord1]': CoordK(0),
                     '[GRS]': SRC.split(' /')[0],
                     '[FUSO]': str(FusoHemisf(centroideG)[0]),
                     '[HEMISFERIO]': FusoHemisf(centroideG)[1],
@@ -570,21 +640,5 @@ class DescriptiveMemorial(QgisAlgorithm):
                                        (feat1['survey_date'].toPyDate()).strftime("%d de {} de %Y").format(meses[feat1['survey_date'].month()]))
                     }
 
-        for item in itens:
-                texto_final = texto_final.replace(item, itens[item])
-
-        LINHAS += texto_final
-
-        output = self.parameterAsFileOutput(parameters, self.HTML, context)
-        arq = open(output, 'w')
-        arq.write(LINHAS)
-        arq.close()
-
-        # Check for cancelation
-        if feedback.isCanceled():
-            return {}
-
-        feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
-        feedback.pushInfo(self.tr('Leandro França - Cartographic Engineer', 'Leandro França - Eng Cart'))
-
-        return {self.HTML: output}
+        LINHAS += [Modelo(texto_final).preencher(itens)]
+        return ''.join(LINHAS)
@@ -42,10 +42,10 @@ from qgis.core import (QgsProcessing,
                        QgsCoordinateReferenceSystem)
 
 import os
-from math import pi, sqrt
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.cartography import MeridianConvergence, SRC_Projeto, geom2PointList
-from lftools.geocapt.topogeo import azimute, dd2dms, str2HTML
+from lftools.geocapt.cartography import (MeridianConvergenceArray, SRC_Projeto,
+                                         TabelaVertices, azimutesDistancias)
+from lftools.geocapt.topogeo import dd2dmsArray, str2HTML, Modelo
 from qgis.PyQt.QtGui import QIcon
 
 class DescriptiveTable(QgsProcessingAlgorithm):
@@ -268,42 +268,26 @@ class DescriptiveTable(QgsProcessingAlgorithm):
 
         # Validando dados de entrada
         # ponto_limite
-        ordem_list = list(range(1,vertices.featureCount()+1))
-        ordem_comp = []
-        for feat in vertices.getFeatures():
-            ordem_comp += [feat['sequence']]
-            codigo_item = feat['code']
-            if not codigo_item or codigo_item in ['', ' ']:
-                raise QgsProcessingException(self.tr('The code attribute must be filled in for all features!', 'O atributo código deve ser preenchido para todas as feições!'))
-        ordem_comp.sort()
-        if ordem_list != ordem_comp:
+        tabela = TabelaVertices(vertices.getFeatures(), campos=('code', 'codigo'))
+        if not tabela.preenchido('code'):
+            raise QgsProcessingException(self.tr('The code attribute must be filled in for all features!', 'O atributo código deve ser preenchido para todas as feições!'))
+        if not tabela.sequenciaValida:
             raise QgsProcessingException(self.tr('The point sequence field must be filled in correctly!', 'O campo de sequência dos pontos deve ser preenchido corretamente!'))
 
 
         # Transformacao de Coordenadas Geograficas para Projetadas no sistema UTM
         crsDest = QgsCoordinateReferenceSystem(SRC_Projeto('EPSG'))
-        coordinateTransformer = QgsCoordinateTransform()
-        coordinateTransformer.setDestinationCrs(crsDest)
-        coordinateTransformer.setSourceCrs(vertices.sourceCrs())
-
-        pnts_UTM = {}
-        pnts_GEO = {}
-        for feat in vertices.getFeatures():
-            pnt = feat.geometry().asPoint()
-            coord = geom2PointList(feat.geometry())
-            pnts_UTM[feat['sequence']] = [coordinateTransformer.transform(pnt), feat['tipo'], feat['codigo'], MeridianConvergence(pnt.x(), pnt.y(), crsDest) ]
-            pnts_GEO[feat['sequence']] = [QgsPoint(pnt.x(),pnt.y(),coord.z()), feat['tipo'], feat['codigo'] ]
+        E, N = tabela.projetar(vertices.sourceCrs(), crsDest)
+        codigos = tabela['codigo']
 
         # Calculo dos Azimutes e Distancias
-        tam = len(pnts_UTM)
-        Az_lista, Az_Geo_lista, Dist = [], [], []
-        for k in range(tam):
-            pntA = pnts_UTM[k+1][0]
-            pntB = pnts_UTM[1 if k+2 > tam else k+2][0]
-            Az_lista += [(180/pi)*azimute(pntA, pntB)[0]]
-            ConvMerediana = pnts_UTM[k+1][3]
-            Az_Geo_lista += [(180/pi)*azimute(pntA, pntB)[0]+ConvMerediana]
-            Dist += [sqrt((pntA.x() - pntB.x())**2 + (pntA.y() - pntB.y())**2)]
+        tam = tabela.n
+        Az_lista, Dist = azimutesDistancias(E, N)
+        ConvMerediana = MeridianConvergenceArray(tabela.x, tabela.y, crsDest)
+        Az_txt = dd2dmsArray(Az_lista, 1)
+        AzG_txt = dd2dmsArray(Az_lista + ConvMerediana, 1)
+        Lon_txt = dd2dmsArray(tabela.x, decimal + 3)
+        Lat_txt = dd2dmsArray(tabela.y, decimal + 3)
 
         # Templates HTML
         if modelo == 0:
@@ -354,23 +338,23 @@ class DescriptiveTable(QgsProcessingAlgorithm):
             </html>
             '''
 
-            LINHAS = ''
             if fim == -1 or fim > tam:
                 fim = tam
+            modelo_linha = Modelo(linha, ('Vn', 'En', 'Nn', 'hn', 'lonn', 'latn', 'Ln', 'Az_n', 'AzG_n', 'Dn'))
+            LINHAS = []
             for k in range(ini-1,fim):
-                linha0 = linha
-                itens = {'Vn': pnts_UTM[k+1][2],
-                            'En': self.tr(format_num.format(pnts_UTM[k+1][0].x()), format_num.format(pnts_UTM[k+1][0].x()).replace(',', 'X').replace('.', ',').replace('X', '.')),
-                            'Nn': self.tr(format_num.format(pnts_UTM[k+1][0].y()), format_num.format(pnts_UTM[k+1][0].y()).replace(',', 'X').replace('.', ',').replace('X', '.')),
-                            'Ln': pnts_UTM[k+1][2] + '/' + pnts_UTM[1 if k+2 > tam else k+2][2],
-                            'Az_n': self.tr(dd2dms(Az_lista[k],1), dd2dms(Az_lista[k],1).replace('.', ',')),
-                            'AzG_n':  self.tr(dd2dms(Az_Geo_lista[k],1), dd2dms(Az_Geo_lista[k],1).replace('.', ',')),
+                itens = {'Vn': codigos[k],
+                            'En': self.tr(format_num.format(E[k]), format_num.format(E[k]).replace(',', 'X').replace('.', ',').replace('X', '.')),
+                            'Nn': self.tr(format_num.format(N[k]), format_num.format(N[k]).replace(',', 'X').replace('.', ',').replace('X', '.')),
+                            'Ln': codigos[k] + '/' + codigos[(k+1)%tam],
+                            'Az_n': self.tr(Az_txt[k], Az_txt[k].replace('.', ',')),
+                            'AzG_n':  self.tr(AzG_txt[k], AzG_txt[k].replace('.', ',')),
                             'Dn': self.tr(format_num.format(Dist[k]), format_num.format(Dist[k]).replace(',', 'X').replace('.', ',').replace('X', '.'))
                             }
-                for item in itens:
-                    linha0 = linha0.replace(item, itens[item])
-                LINHAS += linha0
-            resultado = texto.replace('[LINHAS]', LINHAS).replace('[TITULO]', str2HTML(titulo.upper())).replace('[FONTSIZE]', str(fontsize))
+                LINHAS += [itens]
+            resultado = Modelo(texto).preencher({'[LINHAS]': modelo_linha.preencherLinhas(LINHAS),
+                                                 '[TITULO]': str2HTML(titulo.upper()),
+                                                 '[FONTSIZE]': str(fontsize)})
 
         else:
             texto = '''<!DOCTYPE html PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN">
@@ -559,25 +543,26 @@ class DescriptiveTable(QgsProcessingAlgorithm):
                   <td>h</td>
                 </tr>'''
 
-            LINHAS = ''
             if fim == -1 or fim > tam:
                 fim = tam
+            modelo_linha = Modelo(linha, ('Vn', 'En', 'Nn', 'hn', 'lonn', 'latn', 'Ln', 'Az_n', 'AzG_n', 'Dn'))
+            LINHAS = []
             for k in range(ini-1,fim):
-                linha0 = linha
-                itens = {'Vn': pnts_UTM[k+1][2],
-                            'En': self.tr(format_num.format(pnts_UTM[k+1][0].x()), format_num.format(pnts_UTM[k+1][0].x()).replace(',', 'X').replace('.', ',').replace('X', '.')),
-                            'Nn': self.tr(format_num.format(pnts_UTM[k+1][0].y()), format_num.format(pnts_UTM[k+1][0].y()).replace(',', 'X').replace('.', ',').replace('X', '.')),
-                            'hn': self.tr(format_num.format(pnts_GEO[k+1][0].z()), format_num.format(pnts_GEO[k+1][0].z()).replace(',', 'X').replace('.', ',').replace('X', '.')),
-                            'lonn': self.tr(dd2dms(pnts_GEO[k+1][0].x(),decimal + 3), dd2dms(pnts_GEO[k+1][0].x(),decimal + 3).replace('.', ',')),
-                            'latn': self.tr(dd2dms(pnts_GEO[k+1][0].y(),decimal + 3), dd2dms(pnts_GEO[k+1][0].y(),decimal + 3).replace('.', ',')),
-                            'Ln': pnts_UTM[k+1][2] + '/' + pnts_UTM[1 if k+2 > tam else k+2][2],
-                            'Az_n': self.tr(dd2dms(Az_lista[k],1), dd2dms(Az_lista[k],1).replace('.', ',')),
+                itens = {'Vn': codigos[k],
+                            'En': self.tr(format_num.format(E[k]), format_num.format(E[k]).replace(',', 'X').replace('.', ',').replace('X', '.')),
+                            'Nn': self.tr(format_num.format(N[k]), format_num.format(N[k]).replace(',', 'X').replace('.', ',').replace('X', '.')),
+                            'hn': self.tr(format_num.format(tabela.z[k]), format_num.format(tabela.z[k]).replace(',', 'X').replace('.', ',').replace('X', '.')),
+                            'lonn': self.tr(Lon_txt[k], Lon_txt[k].replace('.', ',')),
+                            'latn': self.tr(Lat_txt[k], Lat_txt[k].replace('.', ',')),
+                            'Ln': codigos[k] + '/' + codigos[(k+1)%tam],
+                            'Az_n': self.tr(Az_txt[k], Az_txt[k].replace('.', ',')),
                             'Dn': self.tr(format_num.format(Dist[k]), format_num.format(Dist[k]).replace(',', 'X').replace('.', ',').replace('X', '.'))
                             }
-                for item in itens:
-                    linha0 = linha0.replace(item, itens[item])
-                LINHAS += linha0
-            resultado = texto.replace('[CABECALHO]', cabec).replace('[LINHAS]', LINHAS).replace('[TITULO]', str2HTML(titulo.upper())).replace('[FONTSIZE]', str(fontsize))
+                LINHAS += [itens]
+            cabec = Modelo(cabec).preencher({'[TITULO]': str2HTML(titulo.upper())})
+            resultado = Modelo(texto).preencher({'[CABECALHO]': cabec,
+                                                 '[LINHAS]': modelo_linha.preencherLinhas(LINHAS),
+                                                 '[FONTSIZE]': str(fontsize)})
 
 
         output = self.parameterAsFileOutput(parameters, self.HTML, context)
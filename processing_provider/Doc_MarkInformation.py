@@ -41,7 +41,7 @@ from qgis.core import (QgsProcessing,
 import os
 from lftools.geocapt.imgs import *
 from lftools.geocapt.cartography import CentralMeridian, FusoHemisf
-from lftools.geocapt.topogeo import dd2dms, str2HTML
+from lftools.geocapt.topogeo import dd2dms, str2HTML, Modelo
 from qgis.PyQt.QtGui import QIcon
 
 class SurveyMarkDoc(QgsProcessingAlgorithm):
@@ -181,7 +181,7 @@ class SurveyMarkDoc(QgsProcessingAlgorithm):
         if logo:
             LOGO = 'jpg;base64,'+img2html_resized(logo, lado=380)
         else:
-            LOGO = 'png;base64,'+lftools_logo
+            LOGO = 'png;base64,'+Imgs().lftools_logo
 
         SLOGAN = self.parameterAsString(
             parameters,
@@ -203,9 +203,8 @@ class SurveyMarkDoc(QgsProcessingAlgorithm):
         feedback.pushInfo(self.tr('Project CRS is {}.', 'SRC do Projeto é {}.').format(SRC))
 
         # Verificar se a projeção UTM do Projeto está correta
-        for feat in vertice.getFeatures():
+        for feat in vertice.getFeatures(QgsFeatureRequest().setLimit(1)):
                 geom = feat.geometry()
-                break
         fuso, hemisf = FusoHemisf(geom.asMultiPoint()[0] if geom.isMultipart() else geom.asPoint())
         if SRC.split(' ')[-1] != str(fuso)+hemisf :
             raise QgsProcessingException(self.tr('Warning: Make sure your projection is correct!'.upper(), 'Aviso: Verifique se sua projeção está correta!'.upper()))
@@ -217,7 +216,7 @@ class SurveyMarkDoc(QgsProcessingAlgorithm):
 
         expr = QgsExpression( "\"code\"='{}'".format( codigo ) )
         pnt = False
-        for feat in vertice.getFeatures(QgsFeatureRequest( expr )):
+        for feat in vertice.getFeatures(QgsFeatureRequest( expr ).setLimit(1)):
             pnt = feat.geometry().asMultiPoint()[0]
             ponto = feat
             break
@@ -421,8 +420,7 @@ class SurveyMarkDoc(QgsProcessingAlgorithm):
                 '[OBS]': str2HTML(ponto['observation']),
                 '[SRC]': self.tr(SRC, SRC.replace('zone', 'fuso'))
                     }
-        for item in itens:
-                TEXTO = TEXTO.replace(item, itens[item])
+        TEXTO = Modelo(TEXTO).preencher(itens)
 
 
         # Check for cancelation
@@ -52,8 +52,8 @@ import numpy as np
 from pyproj.crs import CRS
 from math import floor, ceil
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.dip import Interpolar
-from lftools.geocapt.adjust import Ajust2D, ValidacaoVetores, transformGeom2D
+from lftools.geocapt.dip import InterpolarArray
+from lftools.geocapt.adjust import Ajust2D, ValidacaoVetores, transformGeom2D, TransfMatriz
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -99,12 +99,16 @@ class GeorrefAdjust(QgsProcessingAlgorithm):
      The following types of coordinate transformation can be used:
 ◼️ <b>Translation Transformation</b>: 1 vector without adjustment / 2 or + vectors with adjustment.
 ◼️ <b>Conformal Transformation (2D Helmert)</b>: 2 vectors without adjustment / 3 or + vectors with adjustment.
-◼️ <b>Affine Transformation</b>: 3 vectors without adjustment / 4 or + vectors with adjustment.'''
+◼️ <b>Affine Transformation</b>: 3 vectors without adjustment / 4 or + vectors with adjustment.
+When the fitted transformation has no rotation or shear (within the tolerance), only the geotransform is rewritten and no pixel is resampled. Optionally, a rotated geotransform can also be written to avoid resampling. For these cases, the output can also be a VRT file.
+The resampling can be done by the LFTools vectorized engine or by the GDAL multithreaded warper.'''
     txt_pt = '''Esta ferramenta realiza o ajuste do georreferenciamento de qualquer imagem raster utilizando Pontos de Controle no Terreno.
     Os seguintes tipos de transformação de coordenadas podem ser utilizados:
 ◼️	<b>Transformação de Translação</b>: 1 vetor sem ajustamento / 2 ou + vetores com ajustamento.
 ◼️	<b>Transformação Conforme (Helmert 2D)</b>: 2 vetores sem ajustamento / 3 ou + vetores com ajustamento.
-◼️	<b>Transformação Afim</b>: 3 vetores sem ajustamento / 4 ou + vetores com ajustamento.'''
+◼️	<b>Transformação Afim</b>: 3 vetores sem ajustamento / 4 ou + vetores com ajustamento.
+Quando a transformação ajustada não possui rotação ou cisalhamento (dentro da tolerância), apenas o geotransform é reescrito e nenhum pixel é reamostrado. Opcionalmente, um geotransform rotacionado também pode ser gravado para evitar a reamostragem. Nestes casos, a saída também pode ser um arquivo VRT.
+A reamostragem pode ser feita pelo motor vetorizado do LFTools ou pelo reamostrador multithread do GDAL.'''
     figure = 'images/tutorial/drone_georref_adjust.jpg'
 
     def shortHelpString(self):
@@ -128,6 +132,9 @@ class GeorrefAdjust(QgsProcessingAlgorithm):
     COORDS = 'COORDS'
     HTML = 'HTML'
     CHECKCRS = 'CHECKCRS'
+    TOLERANCE = 'TOLERANCE'
+    ROTATED = 'ROTATED'
+    ENGINE = 'ENGINE'
 
     def initAlgorithm(self, config=None):
         # INPUT
@@ -182,12 +189,42 @@ class GeorrefAdjust(QgsProcessingAlgorithm):
             )
         )
 
+        motores = [self.tr('LFTools (vectorized)', 'LFTools (vetorizado)'),
+                   self.tr('GDAL Warp (multithreaded)', 'GDAL Warp (multithread)')]
+
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.ENGINE,
+                self.tr('Resampling engine', 'Motor de reamostragem'),
+				options = motores,
+                defaultValue= 0
+            )
+        )
+
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.TOLERANCE,
+                self.tr('Rotation and shear tolerance (pixels)', 'Tolerância de rotação e cisalhamento (pixels)'),
+                type =1, #Double = 1 and Integer = 0
+                defaultValue = 0.1,
+                minValue = 0
+                )
+            )
+
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.ROTATED,
+                self.tr('Write rotated geotransform (without resampling)', 'Gravar geotransform rotacionado (sem reamostragem)'),
+                defaultValue= False
+            )
+        )
+
         # OUTPUT
         self.addParameter(
             QgsProcessingParameterFileDestination(
                 self.ADJUSTED,
                 self.tr('Adjusted Raster', 'Raster Ajustado'),
-                fileFilter = 'GeoTIFF (*.tif)'
+                fileFilter = 'GeoTIFF (*.tif);;VRT (*.vrt)'
             )
         )
 
@@ -249,7 +286,7 @@ class GeorrefAdjust(QgsProcessingAlgorithm):
 
         feedback.pushInfo(self.tr('Calculating adjustment parameters...', 'Calculando parâmetros de ajustamento...'))
         validacao = ValidacaoVetores(deslc, metodo)
-        COORD, PREC, CoordTransf, texto, CoordInvTransf = Ajust2D(deslc, metodo)
+        COORD, PREC, CoordTransf, texto, CoordInvTransf, MT, MT_inv = Ajust2D(deslc, metodo)
 
 
         # output
@@ -272,6 +309,24 @@ class GeorrefAdjust(QgsProcessingAlgorithm):
             context
         )
 
+        motor = self.parameterAsEnum(
+            parameters,
+            self.ENGINE,
+            context
+        )
+
+        tolerancia = self.parameterAsDouble(
+            parameters,
+            self.TOLERANCE,
+            context
+        )
+
+        rotacionado = self.parameterAsBool(
+            parameters,
+            self.ROTATED,
+            context
+        )
+
         # Coordenas ajustadas de saida
         GeomType = QgsWkbTypes.Point
         Fields = QgsFields()
@@ -337,85 +392,146 @@ class GeorrefAdjust(QgsProcessingAlgorithm):
                 raise QgsProcessingException(self.tr('The raster layer and the homologous point vector layer must have the same CRS!', 'A camada raster e a camada vetorial de pontos homólogos devem ter o mesmo SRC!'))
 
 
-        # Calcular nova extensão e origem
-        trans_geom = transformGeom2D(geom, CoordTransf)
-        bbox = trans_geom.boundingBox()
-        y_min = bbox.yMinimum()
-        y_max = bbox.yMaximum()
-        x_min = bbox.xMinimum()
-        x_max = bbox.xMaximum()
-
-        # Definir n_col, n_lin e resolucao da nova imagem
-        n_lin = round((y_max-y_min)/abs(yres))
-        n_col = round((x_max-x_min)/abs(xres))
-        # Novas resoluções
-        xres = (x_max-x_min)/n_col
-        yres = -(y_max-y_min)/n_lin
-
-        feedback.pushInfo(self.tr('Size: ', 'Tamanho: ') + str(n_lin) +'x' + str(n_col))
-        # Geotransform do novo Raster
-        ulx = x_min
-        uly = y_max
-        xskew, yskew = 0, 0
-        geotransform = [ulx, xres, xskew, uly, yskew, yres]
-        origem = (ulx, uly)
-        resol_X = abs(xres)
-        resol_Y = abs(yres)
-
-        # Criar Raster
-        Driver = gdal.GetDriverByName('GTiff').Create(Output, n_col, n_lin, n_bands, GDT)
-        Driver.SetGeoTransform(geotransform)
-        Driver.SetProjection(prj)
-
-        # Iniciar reamostragem
-        Percent = 100.0/(n_lin*n_bands)
-        current = 0
-
-        for k in range(n_bands):
-            # Abrir banda 1 como array
-            feedback.pushInfo((self.tr('Opening band {} as array...', 'Abrindo banda {} como array...')).format(str(k+1)))
-            banda_antiga = image.GetRasterBand(k+1).ReadAsArray()
-            # Criando novo array
-            feedback.pushInfo((self.tr('Transforming new band {}...', 'Transformando nova banda {}...')).format(str(k+1)))
+        # Geotransform resultante da transformação direta (matriz homogênea MT)
+        gt = image.GetGeoTransform()
+        GT = MT.dot([[gt[1], gt[2], gt[0]], [gt[4], gt[5], gt[3]], [0, 0, 1]])
+        geotransform = [GT[0,2], GT[0,0], GT[0,1], GT[1,2], GT[1,0], GT[1,1]]
+        # Deslocamento máximo (em pixels) provocado pelos termos de rotação e cisalhamento
+        desvio = max(abs(geotransform[2])*rows/np.hypot(geotransform[1], geotransform[4]),
+                     abs(geotransform[4])*cols/np.hypot(geotransform[2], geotransform[5]))
+        alinhado = desvio <= tolerancia
+        if alinhado:
+            geotransform[2], geotransform[4] = 0, 0
+
+        if alinhado or rotacionado:
+            # Apenas reescrever o geotransform, sem reamostragem
+            feedback.pushInfo(self.tr('Rewriting the geotransform without resampling...', 'Reescrevendo o geotransform sem reamostragem...'))
+            formato = 'VRT' if Output.lower().endswith('.vrt') else 'GTiff'
+            Driver = gdal.Translate(Output, image, format = formato)
+            Driver.SetGeoTransform(geotransform)
+            Driver.SetProjection(prj)
+            image = None # Close image
+            Driver.FlushCache()   # Escrever no disco
+            Driver = None   # Salvar e fechar
+
+        elif Output.lower().endswith('.vrt'):
+            raise QgsProcessingException(self.tr('VRT output is only available when no resampling is needed!', 'A saída VRT só está disponível quando não há necessidade de reamostragem!'))
+
+        elif motor == 1:
+            # Reamostragem pelo GDAL Warp (multithread e com memória limitada)
+            feedback.pushInfo(self.tr('Warping raster with GDAL...', 'Reamostrando raster com o GDAL...'))
+            vrt = gdal.Translate('', image, format = 'VRT')
+            vrt.SetGeoTransform(geotransform)
+            vrt.SetProjection(prj)
+            def progresso(percent, msg, data):
+                feedback.setProgress(int(percent*100))
+                return 0 if feedback.isCanceled() else 1
+            Driver = gdal.Warp(Output, vrt,
+                               format = 'GTiff',
+                               xRes = xres_antiga,
+                               yRes = yres_antiga,
+                               resampleAlg = {'nearest': 'near', 'bilinear': 'bilinear', 'bicubic': 'cubic'}[reamostragem],
+                               srcNodata = valor_nulo,
+                               dstNodata = valor_nulo,
+                               multithread = True,
+                               warpMemoryLimit = 512,
+                               warpOptions = ['NUM_THREADS=ALL_CPUS'],
+                               creationOptions = ['TILED=YES'],
+                               callback = progresso)
+            vrt = None
+            image = None # Close image
+            if Driver is None:
+                if feedback.isCanceled():
+                    return {}
+                raise QgsProcessingException(self.tr('GDAL Warp failed: {}', 'Falha no GDAL Warp: {}').format(gdal.GetLastErrorMsg()))
+            Driver.FlushCache()   # Escrever no disco
+            Driver = None   # Salvar e fechar
+
+        else:
+            # Calcular nova extensão e origem
+            trans_geom = transformGeom2D(geom, MT)
+            bbox = trans_geom.boundingBox()
+            y_min = bbox.yMinimum()
+            y_max = bbox.yMaximum()
+            x_min = bbox.xMinimum()
+            x_max = bbox.xMaximum()
+
+            # Definir n_col, n_lin e resolucao da nova imagem
+            n_lin = round((y_max-y_min)/abs(yres))
+            n_col = round((x_max-x_min)/abs(xres))
+            # Novas resoluções
+            xres = (x_max-x_min)/n_col
+            yres = -(y_max-y_min)/n_lin
+
+            feedback.pushInfo(self.tr('Size: ', 'Tamanho: ') + str(n_lin) +'x' + str(n_col))
+            # Geotransform do novo Raster
+            ulx = x_min
+            uly = y_max
+            xskew, yskew = 0, 0
+            geotransform = [ulx, xres, xskew, uly, yskew, yres]
+            origem = (ulx, uly)
+            resol_X = abs(xres)
+            resol_Y = abs(yres)
+
+            # Criar Raster
+            Driver = gdal.GetDriverByName('GTiff').Create(Output, n_col, n_lin, n_bands, GDT)
+            Driver.SetGeoTransform(geotransform)
+            Driver.SetProjection(prj)
+
             tipo = gdal_array.GDALTypeCodeToNumericTypeCode(GDT)
             inteiro = True if GDT in (gdal.GDT_Byte,
                                       gdal.GDT_UInt16,
                                       gdal.GDT_Int16,
                                       gdal.GDT_UInt32,
                                       gdal.GDT_Int32) else False
-            banda_nova = np.ones((n_lin,n_col), dtype = tipo) * (int(valor_nulo) if inteiro else valor_nulo)
-            # Varrendo e preenchendo nova imagem
-            for lin in range(n_lin):
-                for col in range(n_col):
-                    X = origem[0] + resol_X*(col + 0.5)
-                    Y = origem[1] - resol_Y*(lin + 0.5)
-                    X_antigo, Y_antigo = CoordInvTransf(QgsPointXY(X,Y))
-                    Interpolado = Interpolar(X_antigo, Y_antigo,
-                                            banda_antiga,
-                                            origem_antiga,
+            for k in range(n_bands):
+                Driver.GetRasterBand(k+1).SetNoDataValue(valor_nulo)
+
+            # Reamostragem por blocos de pixels da nova imagem
+            feedback.pushInfo(self.tr('Transforming raster by blocks...', 'Transformando raster por blocos...'))
+            tam_bloco = 512
+            margem = 2 # vizinhança da interpolação bicúbica
+            X_colunas = origem[0] + resol_X*(np.arange(n_col) + 0.5)
+            Y_linhas = origem[1] - resol_Y*(np.arange(n_lin) + 0.5)
+            blocos = [(lin, col) for lin in range(0, n_lin, tam_bloco) for col in range(0, n_col, tam_bloco)]
+            Percent = 100.0/len(blocos)
+            for current, (lin, col) in enumerate(blocos):
+                X, Y = np.meshgrid(X_colunas[col:col+tam_bloco], Y_linhas[lin:lin+tam_bloco])
+                X_antigo, Y_antigo = TransfMatriz(MT_inv, X, Y)
+                bloco = np.full((n_bands,) + X.shape, valor_nulo, dtype=float)
+                # Janela da imagem antiga que contém o bloco
+                I = (origem_antiga[1] - Y_antigo)/yres_antiga - 0.5
+                J = (X_antigo - origem_antiga[0])/xres_antiga - 0.5
+                i_min = max(int(floor(I.min())) - margem, 0)
+                i_max = min(int(ceil(I.max())) + margem + 1, rows)
+                j_min = max(int(floor(J.min())) - margem, 0)
+                j_max = min(int(ceil(J.max())) + margem + 1, cols)
+                if i_min < i_max and j_min < j_max:
+                    janela = image.ReadAsArray(j_min, i_min, j_max - j_min, i_max - i_min)
+                    if janela.ndim == 2:
+                        janela = janela[np.newaxis]
+                    origem_janela = (origem_antiga[0] + j_min*xres_antiga, origem_antiga[1] - i_min*yres_antiga)
+                    bloco = InterpolarArray(X_antigo, Y_antigo,
+                                            janela,
+                                            origem_janela,
                                             xres_antiga,
                                             yres_antiga,
                                             reamostragem,
                                             valor_nulo)
-                    if Interpolado != valor_nulo:
-                        banda_nova[lin][col] = round(Interpolado) if inteiro else Interpolado
-
+                if inteiro:
+                    bloco = np.round(bloco)
+                # Salvar bloco
+                for k in range(n_bands):
+                    Driver.GetRasterBand(k+1).WriteArray(bloco[k].astype(tipo), col, lin)
                 if feedback.isCanceled():
                     break
-                current += 1
-                feedback.setProgress(int(current * Percent))
-
-            # Salvar banda
-            outband = Driver.GetRasterBand(k+1)
-            feedback.pushInfo(self.tr('Writing Band {}...'.format(k+1), 'Escrevendo Banda {}...'.format(k+1)))
-            outband.WriteArray(banda_nova)
-            outband.SetNoDataValue(valor_nulo)
+                feedback.setProgress(int((current+1) * Percent))
 
-        # Fechar Raster
-        image = None # Close image
+            # Fechar Raster
+            image = None # Close image
 
-        Driver.FlushCache()   # Escrever no disco
-        Driver = None   # Salvar e fechar
+            Driver.FlushCache()   # Escrever no disco
+            Driver = None   # Salvar e fechar
 
         # Salvando pontos estimados e precisões
         feat = QgsFeature()
@@ -95,8 +95,10 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
     def icon(self):
         return QIcon(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'images/drone.png'))
 
-    txt_en = '''This tool performs the vertical adjustment of Digital Elevation Models (DEM) from Ground Control Points (GCP).'''
-    txt_pt = '''Esta ferramenta realiza o ajuste vertical de Modelos Digitais de Elevação (MDE) a partir de Pontos de Controle no Terreno (GCP).'''
+    txt_en = '''This tool performs the vertical adjustment of Digital Elevation Models (DEM) from Ground Control Points (GCP).
+The DEM is processed block by block and can optionally be adjusted in place, overwriting the input file.'''
+    txt_pt = '''Esta ferramenta realiza o ajuste vertical de Modelos Digitais de Elevação (MDE) a partir de Pontos de Controle no Terreno (GCP).
+O MDE é processado por blocos e pode, opcionalmente, ser ajustado no próprio arquivo de entrada, sobrescrevendo-o.'''
     figure = 'images/tutorial/drone_verticalAdjustment.jpg'
 
     def shortHelpString(self):
@@ -121,6 +123,7 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
     COORDS = 'COORDS'
     HTML = 'HTML'
     CHECKCRS = 'CHECKCRS'
+    INPLACE = 'INPLACE'
 
     def initAlgorithm(self, config=None):
         # INPUT
@@ -192,6 +195,14 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
             )
         )
 
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.INPLACE,
+                self.tr('Adjust the input DEM in place (overwrite)', 'Ajustar o MDE de entrada (sobrescrever)'),
+                defaultValue= False
+            )
+        )
+
         self.addParameter(
             QgsProcessingParameterBoolean(
                 self.OPEN,
@@ -276,6 +287,16 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
             context
         )
 
+        sobrescrever = self.parameterAsBool(
+            parameters,
+            self.INPLACE,
+            context
+        )
+        if sobrescrever:
+            Output = dem
+        # Nada a carregar ou atualizar se o processamento for cancelado
+        self.CARREGAR = self.SOBRESCREVER = False
+
         # Coordenas ajustadas de saida
         GeomType = QgsWkbTypes.Point
         Fields = pontos.fields()
@@ -309,7 +330,7 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         # Abrir arquivo Raster
         feedback.pushInfo(self.tr('Opening raster file...', 'Abrindo arquivo Raster...'))
 
-        image = gdal.Open(dem)
+        image = gdal.Open(dem, gdal.GA_Update if sobrescrever else gdal.GA_ReadOnly)
         #prj = image.GetProjection() # wkt
         SRC = QgsCoordinateReferenceSystem(image.GetProjection())
         geotransform = image.GetGeoTransform()
@@ -319,7 +340,7 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         n_bands = image.RasterCount
         if n_bands != 1:
             raise QgsProcessingException(self.tr('The DEM raster layer must have only one band!', 'A camada raster do MDE deve ter apenas uma banda!'))
-        banda = image.GetRasterBand(1).ReadAsArray()
+        banda = image.GetRasterBand(1)
         GDT = image.GetRasterBand(1).DataType
         valor_nulo = image.GetRasterBand(1).GetNoDataValue()
         if not valor_nulo:
@@ -327,8 +348,6 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         origem = (ulx, uly)
         xres = abs(xres)
         yres = abs(yres)
-        # Fechar Raster
-        image = None # Close image
 
         ## Validar dados de entrada
         # Verificar se o Raster e os Vetores tem o mesmo SRC
@@ -346,13 +365,22 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
             X = coord.x()
             Y = coord.y()
             Z = feat[Z_id]
-            Zf = Interpolar(X, Y,
-                            banda,
-                            origem,
-                            xres,
-                            yres,
-                            reamostragem,
-                            valor_nulo)
+            # Janela do MDE em torno do ponto
+            lin = int(floor((origem[1] - Y)/yres))
+            col = int(floor((X - origem[0])/xres))
+            lin_ini, lin_fim = max(lin - 2, 0), min(lin + 3, rows)
+            col_ini, col_fim = max(col - 2, 0), min(col + 3, cols)
+            if lin_ini < lin_fim and col_ini < col_fim:
+                janela = banda.ReadAsArray(col_ini, lin_ini, col_fim - col_ini, lin_fim - lin_ini)
+                Zf = Interpolar(X, Y,
+                                janela,
+                                (origem[0] + col_ini*xres, origem[1] - lin_ini*yres),
+                                xres,
+                                yres,
+                                reamostragem,
+                                valor_nulo)
+            else:
+                Zf = valor_nulo
             lista += [[(X,Y,Z),Zf]]
 
         # Ajustamento
@@ -360,42 +388,39 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         COTAS, PREC, DELTA, CoordTransf, texto = AjustVertical(lista, metodo)
 
         # Criar Raster
-        Driver = gdal.GetDriverByName('GTiff').Create(Output, cols, rows, n_bands, GDT)
-        Driver.SetGeoTransform(geotransform)
-        Driver.SetProjection(prj)
-        outband = Driver.GetRasterBand(1)
+        if sobrescrever:
+            outband = banda
+        else:
+            Driver = gdal.GetDriverByName('GTiff').Create(Output, cols, rows, n_bands, GDT)
+            Driver.SetGeoTransform(geotransform)
+            Driver.SetProjection(prj)
+            outband = Driver.GetRasterBand(1)
+            outband.SetNoDataValue(valor_nulo)
 
-        # Fazer correção do Raster
+        # Fazer correção do Raster por blocos de linhas
+        # Ao sobrescrever o MDE, o cancelamento só é aceito antes do primeiro bloco,
+        # para não deixar o MDE de entrada parcialmente corrigido
+        if feedback.isCanceled():
+            return {}
         feedback.pushInfo(self.tr("Adjusting the DEM...", 'Ajustando o MDE...'))
-        if metodo == 0:
-            k = CoordTransf(0,0)
-            banda_nova = (banda + k)*(banda != valor_nulo) + valor_nulo*(banda == valor_nulo)
-            # Salvar banda
-            feedback.pushInfo(self.tr('Writing Band {}...'.format(1), 'Escrevendo Banda {}...'.format(1)))
-            outband.WriteArray(banda_nova)
-            outband.SetNoDataValue(valor_nulo)
-        elif metodo == 1:
-            Percent = 100.0/rows
-            current = 0
-            banda_nova = banda
-            for lin in range(rows):
-                for col in range(cols):
-                    if banda[lin][col] != valor_nulo:
-                        X = origem[0] + xres*(col + 0.5)
-                        Y = origem[1] - yres*(lin + 0.5)
-                        dz = CoordTransf(X, Y)
-                        banda_nova[lin][col] = banda[lin][col] + dz
-                if feedback.isCanceled():
-                    break
-                current += 1
-                feedback.setProgress(int(current * Percent))
-            # Salvar banda
-            feedback.pushInfo(self.tr('Writing Band {}...'.format(1), 'Escrevendo Banda {}...'.format(1)))
-            outband.WriteArray(banda_nova)
-            outband.SetNoDataValue(valor_nulo)
+        X_colunas = origem[0] + xres*(np.arange(cols) + 0.5)
+        Y_linhas = origem[1] - yres*(np.arange(rows) + 0.5)
+        tam_bloco = max(1, 2**22//cols)
+        Percent = 100.0/rows
+        for lin in range(0, rows, tam_bloco):
+            n_lin = min(tam_bloco, rows - lin)
+            bloco = banda.ReadAsArray(0, lin, cols, n_lin)
+            dz = CoordTransf(X_colunas[np.newaxis, :], Y_linhas[lin:lin+n_lin, np.newaxis])
+            bloco_novo = np.where(bloco != valor_nulo, bloco + dz, valor_nulo)
+            outband.WriteArray(bloco_novo, 0, lin)
+            if not sobrescrever and feedback.isCanceled():
+                break
+            feedback.setProgress(int((lin + n_lin) * Percent))
 
-        del banda_nova, banda
-        Driver.FlushCache()   # Escrever no disco
+        outband.FlushCache()   # Escrever no disco
+        outband = None
+        banda = None
+        image = None # Fechar Raster
         Driver = None   # Salvar e fechar
 
         # Salvando pontos de controle com discrepancias e precisões
@@ -419,13 +444,20 @@ class VerticalAdjustment(QgsProcessingAlgorithm):
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer', 'Leandro França - Eng Cart'))
         self.CAMINHO = Output
         self.CARREGAR = Carregar
+        self.SOBRESCREVER = sobrescrever
         return {self.ADJUSTED: Output,
                 self.COORDS: dest_id,
                 self.HTML: html_output}
 
     # Carregamento de arquivo de saída
     def postProcessAlgorithm(self, context, feedback):
-        if self.CARREGAR:
+        if self.SOBRESCREVER:
+            # MDE sobrescrito: atualizar as camadas que já o exibem
+            for camada in QgsProject.instance().mapLayers().values():
+                if isinstance(camada, QgsRasterLayer) and camada.dataProvider().dataSourceUri() == self.CAMINHO:
+                    camada.dataProvider().reloadData()
+                    camada.triggerRepaint()
+        elif self.CARREGAR:
             rlayer = QgsRasterLayer(self.CAMINHO, self.tr('Adjusted Raster', 'Raster Ajustado'))
             QgsProject.instance().addMapLayer(rlayer)
         return {}
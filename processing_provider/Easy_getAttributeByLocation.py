@@ -188,33 +188,69 @@ Os campos de origem e de destino devem ser indicadas para preenchimento dos atri
         feedback.pushInfo(self.tr('Source field: {}'.format(campo_lote[0]), 'Campo de origem: {}'.format(campo_lote[0])))
         feedback.pushInfo(self.tr('Destination field: {}'.format(campo_edif[0]), 'Campo de destino: {}\n'.format(campo_edif[0])))
 
-        produto = edif.featureCount()*lotes.featureCount()
-        total = 100.0 /produto if produto else 0
-        cont = 0
+        # Camada dos centroides e camada indexada, conforme a topologia
         if topologia == 0:
-            for feat1 in edif.getFeatures():
-                centroide = feat1.geometry().centroid()
-                for feat2 in lotes.getFeatures():
-                    if centroide.intersects(feat2.geometry()):
-                        valor = feat2[att]
-                        edif.changeAttributeValue(feat1.id(), columnIndex, valor)
-                        break
-                    cont += 1
-                    if feedback.isCanceled():
-                        break
-                    feedback.setProgress(int(cont * total))
-        elif topologia == 1:
-            for feat1 in lotes.getFeatures():
-                centroide = feat1.geometry().centroid()
-                valor = feat1[att]
-                for feat2 in edif.getFeatures():
-                    if centroide.intersects(feat2.geometry()):
-                        edif.changeAttributeValue(feat2.id(), columnIndex, valor)
-                        break
-                    cont += 1
-                    if feedback.isCanceled():
+            camada_centroide, camada_indice = edif, lotes
+        else:
+            camada_centroide, camada_indice = lotes, edif
+
+        # Índice espacial criado uma única vez, mantendo a ordem de leitura das feições
+        feedback.pushInfo(self.tr('Creating spatial index...', 'Criando índice espacial...'))
+        indice = QgsSpatialIndex()
+        geometrias = {}
+        valores = {}
+        if topologia == 0:
+            request = QgsFeatureRequest().setSubsetOfAttributes([att], lotes.fields())
+        else:
+            request = QgsFeatureRequest().setNoAttributes()
+        for feat in camada_indice.getFeatures(request):
+            geom = feat.geometry()
+            if not geom.isEmpty():
+                geometrias[feat.id()] = geom
+                indice.addFeature(feat.id(), geom.boundingBox())
+                if topologia == 0:
+                    valores[feat.id()] = feat[att]
+            if feedback.isCanceled():
+                return {}
+        ordem = {fid: k for k, fid in enumerate(geometrias)}
+
+        # Geometrias preparadas somente para as feições candidatas
+        motores = {}
+        def intercepta(fid, centroide):
+            motor = motores.get(fid)
+            if motor is None:
+                motor = QgsGeometry.createGeometryEngine(geometrias[fid].constGet())
+                motor.prepareGeometry()
+                motores[fid] = motor
+            return motor.intersects(centroide.constGet())
+
+        if topologia == 0:
+            request = QgsFeatureRequest().setNoAttributes()
+        else:
+            request = QgsFeatureRequest().setSubsetOfAttributes([att], lotes.fields())
+        n = camada_centroide.featureCount()
+        total = 100.0 / n if n else 0
+        novos = {}
+        for cont, feat1 in enumerate(camada_centroide.getFeatures(request)):
+            centroide = feat1.geometry().centroid()
+            if not centroide.isEmpty():
+                # primeira feição, na ordem da camada, que intercepta o centróide
+                for fid in sorted(indice.intersects(centroide.boundingBox()), key=ordem.get):
+                    if intercepta(fid, centroide):
+                        if topologia == 0:
+                            novos[feat1.id()] = valores[fid]
+                        else:
+                            novos[fid] = feat1[att]
                         break
-                    feedback.setProgress(int(cont * total))
+            if feedback.isCanceled():
+                return {}
+            feedback.setProgress(int((cont+1) * total))
+
+        # Gravação de todas as alterações em um único comando de edição
+        edif.beginEditCommand(self.tr('Get attribute by location', 'Pegar atributo pela localização'))
+        for fid in novos:
+            edif.changeAttributeValue(fid, columnIndex, novos[fid])
+        edif.endEditCommand()
 
         salvar = self.parameterAsBool(
             parameters,
@@ -51,7 +51,7 @@ from osgeo import osr, gdal_array, gdal #https://gdal.org/python/
 from itertools import combinations
 from matplotlib import path
 import numpy as np
-from pyproj.crs import CRS
+from lftools.geocapt.cartography import ParametrosElipsoide
 from math import floor, ceil
 from lftools.geocapt.imgs import Imgs
 from lftools.geocapt.dip import Interpolar
@@ -380,11 +380,7 @@ class MosaicRaster(QgsProcessingAlgorithm):
         # Transformar resolucao de metros para graus, se o SRC for Geográfico
         src_qgis = QgsCoordinateReferenceSystem(prj)
         if src_qgis.isGeographic():
-            EPSG = int(src_qgis.authid().split(':')[-1])
-            proj_crs = CRS.from_epsg(EPSG)
-            a=proj_crs.ellipsoid.semi_major_metre
-            f=1/proj_crs.ellipsoid.inverse_flattening
-            e2 = f*(2-f)
+            a, b, f, e2 = ParametrosElipsoide(src_qgis)
             N = a/np.sqrt(1-e2*(np.sin((y_min+y_max)/2))**2) # Raio de curvatura 1º vertical
             M = a*(1-e2)/(1-e2*(np.sin((y_min+y_max)/2))**2)**(3/2.) # Raio de curvatura meridiana
             R = np.sqrt(M*N) # Raio médio de Gauss
@@ -19,9 +19,11 @@ from PyQt5.QtCore import *
 from qgis.core import *
 import processing
 from numpy import sin, cos, sqrt, matrix, radians, arctan, pi, floor
-from pyproj.crs import CRS
+import numpy as np
+from lftools.geocapt.cartography import ParametrosElipsoide
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.topogeo import geod2geoc, geoc2geod, geoc2enu, enu2geoc, dd2dms, dms2dd
+from lftools.geocapt.topogeo import (geod2geoc, geoc2geodArray, geoc2enuArray,
+                                     enu2geocArray, dd2dmsArray, dms2dd)
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -311,11 +313,8 @@ Saiba mais:'''
             raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
 
         # Parâmetros a e f do elipsoide
-        EPSG = int(GRS.authid().split(':')[-1]) # pegando o EPGS do SRC do QGIS
-        proj_crs = CRS.from_epsg(EPSG) # transformando para SRC do pyproj
-        a=proj_crs.ellipsoid.semi_major_metre
-        f_inv = proj_crs.ellipsoid.inverse_flattening
-        f=1/f_inv
+        a, b, f, e2 = ParametrosElipsoide(GRS)
+        f_inv = 1/f
         feedback.pushInfo((self.tr('Semi major axis: {}', 'Semi-eixo maior: {}')).format(str(a)))
         feedback.pushInfo((self.tr('Inverse flattening: {}', 'Achatamento (inverso): {}')).format(str(f_inv)))
 
@@ -325,54 +324,61 @@ Saiba mais:'''
         coord1_id = table.fields().indexFromName(coord1[0])
         coord2_id = table.fields().indexFromName(coord2[0])
         coord3_id = table.fields().indexFromName(coord3[0])
-
-        # Gerar output
-        total = 100.0 / table.featureCount() if table.featureCount() else 0
-        for current, feature in enumerate(table.getFeatures()):
-            att = feature.attributes()
-            coord1 = att[coord1_id]
-            coord2 = att[coord2_id]
-            coord3 = att[coord3_id]
+        field_ids = [table.fields().indexFromName(item) for item in field_list]
+
+        # Valores nulos são tratados como NaN
+        def numero(valor):
+            try:
+                return float(valor)
+            except (TypeError, ValueError):
+                return np.nan
+
+        # Conversão de um lote de feições
+        def converter(lote):
+            C1, C2, C3 = np.array([[numero(att[k]) for k in (coord1_id, coord2_id, coord3_id)] for att in lote], dtype=float).reshape(-1, 3).T
             if tipo == 0: #(lon,lat,h)
-                lon, lat, h = coord1, coord2, coord3
+                lon, lat, h = C1, C2, C3
                 X, Y, Z = geod2geoc(lon, lat, h, a, f)
-                E, N, U = geoc2enu(X, Y, Z, lon0, lat0, Xo, Yo, Zo)
+                E, N, U = geoc2enuArray(X, Y, Z, lon0, lat0, Xo, Yo, Zo)
             elif tipo == 1: #(X,Y,Z)
-                X, Y, Z = coord1, coord2, coord3
-                lon, lat, h = geoc2geod(X, Y, Z, a, f)
-                E, N, U = geoc2enu(X, Y, Z, lon0, lat0, Xo, Yo, Zo)
+                X, Y, Z = C1, C2, C3
+                lon, lat, h = geoc2geodArray(X, Y, Z, a, f)
+                E, N, U = geoc2enuArray(X, Y, Z, lon0, lat0, Xo, Yo, Zo)
             elif tipo == 2: #(E,N,U)
-                E, N, U = coord1, coord2, coord3
-                X, Y, Z = enu2geoc(E, N, U, lon0, lat0, Xo, Yo, Zo)
-                lon, lat, h = geoc2geod(X, Y, Z, a, f)
-
-            feat = QgsFeature(Fields)
-            itens  = {
-                         'lon' : float(lon),
-                         'lon_dms' : dd2dms(float(lon),5),
-                         'lat':  float(lat),
-                         'lat_dms':  dd2dms(float(lat),5),
-                         'h': float(h),
-                         'X':  float(X),
-                         'Y': float(Y),
-                         'Z': float(Z),
-                         'E': float(E),
-                         'N': float(N),
-                         'U': float(U)
-                         }
-
-            for item in itens:
-                feat[item] = itens[item]
-
-            for item in field_list: # atributos antigos
-                feat[item] = feature[item]
-
-            geom = QgsGeometry.fromPointXY(QgsPointXY(lon, lat))
-            feat.setGeometry(geom)
-            sink.addFeature(feat, QgsFeatureSink.FastInsert)
-            if feedback.isCanceled():
-                break
-            feedback.setProgress(int(current * total))
+                E, N, U = C1, C2, C3
+                X, Y, Z = enu2geocArray(E, N, U, lon0, lat0, Xo, Yo, Zo)
+                lon, lat, h = geoc2geodArray(X, Y, Z, a, f)
+            lon_dms = dd2dmsArray(lon, 5)
+            lat_dms = dd2dmsArray(lat, 5)
+            valores = np.stack([lon, lat, h, X, Y, Z, E, N, U]).T
+            validos = ~np.isnan(valores).any(axis=1)
+            valores = valores.astype(object)
+            valores[~validos] = None
+            feats = []
+            for k, att in enumerate(lote):
+                feat = QgsFeature(Fields)
+                lon_k, lat_k, h_k, X_k, Y_k, Z_k, E_k, N_k, U_k = valores[k]
+                feat.setAttributes([att[i] for i in field_ids] + [lon_k, lon_dms[k], lat_k, lat_dms[k], h_k, X_k, Y_k, Z_k, E_k, N_k, U_k])
+                if validos[k]:
+                    feat.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lon_k, lat_k)))
+                feats += [feat]
+            return feats
+
+        # Gerar output em lotes
+        tam_lote = 50000
+        total = 100.0 / table.featureCount() if table.featureCount() else 0
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+        lote = []
+        for current, feature in enumerate(table.getFeatures(request)):
+            lote += [feature.attributes()]
+            if len(lote) == tam_lote:
+                sink.addFeatures(converter(lote), QgsFeatureSink.FastInsert)
+                lote = []
+                if feedback.isCanceled():
+                    break
+                feedback.setProgress(int((current + 1) * total))
+        if lote and not feedback.isCanceled():
+            sink.addFeatures(converter(lote), QgsFeatureSink.FastInsert)
 
         feedback.pushInfo(self.tr('Operation completed successfully!', 'Operação finalizada com sucesso!'))
         feedback.pushInfo(self.tr('Leandro Franca - Cartographic Engineer','Leandro França - Eng Cart'))
@@ -190,13 +190,13 @@ Com esta ferramenta é possível realizar o correto georreferenciamento de arqui
 
         validacao = ValidacaoVetores(deslc, metodo)
 
-        COORD, PREC, CoordTransf, texto, CoordInvTransf = Ajust2D(deslc, metodo)
+        COORD, PREC, CoordTransf, texto, CoordInvTransf, MT, MT_inv = Ajust2D(deslc, metodo)
 
         feature = QgsFeature()
         total = 100.0 / entrada.featureCount() if entrada.featureCount() else 0
         for current, feat in enumerate(entrada.getFeatures()):
             geom = feat.geometry()
-            newgeom = transformGeom2D(geom, CoordTransf)
+            newgeom = transformGeom2D(geom, MT)
             feature.setGeometry(newgeom)
             feature.setAttributes(feat.attributes())
             sink.addFeature(feature, QgsFeatureSink.FastInsert)
@@ -31,7 +31,7 @@ from qgis.core import (QgsApplication,
                        QgsProcessingAlgorithm,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterFeatureSink)
-from math import atan2, degrees, fabs
+from math import atan2, degrees, fabs, floor
 from lftools.geocapt.imgs import Imgs
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -181,149 +181,17 @@ class DirectionalMerge(QgsProcessingAlgorithm):
         # Criar uma nova lista com as feicoes finais mescladas
         nova_lista = []
         # Remover os aneis lineares da lista e acrescentar na nova lista
-        ind = 0
-        while ind < len(lista)-1:
-            P_ini = lista[ind][1]
-            P_fim = lista[ind][2]
-            if P_ini==P_fim:
-                nova_lista+= [lista[ind][0]]
-                del  lista[ind]
+        abertas = []
+        for item in lista[:-1]:
+            if item[1] == item[2]:
+                nova_lista += [[item[0], item[5]]]
             else:
-                ind +=1
+                abertas += [item]
+        lista = abertas + lista[-1:]
 
-        # Mesclar linhas que se tocam e tem a mesma direcao (com mesmo atributo)
+        # Mesclar linhas que se tocam e tem a mesma direcao
         feedback.pushInfo(self.tr('Merging lines...', 'Mesclando linhas...'))
-        if atributos == 0:
-            while len(lista)>1:
-                tam = len(lista)
-                for i in range(0,tam-1):
-                    mergeou = False
-                    # Ponto inicial e final da feicao A
-                    coord_A = lista[i][0]
-                    P_ini_A = lista[i][1]
-                    P_fim_A = lista[i][2]
-                    ang_ini_A = lista[i][3]
-                    ang_fim_A = lista[i][4]
-                    att_A = lista[i][5]
-                    for j in range(i+1,tam):
-                        # Ponto inicial e final da feicao B
-                        coord_B = lista[j][0]
-                        P_ini_B = lista[j][1]
-                        P_fim_B = lista[j][2]
-                        ang_ini_B = lista[j][3]
-                        ang_fim_B = lista[j][4]
-                        att_B = lista[j][5]
-                        if att_A == att_B:
-                            # 4 possibilidades
-                            # 1 - Ponto final de A igual ao ponto inicial de B
-                            if (P_fim_A == P_ini_B) and (fabs(ang_fim_A-ang_ini_B)<tol or fabs(360-fabs(ang_fim_A-ang_ini_B))<tol):
-                                mergeou = True
-                                break
-                            # 2 - Ponto inicial de A igual ao ponto final de B
-                            elif (P_ini_A == P_fim_B) and (fabs(ang_ini_A-ang_fim_B)<tol or fabs(360-fabs(ang_ini_A-ang_fim_B))<tol):
-                                mergeou = True
-                                break
-                            # 3 - Ponto incial de A igual ao ponto inicial de B
-                            elif (P_ini_A == P_ini_B) and (fabs(ang_ini_A- self.contraAz(ang_ini_B))<tol or fabs(360-fabs(ang_ini_A - self.contraAz(ang_ini_B)))<tol):
-                                mergeou = True
-                                break
-                            # 4 - Ponto final de A igual ao ponto final de B
-                            elif (P_fim_A == P_fim_B) and (fabs(ang_fim_A - self.contraAz(ang_fim_B))<tol or fabs(360-fabs(ang_fim_A - self.contraAz(ang_fim_B)))<tol):
-                                mergeou = True
-                                break
-                    if mergeou:
-                        geom_A = QgsGeometry.fromPolylineXY(coord_A)
-                        geom_B = QgsGeometry.fromPolylineXY(coord_B)
-                        new_geom = geom_A.combine(geom_B)
-
-                        new_feat = QgsFeature()
-                        new_feat.setAttributes(att_A)
-                        new_feat.setGeometry(new_geom)
-
-                        if new_geom.isMultipart():
-                            nova_lista += [[coord_A, att_A], [coord_B, att_B]]
-                            del lista[i], lista[j-1]
-                            break
-                        else:
-                            del lista[i], lista[j-1]
-                            lista = self.pontos_ang(new_feat)+lista
-                            break
-                    if not(mergeou):
-                        # Tirar a geometria que nao se conecta com nada da lista
-                        nova_lista += [[coord_A, att_A]]
-                        del lista[i]
-                        break
-                if len(lista)==1:
-                    nova_lista += [[lista[0][0], lista[0][5]]]
-
-        # Mesclar os que se tocam e tem mesma direcao (preservar atributos da linha maior)
-        if atributos == 1:
-            while len(lista)>1:
-                tam = len(lista)
-                for i in range(0,tam-1):
-                    mergeou = False
-                    # Ponto inicial e final da feicao A
-                    coord_A = lista[i][0]
-                    P_ini_A = lista[i][1]
-                    P_fim_A = lista[i][2]
-                    ang_ini_A = lista[i][3]
-                    ang_fim_A = lista[i][4]
-                    att_A = lista[i][5]
-                    for j in range(i+1,tam):
-                        # Ponto inicial e final da feicao B
-                        coord_B = lista[j][0]
-                        P_ini_B = lista[j][1]
-                        P_fim_B = lista[j][2]
-                        ang_ini_B = lista[j][3]
-                        ang_fim_B = lista[j][4]
-                        att_B = lista[j][5]
-                        # 4 possibilidades
-                        # 1 - Ponto final de A igual ao ponto inicial de B
-                        if (P_fim_A == P_ini_B) and (fabs(ang_fim_A-ang_ini_B)<tol or fabs(360-fabs(ang_fim_A-ang_ini_B))<tol):
-                            mergeou = True
-                            break
-                        # 2 - Ponto inicial de A igual ao ponto final de B
-                        elif (P_ini_A == P_fim_B) and (fabs(ang_ini_A-ang_fim_B)<tol or fabs(360-fabs(ang_ini_A-ang_fim_B))<tol):
-                            mergeou = True
-                            break
-                        # 3 - Ponto incial de A igual ao ponto inicial de B
-                        elif (P_ini_A == P_ini_B) and (fabs(ang_ini_A - self.contraAz(ang_ini_B))<tol or fabs(360-fabs(ang_ini_A - self.contraAz(ang_ini_B)))<tol):
-                            mergeou = True
-                            break
-                        # 4 - Ponto final de A igual ao ponto final de B
-                        elif (P_fim_A == P_fim_B) and (fabs(ang_fim_A - self.contraAz(ang_fim_B))<tol or fabs(360-fabs(ang_fim_A - self.contraAz(ang_fim_B)))<tol):
-                            mergeou = True
-                            break
-                    if mergeou:
-                        geom_A = QgsGeometry.fromPolylineXY(coord_A)
-                        geom_B = QgsGeometry.fromPolylineXY(coord_B)
-                        new_geom = geom_A.combine(geom_B)
-
-                        length_A = geom_A.length()
-                        length_B = geom_B.length()
-                        if length_A > length_B:
-                            att = att_A
-                        else:
-                            att = att_B
-                        new_feat = QgsFeature()
-                        new_feat.setAttributes(att)
-                        new_feat.setGeometry(new_geom)
-
-                        if new_geom.isMultipart():
-                            nova_lista += [[coord_A, att_A], [coord_B, att_B]]
-                            del lista[i], lista[j-1]
-                            break
-                        else:
-                            del lista[i], lista[j-1]
-                            lista = self.pontos_ang(new_feat)+lista
-                            break
-                    if not(mergeou):
-                        # Tirar a geometria que nao se conecta com nada da lista
-                        nova_lista += [[coord_A, att_A]]
-                        del lista[i]
-                        break
-                if len(lista)==1:
-                    nova_lista += [[lista[0][0], lista[0][5]]]
+        nova_lista += self.mesclar(lista, atributos, tol, feedback)
 
         # Criando o shapefile de saida
         feedback.pushInfo(self.tr('Saving output...', 'Salvando saída...'))
@@ -377,6 +245,101 @@ class DirectionalMerge(QgsProcessingAlgorithm):
                     itens += [[item, item[0], item[-1], ang_ini, ang_fim, att]]
                 return itens
 
+    # Celula da grade de extremidades (tolerancia da comparacao entre QgsPointXY)
+    def celula(self, pnt):
+        return (floor(pnt.x()/1e-8), floor(pnt.y()/1e-8))
+
+    # Verificar se a feicao B continua a feicao A na mesma direcao
+    def conecta(self, A, B, tol, atributos):
+        if atributos == 0 and A[5] != B[5]:
+            return False
+        P_ini_A, P_fim_A, ang_ini_A, ang_fim_A = A[1:5]
+        P_ini_B, P_fim_B, ang_ini_B, ang_fim_B = B[1:5]
+        # 4 possibilidades
+        # 1 - Ponto final de A igual ao ponto inicial de B
+        if (P_fim_A == P_ini_B) and (fabs(ang_fim_A-ang_ini_B)<tol or fabs(360-fabs(ang_fim_A-ang_ini_B))<tol):
+            return True
+        # 2 - Ponto inicial de A igual ao ponto final de B
+        elif (P_ini_A == P_fim_B) and (fabs(ang_ini_A-ang_fim_B)<tol or fabs(360-fabs(ang_ini_A-ang_fim_B))<tol):
+            return True
+        # 3 - Ponto incial de A igual ao ponto inicial de B
+        elif (P_ini_A == P_ini_B) and (fabs(ang_ini_A - self.contraAz(ang_ini_B))<tol or fabs(360-fabs(ang_ini_A - self.contraAz(ang_ini_B)))<tol):
+            return True
+        # 4 - Ponto final de A igual ao ponto final de B
+        elif (P_fim_A == P_fim_B) and (fabs(ang_fim_A - self.contraAz(ang_fim_B))<tol or fabs(360-fabs(ang_fim_A - self.contraAz(ang_fim_B)))<tol):
+            return True
+        return False
+
+    # Mesclar as cadeias de linhas conectadas
+    # A feicao corrente absorve a primeira feicao da lista (na ordem original) que a continua,
+    # buscando as candidatas no indice das extremidades em vez de percorrer toda a lista
+    def mesclar(self, lista, atributos, tol, feedback):
+        saida = []
+        n = len(lista)
+        ativa = [True]*n
+        indice = {}
+        for k, item in enumerate(lista):
+            for P in (item[1], item[2]):
+                indice.setdefault(self.celula(P), []).append(k)
+
+        total = 100.0 / n if n else 0
+        restantes = n
+        proxima = 0
+        A = None
+        while True:
+            if A is None:
+                while proxima < n and not ativa[proxima]:
+                    proxima += 1
+                if proxima == n:
+                    break
+                A = lista[proxima]
+                ativa[proxima] = False
+                restantes -= 1
+            if restantes == 0:
+                saida += [[A[0], A[5]]]
+                break
+            # Feicoes com extremidades na vizinhanca das extremidades de A
+            candidatas = set()
+            for P in (A[1], A[2]):
+                x, y = self.celula(P)
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        for k in indice.get((x+dx, y+dy), ()):
+                            if ativa[k]:
+                                candidatas.add(k)
+            j = None
+            for k in sorted(candidatas):
+                if self.conecta(A, lista[k], tol, atributos):
+                    j = k
+                    break
+            if j is None:
+                # Tirar a geometria que nao se conecta com nada da lista
+                saida += [[A[0], A[5]]]
+                A = None
+            else:
+                B = lista[j]
+                ativa[j] = False
+                restantes -= 1
+                geom_A = QgsGeometry.fromPolylineXY(A[0])
+                geom_B = QgsGeometry.fromPolylineXY(B[0])
+                new_geom = geom_A.combine(geom_B)
+                if atributos == 1 and not geom_A.length() > geom_B.length():
+                    att = B[5]
+                else:
+                    att = A[5]
+                if new_geom.isMultipart():
+                    saida += [[A[0], A[5]], [B[0], B[5]]]
+                    A = None
+                else:
+                    new_feat = QgsFeature()
+                    new_feat.setAttributes(att)
+                    new_feat.setGeometry(new_geom)
+                    A = self.pontos_ang(new_feat)[0]
+            if feedback.isCanceled():
+                break
+            feedback.setProgress(int((n - restantes) * total))
+        return saida
+
     # Funcao para dar a direcao oposta
     def contraAz(self, x):
         if x<=0:
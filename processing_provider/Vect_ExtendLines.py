@@ -35,7 +35,7 @@ from qgis.core import (QgsApplication,
 from numpy import array
 import numpy as np
 from numpy.linalg import norm
-from pyproj.crs import CRS
+from lftools.geocapt.cartography import ParametrosElipsoide
 from lftools.geocapt.imgs import Imgs
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -187,11 +187,7 @@ class ExtendLines(QgsProcessingAlgorithm):
 
         # Transformar distancia para graus, se o SRC for Geográfico
         if SRC.isGeographic():
-            EPSG = int(SRC.authid().split(':')[-1])
-            proj_crs = CRS.from_epsg(EPSG)
-            a=proj_crs.ellipsoid.semi_major_metre
-            f=1/proj_crs.ellipsoid.inverse_flattening
-            e2 = f*(2-f)
+            a, b, f, e2 = ParametrosElipsoide(SRC)
             N = a/np.sqrt(1-e2*(np.sin((y_min+y_max)/2))**2) # Raio de curvatura 1º vertical
             M = a*(1-e2)/(1-e2*(np.sin((y_min+y_max)/2))**2)**(3/2.) # Raio de curvatura meridiana
             R = np.sqrt(M*N) # Raio médio de Gauss
@@ -21,7 +21,7 @@ from math import atan, pi, sqrt
 import math
 from numpy import floor
 from lftools.geocapt.imgs import Imgs
-from lftools.geocapt.topogeo import azimute, dd2dms
+from lftools.geocapt.topogeo import azimute, dd2dmsArray
 from lftools.geocapt.cartography import areaGauss
 import os
 from qgis.PyQt.QtGui import QIcon
@@ -167,14 +167,17 @@ class CalculatePolygonAngles(QgsProcessingAlgorithm):
                 else: # sentido anti-horário
                     pntsDic[k+1]['alfa_ext'] = alfa*180/pi
                     pntsDic[k+1]['alfa_int'] = 360 - alfa*180/pi
+            # Ângulos em GMS de todo o polígono de uma só vez
+            alfa_int_dms = dd2dmsArray([pntsDic[ponto]['alfa_int'] for ponto in pntsDic], 1)
+            alfa_ext_dms = dd2dmsArray([pntsDic[ponto]['alfa_ext'] for ponto in pntsDic], 1)
             # Carregando ângulos internos na camada
-            for ponto in pntsDic:
+            for k, ponto in enumerate(pntsDic):
                 fet.setGeometry(QgsGeometry.fromPointXY(pntsDic[ponto]['pnt']))
                 fet.setAttributes([ponto,
                                     float(pntsDic[ponto]['alfa_int']),
-                                    dd2dms(pntsDic[ponto]['alfa_int'],1),
+                                    alfa_int_dms[k],
                                     float(pntsDic[ponto]['alfa_ext']),
-                                    dd2dms(pntsDic[ponto]['alfa_ext'],1)
+                                    alfa_ext_dms[k]
                                         ])
                 sink.addFeature(fet, QgsFeatureSink.FastInsert)
 
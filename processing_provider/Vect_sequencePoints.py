@@ -24,11 +24,13 @@ from qgis.core import (QgsApplication,
                        QgsProcessingParameterEnum,
                        QgsProcessingParameterBoolean,
                        QgsFeatureSink,
+                       QgsFeatureRequest,
                        QgsProcessingException,
                        QgsProcessingAlgorithm,
                        QgsProcessingParameterFeatureSource,
                        QgsProcessingParameterFeatureSink)
 from lftools.geocapt.imgs import Imgs
+from math import sqrt, floor
 import os
 from qgis.PyQt.QtGui import QIcon
 
@@ -235,23 +237,57 @@ class SequencePoints(QgsProcessingAlgorithm):
             raise QgsProcessingException(self.tr('The number of points must equal the number of vertices of the polygon!', 'O número de pontos deve ser igual ao número de vértices do polígono!'))
 
 
-        pontos.startEditing() # coloca no modo edição
-        total = 100.0 / (len(coords))
-
-        def norma2(p1, p2):
-            return (p1.x() - p2.x())**2 + (p1.y() - p2.y())**2
+        # Leitura dos pontos uma única vez
+        ids, X, Y = [], [], []
+        for feat in pontos.getFeatures(QgsFeatureRequest().setNoAttributes()):
+            pnt = feat.geometry().asPoint()
+            ids += [feat.id()]
+            X += [pnt.x()]
+            Y += [pnt.y()]
+
+        # Grade regular com os índices dos pontos (em ordem de leitura) por célula
+        xmin, xmax, ymin, ymax = min(X), max(X), min(Y), max(Y)
+        lado = sqrt(max((xmax - xmin)*(ymax - ymin), (xmax - xmin)**2, (ymax - ymin)**2) / len(X)) or 1.0
+        grade = {}
+        for k in range(len(X)):
+            grade.setdefault((floor((X[k] - xmin)/lado), floor((Y[k] - ymin)/lado)), []).append(k)
+        ncol = floor((xmax - xmin)/lado)
+        nlin = floor((ymax - ymin)/lado)
+
+        def maisProximo(vertice):
+            # Busca em anéis de células até que nenhum ponto mais distante possa ser o mais próximo
+            x, y = vertice.x(), vertice.y()
+            i, j = floor((x - xmin)/lado), floor((y - ymin)/lado)
+            r_max = max(abs(i), abs(i - ncol), abs(j), abs(j - nlin))
+            melhor = None
+            for r in range(r_max + 1):
+                if melhor is not None and (r - 2)*lado > sqrt(melhor[0]):
+                    break
+                for di in range(-r, r + 1):
+                    passo = 1 if abs(di) == r else 2*r
+                    for dj in range(-r, r + 1, passo or 1):
+                        for k in grade.get((i + di, j + dj), ()):
+                            # mesmo critério da busca sequencial: menor distância, primeiro ponto no empate
+                            d = (x - X[k])**2 + (y - Y[k])**2
+                            if melhor is None or (d, k) < melhor:
+                                melhor = (d, k)
+            return ids[melhor[1]]
 
+        total = 100.0 / (len(coords))
+        sequencia = {}
         for cont, vertice in enumerate(coords):
-            dist1 = 1e9
-            pnt_id = None
-            for feat in pontos.getFeatures():
-                pnt = feat.geometry().asPoint()
-                if norma2(vertice, pnt) < dist1:
-                    dist1 = norma2(vertice, pnt)
-                    pnt_id = feat.id()
-            pontos.changeAttributeValue(pnt_id, columnIndex, cont+1)
+            sequencia[maisProximo(vertice)] = cont+1
+            if feedback.isCanceled():
+                return {}
             feedback.setProgress(int((cont+1) * total))
 
+        # Gravação de todas as alterações em um único comando de edição
+        pontos.startEditing() # coloca no modo edição
+        pontos.beginEditCommand(self.tr('Sequence points', 'Sequenciar pontos'))
+        for pnt_id in sequencia:
+            pontos.changeAttributeValue(pnt_id, columnIndex, sequencia[pnt_id])
+        pontos.endEditCommand()
+
         salvar = self.parameterAsBool(
             parameters,
             self.SAVE,
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of geocapt.cartography.reprojectPoints on a large polygon set.
+Compares the previous vertex by vertex reprojection with the current one,
+which transforms a copy of each geometry in a single call.
+
+Usage (QGIS Python console or a Python with qgis available):
+    python scripts/benchmark_reproject.py [n_polygons] [n_vertices]
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-19'
+__copyright__ = '(C) 2026, Leandro França'
+
+import os
+import sys
+import time
+from math import sin, cos, pi
+from qgis.core import (QgsApplication,
+                       QgsGeometry,
+                       QgsPointXY,
+                       QgsCoordinateTransform,
+                       QgsCoordinateReferenceSystem,
+                       QgsProject)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from lftools.geocapt.cartography import reprojectPoints
+
+
+# Implementação anterior (vértice a vértice), usada como referência
+def reprojectPointsLoop(geom, xform):
+    pol = geom.asPolygon()
+    newPol = []
+    for anel in pol:
+        newAnel = []
+        for pnt in anel:
+            newAnel += [xform.transform(pnt)]
+        newPol += [newAnel]
+    return QgsGeometry.fromPolygonXY(newPol)
+
+
+def main(n_pol=2000, n_vert=500):
+    xform = QgsCoordinateTransform(QgsCoordinateReferenceSystem('EPSG:31985'),
+                                   QgsCoordinateReferenceSystem('EPSG:4674'),
+                                   QgsProject.instance())
+    geoms = []
+    for k in range(n_pol):
+        x0, y0 = 280000 + 100*k, 9110000
+        anel = [QgsPointXY(x0 + 40*cos(2*pi*m/n_vert), y0 + 40*sin(2*pi*m/n_vert)) for m in range(n_vert)]
+        geoms += [QgsGeometry.fromPolygonXY([anel + [anel[0]]])]
+
+    inicio = time.perf_counter()
+    for geom in geoms:
+        reprojectPointsLoop(geom, xform)
+    t_loop = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for geom in geoms:
+        reprojectPoints(geom, xform)
+    t_bulk = time.perf_counter() - inicio
+
+    print('{} polygons x {} vertices'.format(n_pol, n_vert))
+    print('vertex by vertex: {:.3f} s'.format(t_loop))
+    print('bulk transform:   {:.3f} s ({:.1f}x)'.format(t_bulk, t_loop/t_bulk))
+
+
+if __name__ == '__main__':
+    qgs = QgsApplication([], False)
+    qgs.initQgis()
+    main(*[int(arg) for arg in sys.argv[1:3]])
+    qgs.exitQgis()
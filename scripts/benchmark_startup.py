@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the LF Tools plugin load time. Each case runs in a fresh
+Python process, so that modules cached by a previous case do not count:
+
+    eager: imports every processing_provider module and instantiates every
+           algorithm, as the provider did before the lazy registry;
+    lazy:  imports lftools_provider and registers the LazyAlgorithm entries.
+
+It also checks that the metadata in ALGORITMOS, and the parameter and
+output definitions served by LazyAlgorithm, match the real algorithms.
+
+Usage (Python with qgis available):
+    python scripts/benchmark_startup.py [repetitions]
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-19'
+__copyright__ = '(C) 2026, Leandro França'
+
+import os
+import sys
+import subprocess
+
+PASTA = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CASO = '''
+import sys, time
+sys.path.insert(0, {pasta!r})
+from qgis.core import QgsApplication
+qgs = QgsApplication([], False)
+qgs.initQgis()
+inicio = time.perf_counter()
+from importlib import import_module
+from lftools.lftools_provider import LFToolsProvider, ALGORITMOS
+if {eager}:
+    for registro in ALGORITMOS:
+        getattr(import_module('lftools.processing_provider.' + registro[0]), registro[1])()
+provider = LFToolsProvider()
+QgsApplication.processingRegistry().addProvider(provider)
+print(time.perf_counter() - inicio)
+'''
+
+VERIFICACAO = '''
+import sys
+sys.path.insert(0, {pasta!r})
+from qgis.core import QgsApplication
+qgs = QgsApplication([], False)
+qgs.initQgis()
+from lftools.lftools_provider import LazyAlgorithm, ALGORITMOS
+erros = 0
+for registro in ALGORITMOS:
+    lazy = LazyAlgorithm(*registro)
+    real = lazy.createInstance()
+    for metodo in ('name', 'displayName', 'group', 'groupId'):
+        if getattr(lazy, metodo)() != getattr(real, metodo)():
+            print('{{}}.{{}}: {{!r}} != {{!r}}'.format(registro[1], metodo, getattr(lazy, metodo)(), getattr(real, metodo)()))
+            erros += 1
+    real.initAlgorithm()
+    for metodo in ('parameterDefinitions', 'outputDefinitions'):
+        nomes_lazy = [item.name() for item in getattr(lazy, metodo)()]
+        nomes_real = [item.name() for item in getattr(real, metodo)()]
+        if nomes_lazy != nomes_real:
+            print('{{}}.{{}}: {{!r}} != {{!r}}'.format(registro[1], metodo, nomes_lazy, nomes_real))
+            erros += 1
+print('metadata mismatches:', erros)
+'''
+
+
+def executar(codigo):
+    saida = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+    return saida.stdout.strip()
+
+
+def main(n=5):
+    print(executar(VERIFICACAO.format(pasta=PASTA)))
+    for caso, eager in (('eager', True), ('lazy', False)):
+        tempos = sorted(float(executar(CASO.format(pasta=PASTA, eager=eager))) for k in range(n))
+        print('{}: median {:.3f} s, min {:.3f} s'.format(caso, tempos[len(tempos)//2], tempos[0]))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
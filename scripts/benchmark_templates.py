@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of geocapt.topogeo.Modelo on a large vertices and sides table.
+Compares the previous rendering, with str.replace chained over each row and
+string concatenation, with the compiled template joined in a single call,
+and checks that both produce the same HTML.
+
+Usage (QGIS Python console or a Python with qgis available):
+    python scripts/benchmark_templates.py [n_vertices]
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-19'
+__copyright__ = '(C) 2026, Leandro França'
+
+import os
+import sys
+import time
+from math import sin, cos, pi
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from lftools.geocapt.topogeo import Modelo, str2HTML, dd2dms
+
+linha = '''<tr>
+      <td>Vn</td>
+      <td>En</td>
+      <td>Nn</td>
+      <td>hn</td>
+      <td>Ln</td>
+      <td>Az_n</td>
+      <td>Dn</td>
+    </tr>
+    '''
+texto = '''<html><body><table style="font-size: [FONTSIZE]px;"><tbody>
+    <tr><td colspan="7">[TITULO]</td></tr>
+    [LINHAS]
+    </tbody></table></body></html>'''
+
+
+def linhas(n):
+    lista = []
+    for k in range(n):
+        lista += [{'Vn': 'P-{:05d}'.format(k+1),
+                   'En': '{:,.2f}'.format(280000 + 500*cos(2*pi*k/n)),
+                   'Nn': '{:,.2f}'.format(9110000 + 500*sin(2*pi*k/n)),
+                   'hn': '{:,.2f}'.format(30 + k % 7),
+                   'Ln': 'P-{:05d}/P-{:05d}'.format(k+1, (k+1) % n + 1),
+                   'Az_n': str2HTML(dd2dms(360.0*k/n, 1)),
+                   'Dn': '{:,.2f}'.format(2*pi*500/n)}]
+    return lista
+
+
+def main(n=20000):
+    lista = linhas(n)
+    titulo = str2HTML(' - Área Ñ')
+
+    inicio = time.perf_counter()
+    LINHAS = ''
+    for itens in lista:
+        linha0 = linha
+        for item in itens:
+            linha0 = linha0.replace(item, itens[item])
+        LINHAS += linha0
+    antigo = texto.replace('[LINHAS]', LINHAS).replace('[TITULO]', titulo).replace('[FONTSIZE]', '12')
+    t_replace = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    modelo_linha = Modelo(linha, ('Vn', 'En', 'Nn', 'hn', 'Ln', 'Az_n', 'Dn'))
+    novo = Modelo(texto).preencher({'[LINHAS]': modelo_linha.preencherLinhas(lista),
+                                    '[TITULO]': titulo,
+                                    '[FONTSIZE]': '12'})
+    t_modelo = time.perf_counter() - inicio
+
+    print('{} vertices, identical output: {}'.format(n, antigo == novo))
+    print('chained replace:   {:.3f} s'.format(t_replace))
+    print('compiled template: {:.3f} s ({:.1f}x)'.format(t_modelo, t_replace/t_modelo))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
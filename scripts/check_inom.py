@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checks geocapt.cartography.inomArray against map_sistem on a dense random
+sample of coordinates, for every scale from 1:1,000,000 to 1:1,000, and
+checks that inomExtent returns a sheet containing each point.
+
+Usage (QGIS Python console or a Python with qgis available):
+    python scripts/check_inom.py [n_points]
+"""
+__author__ = 'Leandro França'
+__date__ = '2026-10-19'
+__copyright__ = '(C) 2026, Leandro França'
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from lftools.geocapt.cartography import map_sistem, inomArray, inomExtentArray
+
+escalas = [1e6, 500e3, 250e3, 100e3, 50e3, 25e3, 10e3, 5e3, 2e3, 1e3]
+
+
+def main(n=100000):
+    rng = np.random.default_rng(2026)
+    lon = rng.uniform(-180, 180, n)
+    lat = rng.uniform(-80, 84, n)
+    erros = 0
+    for escala in escalas:
+        inicio = time.perf_counter()
+        inom = inomArray(lon, lat, escala)
+        t_array = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        ref = [map_sistem(x, y, escala) for x, y in zip(lon, lat)]
+        t_loop = time.perf_counter() - inicio
+        diferentes = int((inom != np.array(ref)).sum())
+        ext = inomExtentArray(inom)
+        fora = int((~((ext[:,0] <= lon) & (lon <= ext[:,2]) & (ext[:,1] <= lat) & (lat <= ext[:,3]))).sum())
+        erros += diferentes + fora
+        print('1:{:>9,.0f}  mismatches: {}  outside extent: {}  map_sistem: {:.3f} s  inomArray: {:.3f} s'.format(escala, diferentes, fora, t_loop, t_array))
+    return erros
+
+
+if __name__ == '__main__':
+    sys.exit(1 if main(*[int(arg) for arg in sys.argv[1:2]]) else 0)